@@ -0,0 +1,96 @@
+"""Construction time and memory benchmark for the domain entities.
+
+Builds many `Expense` and `MonetaryValues` instances, as a large report or import does,
+and reports the construction time, the memory held per instance and the `to_dict` time.
+Fails when the instances are no longer slotted.
+
+Usage:
+    python benchmarks/entities.py [--rows 200000]
+"""
+# built-in
+import argparse
+from datetime import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from koala.domain.entities.expense import Expense, ExpenseType
+from koala.infra.core.interfaces.pdf_parser import MonetaryValues
+
+def build_expenses(rows: int) -> List[Expense]:
+    """Builds installment expenses as the repository does when streaming a report."""
+    purchased_at = datetime(2023, 1, 1)
+    return [Expense(purchased_at=purchased_at,
+                    name='Padaria',
+                    type=ExpenseType.INSTALLMENT,
+                    amount=10.5,
+                    installment_of=1,
+                    installment_to=3,
+                    id=index)
+            for index in range(rows)]
+
+def build_monetary_values(rows: int) -> List[MonetaryValues]:
+    """Builds monetary values as the statement parsers do."""
+    purchased_at = datetime(2023, 1, 1)
+    return [MonetaryValues(purchased_at=purchased_at,
+                           name='Padaria',
+                           amount='10.50',
+                           installment_of='1',
+                           installment_to='3')
+            for _ in range(rows)]
+
+def measure(build: Callable[[int], list], rows: int) -> Tuple[float, float, list]:
+    """Measures the construction time and the memory held by a batch of instances.
+
+    Args:
+        build: A callable building the instances.
+        rows: The number of instances.
+
+    Returns:
+        A tuple with the construction time in seconds, the bytes held per instance and the
+        instances themselves.
+    """
+    gc.collect()
+    started = time.perf_counter()
+    build(rows)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    instances = build(rows)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, held / rows, instances
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000, help='Number of instances of each entity.')
+    args = parser.parse_args()
+
+    failures = []
+    for name, build in (('Expense', build_expenses), ('MonetaryValues', build_monetary_values)):
+        elapsed, per_instance, instances = measure(build, args.rows)
+        print(f'{name:<15} {args.rows / elapsed:>12,.0f} objects/s  {per_instance:>7.1f} bytes/object')
+        if hasattr(instances[0], '__dict__'):
+            failures.append(f'{name} instances have a __dict__')
+
+        if name == 'Expense':
+            started = time.perf_counter()
+            for instance in instances:
+                instance.to_dict()
+            elapsed = time.perf_counter() - started
+            print(f'{"Expense.to_dict":<15} {args.rows / elapsed:>12,.0f} objects/s')
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
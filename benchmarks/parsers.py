@@ -0,0 +1,388 @@
+"""Throughput and memory benchmark for the PDF statement parsers.
+
+Generates synthetic Nubank and C6 statements, as page texts and as PDFs, and measures
+each parser stage:
+
+- get_pages: PDF text extraction.
+- get_monetary_values: row matching over already extracted page texts.
+- iter_expenses: both stages, streaming a whole PDF.
+
+Each stage reports pages/s, rows/s and its peak traced memory. The results are compared
+against a stored baseline, and the run fails when a stage finds a different number of
+rows, gets slower or uses more memory than the baseline allows. Every stage is timed next
+to a fixed calibration workload, and the baseline rates are scaled by how much faster or
+slower the calibration ran, so a baseline survives small machine changes and noisy
+neighbours. Every stage keeps its best of --runs runs: a baseline is recorded from all of
+them, and a check only runs again the stages that regressed, so a single slow sample on a
+busy machine does not fail it. Record a new baseline with --update-baseline after a
+deliberate change.
+
+Pathologies:
+    clean:        only expense rows.
+    noisy:        rows interleaved with the headers, totals and notes real statements carry.
+    adversarial:  rows interleaved with long near-miss lines that start like a row but
+                  never complete one, which makes the row patterns backtrack.
+
+Usage:
+    python benchmarks/parsers.py [--pages 20] [--rows-per-page 40] [--pathology all]
+                                 [--repeat 5] [--runs 3] [--tolerance 0.3] [--update-baseline]
+"""
+# built-in
+import argparse
+import gc
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from koala.application.parsers.pdf.c6 import C6Parser
+from koala.application.parsers.pdf.engine import StatementParser
+from koala.application.parsers.pdf.nubank import NubankParser
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsers_baseline.json')
+
+PATHOLOGIES = ('clean', 'noisy', 'adversarial')
+
+MONTHS = ('JAN', 'FEV', 'MAR', 'ABR', 'MAI', 'JUN', 'JUL', 'AGO', 'SET', 'OUT', 'NOV', 'DEZ')
+
+MERCHANTS = ('PADARIA PAO QUENTE', 'MERCADO CENTRAL', 'POSTO SHELL', 'FARMACIA SAO JOAO',
+             'UBER *TRIP', 'IFOOD *RESTAURANTE', 'NETFLIX', 'SPOTIFY', 'AMAZON MARKETPLACE',
+             'LOJA DE ROUPAS', 'CINEMA SHOPPING', 'RESTAURANTE SABOR')
+
+NOISE = ('Valores em R$', 'Total a pagar R$ 1.234,56', 'Pagamento minimo R$ 123,45',
+         'Transacoes de 10/03 a 09/04', 'Limite disponivel: R$ 5.000,00',
+         'Em caso de duvidas, acesse o app.')
+
+def nubank_row(rng: random.Random, installments: bool) -> List[str]:
+    """Builds the lines of a Nubank expense row."""
+    name = rng.choice(MERCHANTS).title()
+    if installments:
+        to = rng.randint(2, 12)
+        name = f'{name} - {rng.randint(1, to)}/{to}'
+    return [f'{rng.randint(1, 28):02d} {rng.choice(MONTHS)}', ' ', name, f'{rng.randint(1, 999)},{rng.randint(0, 99):02d}']
+
+def c6_row(rng: random.Random, installments: bool) -> List[str]:
+    """Builds the line of a C6 expense row."""
+    name = rng.choice(MERCHANTS)
+    if installments:
+        to = rng.randint(2, 12)
+        name = f'{name} - Parcela {rng.randint(1, to)}/{to}'
+    return [f'{rng.randint(1, 28):02d} {rng.choice(MONTHS)} {name} {rng.randint(1, 999)},{rng.randint(0, 99):02d}']
+
+def near_miss(rng: random.Random, bank: str) -> List[str]:
+    """Builds lines that start like a row of the bank but never complete one."""
+    words = ' '.join(rng.choice(MERCHANTS) for _ in range(20))
+    date = f'{rng.randint(1, 28):02d} {rng.choice(MONTHS)}'
+    if bank == 'nubank':
+        return [date, ' ', words, 'R$ --']
+    return [f'{date} {words} R$ --']
+
+ROWS: Dict[str, Callable[[random.Random, bool], List[str]]] = {'nubank': nubank_row, 'c6': c6_row}
+
+PARSERS: Dict[str, Callable[[], StatementParser]] = {'nubank': NubankParser, 'c6': C6Parser}
+
+def generate_pages(bank: str,
+                   pathology: str,
+                   pages: int,
+                   rows_per_page: int,
+                   seed: int = 0) -> List[List[str]]:
+    """Generates the expense pages of a synthetic statement.
+
+    Args:
+        bank: The bank layout, nubank or c6.
+        pathology: The pathology of the pages, one of PATHOLOGIES.
+        pages: The number of expense pages.
+        rows_per_page: The number of expense rows per page.
+        seed: The random seed, so every run generates the same statement.
+
+    Returns:
+        A list of pages, each a list of text lines.
+    """
+    rng = random.Random(seed)
+    statement = []
+    for _ in range(pages):
+        lines: List[str] = []
+        for _ in range(rows_per_page):
+            lines.extend(ROWS[bank](rng, rng.random() < 0.3))
+            if pathology == 'noisy':
+                lines.extend(rng.choice(NOISE) for _ in range(rng.randint(1, 3)))
+            elif pathology == 'adversarial':
+                lines.extend(near_miss(rng, bank))
+        statement.append(lines)
+    return statement
+
+def make_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """Writes a minimal uncompressed PDF with one text line per given line.
+
+    Args:
+        pages: A sequence of pages, each a sequence of text lines.
+
+    Returns:
+        The PDF file content.
+    """
+    objects: List[bytes] = [b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>', b'']
+    kids = []
+    for lines in pages:
+        operations = [b'BT /F1 10 Tf 12 TL 50 780 Td']
+        for line in lines:
+            escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            operations.append(b'(' + escaped.encode('latin-1') + b') Tj T*')
+        operations.append(b'ET')
+        stream = b'\n'.join(operations)
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>' % (len(objects)))
+        kids.append(len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(b'%d 0 R' % kid for kid in kids), len(kids))
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+
+    content = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(content))
+        content += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(content)
+    content += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    content += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    content += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, len(objects), xref)
+    return content
+
+Counts = Tuple[int, Union[int, None]]
+
+CALIBRATION_TEXT = '\n'.join(' '.join(c6_row(random.Random(index), index % 3 == 0)) for index in range(2000))
+
+CALIBRATION_PATTERN = re.compile(r'(?P<date>\d{2} \w{3}) (?P<name>[\w\s\*]+?) (?P<amount>\d+,\d+)')
+
+def calibrate() -> None:
+    """Runs a fixed pure-Python and regex workload, as a yardstick of the machine speed."""
+    for _ in range(10):
+        rows = [match.groupdict() for match in CALIBRATION_PATTERN.finditer(CALIBRATION_TEXT)]
+        sorted(row['name'].lower() for row in rows)
+
+def measure(run: Callable[[], Counts], repeat: int, min_sample_s: float = 0.1) -> Tuple[float, float, float, Counts]:
+    """Measures a stage, keeping its fastest run.
+
+    As timeit does, fast stages are looped until a timed sample takes at least
+    `min_sample_s`, and the garbage collector is paused while timing. Every sample is paired
+    with a run of the calibration workload, so drifts in the machine speed during the
+    benchmark are captured next to the stage they affect. Memory is traced in a separate
+    run, since tracing slows the stage down.
+
+    Args:
+        run: A callable running the stage and returning the number of pages it went through
+            and the number of rows it found, None for stages that do not match rows.
+        repeat: The number of timed samples.
+        min_sample_s: The minimum duration of a timed sample, in seconds.
+
+    Returns:
+        A tuple with the fastest run time in seconds, the fastest calibration time in
+        seconds, the peak traced memory in KiB and the counts returned by the stage.
+    """
+    started = time.perf_counter()
+    counts = run()
+    number = max(1, int(min_sample_s / max(time.perf_counter() - started, 1e-9)))
+
+    elapsed = calibration = float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            calibrate()
+            calibration = min(calibration, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for _ in range(number):
+                run()
+            elapsed = min(elapsed, (time.perf_counter() - started) / number)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, calibration, peak / 1024, counts
+
+def benchmark(bank: str, pathology: str, pages: int, rows_per_page: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """Benchmarks every stage of a parser against a synthetic statement.
+
+    Args:
+        bank: The bank layout, nubank or c6.
+        pathology: The pathology of the statement, one of PATHOLOGIES.
+        pages: The number of expense pages.
+        rows_per_page: The number of expense rows per page.
+        repeat: The number of timed runs of each stage.
+
+    Returns:
+        A dictionary mapping "<bank>/<pathology>/<stage>" to the stage results.
+    """
+    parser = PARSERS[bank]()
+    statement = generate_pages(bank, pathology, pages, rows_per_page)
+    texts = ['\n'.join(lines) + '\n' for lines in statement]
+    cover = [[f'Resumo da fatura {bank}']] * parser.initial_costs_page
+    pdf = make_pdf(cover + statement)
+
+    stages: Dict[str, Callable[[], Counts]] = {
+        'get_pages': lambda: (len(parser.get_pages(pdf)), None),
+        'get_monetary_values': lambda: (len(texts), sum(len(parser.get_monetary_values(text)) for text in texts)),
+        'iter_expenses': lambda: (pages, sum(1 for _ in parser.iter_expenses(pdf))),
+    }
+
+    results = {}
+    for stage, run in stages.items():
+        elapsed, calibration, peak_kib, (stage_pages, rows) = measure(run, repeat)
+        results[f'{bank}/{pathology}/{stage}'] = {'pages': stage_pages,
+                                                  'rows': rows,
+                                                  'pages_per_s': round(stage_pages / elapsed, 1),
+                                                  'rows_per_s': round(rows / elapsed, 1) if rows is not None else None,
+                                                  'peak_kib': round(peak_kib, 1),
+                                                  'calibration_ms': round(calibration * 1000, 3)}
+    return results
+
+def merge(best: Dict[str, Dict[str, Any]], results: Dict[str, Dict[str, Any]]) -> None:
+    """Keeps the best run of every stage.
+
+    Runs are ranked by their throughput scaled by their calibration time, so a run is not
+    preferred just because the whole machine happened to be faster. The lowest peak memory
+    of all the runs is kept.
+
+    Args:
+        best: The best stage results so far, updated in place.
+        results: The stage results of another run.
+    """
+    for key, result in results.items():
+        previous = best.get(key)
+        if previous is None:
+            best[key] = result
+            continue
+        peak_kib = min(previous['peak_kib'], result['peak_kib'])
+        if result['pages_per_s'] * result['calibration_ms'] > previous['pages_per_s'] * previous['calibration_ms']:
+            best[key] = dict(result)
+        best[key]['peak_kib'] = peak_kib
+
+def compare(results: Dict[str, Dict[str, Any]],
+            baseline: Dict[str, Dict[str, Any]],
+            tolerance: float,
+            expected_pages: int,
+            expected_rows: int) -> List[str]:
+    """Lists the regressions of the results against a baseline.
+
+    Args:
+        results: The stage results of this run.
+        baseline: The stage results of the baseline.
+        tolerance: The allowed relative slowdown or memory growth.
+        expected_pages: The number of pages every stage must go through.
+        expected_rows: The number of rows every row matching stage must find.
+
+    Returns:
+        A list of failure messages, empty if nothing regressed.
+    """
+    failures = []
+    for key, result in results.items():
+        if result['pages'] != expected_pages:
+            failures.append(f'{key} went through {result["pages"]} pages instead of {expected_pages}')
+        if result['rows'] is not None and result['rows'] != expected_rows:
+            failures.append(f'{key} found {result["rows"]} rows instead of {expected_rows}')
+
+        reference = baseline.get(key)
+        if reference is None:
+            failures.append(f'{key} has no baseline')
+            continue
+        # How much faster the machine ran the calibration than when the baseline was recorded.
+        speed = reference['calibration_ms'] / result['calibration_ms']
+        for metric in ('pages_per_s', 'rows_per_s'):
+            if result[metric] is None or reference.get(metric) is None:
+                continue
+            expected = reference[metric] * speed
+            if result[metric] < expected * (1 - tolerance):
+                failures.append(f'{key} {metric} dropped from {expected:,.1f} to {result[metric]:,.1f}')
+        # Small absolute slack, so stages using a few KiB are not failed by allocator noise.
+        if result['peak_kib'] > reference['peak_kib'] * (1 + tolerance) + 64:
+            failures.append(f'{key} peak memory grew from {reference["peak_kib"]:,.1f} KiB to {result["peak_kib"]:,.1f} KiB')
+    return failures
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='Number of expense pages per statement.')
+    parser.add_argument('--rows-per-page', type=int, default=40, help='Number of expense rows per page.')
+    parser.add_argument('--pathology', choices=('all', *PATHOLOGIES), default='all', help='Statements to generate.')
+    parser.add_argument('--bank', choices=('all', *PARSERS), default='all', help='Parsers to benchmark.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timed samples, the fastest one is kept.')
+    parser.add_argument('--runs', type=int, default=3, help='Number of benchmark runs, the best one of every stage is kept.')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='Allowed relative slowdown or memory growth.')
+    parser.add_argument('--baseline', default=BASELINE, help='Baseline file to compare against.')
+    parser.add_argument('--update-baseline', action='store_true', help='Store the results as the new baseline.')
+    args = parser.parse_args()
+
+    banks = tuple(PARSERS) if args.bank == 'all' else (args.bank,)
+    pathologies = PATHOLOGIES if args.pathology == 'all' else (args.pathology,)
+    config = {'pages': args.pages, 'rows_per_page': args.rows_per_page}
+
+    def run(targets: Sequence[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        for bank, pathology in targets:
+            results.update(benchmark(bank, pathology, args.pages, args.rows_per_page, args.repeat))
+        return results
+
+    targets = [(bank, pathology) for bank in banks for pathology in pathologies]
+    results = run(targets)
+    baseline: Union[Dict[str, Any], None] = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    for _ in range(args.runs - 1):
+        if not args.update_baseline:
+            if baseline is None or baseline.get('config') != config:
+                break
+            # Only the stages that regressed are run again.
+            targets = list(dict.fromkeys(tuple(key.split('/')[:2]) for key, result in results.items()
+                                         if compare({key: result}, baseline['results'], args.tolerance,
+                                                    args.pages, args.pages * args.rows_per_page)))
+            if not targets:
+                break
+        merge(results, run(targets))
+
+    print(f'{"stage":<40} {"pages/s":>10} {"rows/s":>12} {"peak KiB":>10}')
+    for key, result in results.items():
+        rows_per_s = f'{result["rows_per_s"]:,.1f}' if result['rows_per_s'] is not None else '-'
+        print(f'{key:<40} {result["pages_per_s"]:>10,.1f} {rows_per_s:>12} {result["peak_kib"]:>10,.1f}')
+
+    if args.update_baseline:
+        stored: Dict[str, Any] = {'config': config, 'results': {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                previous = json.load(baseline_file)
+            if previous.get('config') == config:
+                stored['results'] = previous['results']
+        stored['results'].update(results)
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(stored, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f'Baseline written to {args.baseline}.')
+        return 0
+
+    failures = []
+    if baseline is None:
+        failures.append(f'{args.baseline} does not exist, record it with --update-baseline')
+    elif baseline.get('config') != config:
+        failures.append(f'the baseline was recorded with {baseline.get("config")}, not {config}')
+    else:
+        failures.extend(compare(results, baseline['results'], args.tolerance,
+                                args.pages, args.pages * args.rows_per_page))
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
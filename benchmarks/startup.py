@@ -0,0 +1,93 @@
+"""Startup time regression check for the CLI.
+
+Runs `python -X importtime main.py --help` and fails when the CLI imports any of the
+heavy dependencies that must only be loaded by the commands using them, or when its
+import time grows past a budget on top of importing Typer alone.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--max-overhead-ms 100]
+"""
+# built-in
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules that `--help` must never import.
+DEFERRED_MODULES = ('sqlalchemy', 'PyPDF2', 'PyInquirer')
+
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+def measure(arguments: List[str]) -> Tuple[int, Dict[str, int]]:
+    """Runs the interpreter with -X importtime and parses its report.
+
+    Args:
+        arguments: The arguments passed to the interpreter after -X importtime.
+
+    Returns:
+        A tuple with the total import time in microseconds and a dictionary mapping every
+        imported module to its cumulative import time in microseconds.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', *arguments],
+                             cwd=ROOT,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE,
+                             text=True,
+                             check=True)
+
+    total = 0
+    modules: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indentation, module = int(match.group(2)), match.group(3), match.group(4)
+        modules[module] = cumulative
+        if not indentation:
+            total += cumulative
+
+    return total, modules
+
+def best_of(runs: int, arguments: List[str]) -> Tuple[int, Dict[str, int]]:
+    """Measures a command many times, keeping the fastest run.
+
+    Args:
+        runs: The number of runs.
+        arguments: The arguments passed to the interpreter after -X importtime.
+
+    Returns:
+        The measure of the fastest run.
+    """
+    return min((measure(arguments) for _ in range(runs)), key=lambda result: result[0])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Number of runs, the fastest one is kept.')
+    parser.add_argument('--max-overhead-ms', type=float, default=100.0,
+                        help='Import time allowed on top of importing Typer alone.')
+    args = parser.parse_args()
+
+    baseline, _ = best_of(args.runs, ['-c', 'import typer'])
+    total, modules = best_of(args.runs, ['main.py', '--help'])
+    overhead_ms = (total - baseline) / 1000
+
+    print(f'typer alone:     {baseline / 1000:8.1f} ms')
+    print(f'main.py --help:  {total / 1000:8.1f} ms')
+    print(f'koala overhead:  {overhead_ms:8.1f} ms (budget {args.max_overhead_ms:.1f} ms)')
+
+    failures = [f'{module} is imported by --help ({modules[module] / 1000:.1f} ms)'
+                for module in DEFERRED_MODULES if module in modules]
+    if overhead_ms > args.max_overhead_ms:
+        failures.append(f'koala overhead of {overhead_ms:.1f} ms is over the {args.max_overhead_ms:.1f} ms budget')
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,15 @@
 from sys import version_info
-from koala.infra.entrypoints.cli.typer import create_cli
+from typing import Any
 
 
 if version_info.minor != 3 and version_info.minor < 8:
     raise Exception('You must run this application at least on Python 3.11')
 
+def __getattr__(name: str) -> Any:
+    """Imports `create_cli` on first access, so importing any koala module stays cheap."""
+    if name == 'create_cli':
+        from koala.infra.entrypoints.cli.typer import create_cli
+
+        return create_cli
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
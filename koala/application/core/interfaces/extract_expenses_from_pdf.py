@@ -1,20 +1,23 @@
 # built-in
+from abc import abstractmethod
 from dataclasses import dataclass
-from io import BufferedReader
-from typing import List
+from typing import Iterator, List, Union
 
 # interfaces
-from koala.application.core.interfaces.use_case import IUseCase
-from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues, StatementFingerprint, StatementSource
 
 @dataclass
 class ExtractExpensesFromPDFUseCaseRequestDTO:
     """Data class to represent the request for ExtractExpensesFromPDF use case.
 
     Attributes:
-        pdf_buffer: A buffered PDF file.
+        source: A statement file path, which is memory-mapped, a bytes-like buffer or an
+            open binary file.
+        count_pages: A boolean indicating whether the pages of the statement should be counted.
     """
-    pdf_buffer: BufferedReader
+    source: StatementSource
+    count_pages: bool = False
 
 @dataclass
 class ExtractExpensesFromPDFUseCaseResponseDTO:
@@ -22,8 +25,10 @@ class ExtractExpensesFromPDFUseCaseResponseDTO:
 
     Attributes:
         expenses: A list of MonetaryValues objects representing the extracted expenses.
+        page_count: The number of pages, when requested and the format has pages, or None.
     """
     expenses: List[MonetaryValues]
+    page_count: Union[int, None] = None
 
 class IExtractExpensesFromPDF(IUseCase[ExtractExpensesFromPDFUseCaseRequestDTO, 
                                        ExtractExpensesFromPDFUseCaseResponseDTO]):
@@ -41,4 +46,30 @@ class IExtractExpensesFromPDF(IUseCase[ExtractExpensesFromPDFUseCaseRequestDTO,
         Args:
             pdf_parser: An instance of a class that implements the IPDFParser interface.
         """
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    def stream(self, data: DTO[ExtractExpensesFromPDFUseCaseRequestDTO]) -> Iterator[MonetaryValues]:
+        """Abstract method to lazily extract expenses from a PDF, page by page.
+
+        A binary file source must stay open until the iterator is exhausted.
+
+        Args:
+            data: A DTO object containing the request data.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses.
+        """
+        ...
+
+    @abstractmethod
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Abstract method to check whether this extractor handles a statement.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if this extractor can handle the statement, False otherwise.
+        """
+        ...
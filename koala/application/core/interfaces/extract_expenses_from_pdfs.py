@@ -0,0 +1,75 @@
+# built-in
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
+
+# interfaces
+from koala.application.core.interfaces.extract_expenses_from_pdf import IExtractExpensesFromPDF
+from koala.application.core.interfaces.use_case import IUseCase
+from koala.infra.core.interfaces.pdf_parser import MonetaryValues
+
+@dataclass
+class ExtractExpensesFromPDFsUseCaseRequestDTO:
+    """Data class to represent the request for ExtractExpensesFromPDFs use case.
+
+    Attributes:
+        paths: A list of PDF file paths to be processed.
+        extractor: The single-file extractor to run against each PDF, or None to detect
+            the bank of each PDF among the candidates.
+        candidates: A dictionary mapping names to the extractors available for detection.
+    """
+    paths: List[str]
+    extractor: Union[IExtractExpensesFromPDF, None] = None
+    candidates: Dict[str, IExtractExpensesFromPDF] = field(default_factory=dict)
+
+@dataclass
+class ExtractedStatement:
+    """Data class to represent the outcome of processing a single PDF.
+
+    Attributes:
+        path: The PDF file path.
+        expenses: A list of MonetaryValues objects extracted from the PDF.
+        error: A string describing why the PDF could not be processed, or None on success.
+        detected: The name of the detected extractor, or None if no detection was needed.
+        page_count: The number of pages, when they were counted and the format has pages, or None.
+    """
+    path: str
+    expenses: List[MonetaryValues] = field(default_factory=list)
+    error: Union[str, None] = None
+    detected: Union[str, None] = None
+    page_count: Union[int, None] = None
+
+@dataclass
+class ExtractExpensesFromPDFsUseCaseResponseDTO:
+    """Data class to represent the response for ExtractExpensesFromPDFs use case.
+
+    Attributes:
+        statements: A list of ExtractedStatement objects, in the same order as the requested paths.
+    """
+    statements: List[ExtractedStatement]
+
+    @property
+    def expenses(self) -> List[MonetaryValues]:
+        """Merges the expenses of every successfully processed PDF, keeping the requested order.
+
+        Returns:
+            A list of MonetaryValues objects.
+        """
+        return [expense for statement in self.statements for expense in statement.expenses]
+
+    @property
+    def failures(self) -> List[ExtractedStatement]:
+        """Lists the PDFs that could not be processed.
+
+        Returns:
+            A list of ExtractedStatement objects with their error set.
+        """
+        return [statement for statement in self.statements if statement.error is not None]
+
+class IExtractExpensesFromPDFs(IUseCase[ExtractExpensesFromPDFsUseCaseRequestDTO, 
+                                        ExtractExpensesFromPDFsUseCaseResponseDTO]):
+    """Interface for the ExtractExpensesFromPDFs use case.
+
+    This class defines the interface for extracting expenses from many PDFs at once and
+    extends from the IUseCase interface.
+    """
+    ...
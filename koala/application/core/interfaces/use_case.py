@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TypeVar, Generic
+from typing import Any, TypeVar, Generic
+
+from koala.infra.core.utils.profiler import Profiler
 
 T = TypeVar('T')
 V = TypeVar('V')
@@ -22,11 +24,18 @@ class IUseCase(Generic[T, V], ABC):
     This class defines the interface for executing a use case and is
     generic over the input and output types.
 
+    Every concrete `execute` is timed as a "<class name>.execute" span while profiling is
+    enabled.
+
     Generic Types:
         T: The type of the input data.
         V: The type of the output data.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Profiler.trace_method(cls, 'execute')
+
     @abstractmethod
     def execute(self, data: DTO[T]) -> V:
         """Abstract method to execute the use case.
@@ -0,0 +1,23 @@
+# parsers
+from koala.application.parsers.csv.engine import CsvStatementParser, CsvStatementSpec
+
+C6_CSV = CsvStatementSpec(name='c6',
+                          date_column='Data de Compra',
+                          name_column='Descrição',
+                          amount_column='Valor (em R$)',
+                          installments_column='Parcela',
+                          date_format='%d/%m/%Y',
+                          delimiter=';',
+                          purchase_dated_installments=True)
+
+
+class C6CsvParser(CsvStatementParser):
+    """Parser for extracting monetary values from C6 Bank CSV exports.
+
+    The export is semicolon separated, with day-first dates and the installments in their
+    own `Parcela` column, which reads "Única" for single payments. Installment rows carry the
+    original purchase date, which is moved to the month of the installment.
+    """
+    def __init__(self) -> None:
+        """Initializes C6CsvParser."""
+        super().__init__(spec=C6_CSV)
@@ -0,0 +1,193 @@
+# built-in
+import codecs
+import csv
+from dataclasses import dataclass, field
+import logging
+import re
+from typing import BinaryIO, Iterator, Mapping, Pattern, Tuple, Union
+
+# parsers
+from koala.application.parsers.dates import PT_MONTHS, DateParser
+
+# services
+from koala.domain.services.installment_scheduler import InstallmentScheduler
+
+# interfaces
+from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues, StatementFingerprint, StatementSource
+from koala.infra.core.utils.mapped_file import MappedFile
+
+INSTALLMENT_SUFFIX = re.compile(r"\s*-\s*Parcela\s+(?P<of>\d+)\s*/\s*(?P<to>\d+)\s*$", re.I)
+
+@dataclass(frozen=True)
+class CsvStatementSpec:
+    """Data class to describe the layout of a CSV statement export.
+
+    Attributes:
+        name: A string identifying the bank.
+        date_column: The header of the purchase date column.
+        name_column: The header of the expense name column.
+        amount_column: The header of the amount column.
+        installments_column: An optional header of a column holding the "<of>/<to>" installments.
+        date_format: A string with the layout of the dates. Supports %d, %m, %b, %y and %Y.
+        delimiter: The field delimiter.
+        decimal_separator: The decimal separator of the amounts.
+        thousands_separator: The thousands separator of the amounts, if any.
+        encoding: The text encoding of the file.
+        installment_suffix: An optional compiled regex for banks that append the installments
+            to the expense name. It must define the groups `of` and `to`.
+        months: A mapping from month abbreviations to month numbers, used by %b.
+        purchase_dated_installments: Whether installment rows carry the date of the original
+            purchase rather than the date of their own installment. Their dates are then moved
+            forward by `installment_of - 1` months, so they match the installments projected
+            from earlier statements.
+    """
+    name: str
+    date_column: str
+    name_column: str
+    amount_column: str
+    installments_column: Union[str, None] = None
+    date_format: str = '%Y-%m-%d'
+    delimiter: str = ','
+    decimal_separator: str = '.'
+    thousands_separator: str = ''
+    encoding: str = 'utf-8-sig'
+    installment_suffix: Union[Pattern, None] = INSTALLMENT_SUFFIX
+    months: Mapping[str, int] = field(default_factory=lambda: PT_MONTHS)
+    purchase_dated_installments: bool = False
+
+    @property
+    def required_columns(self) -> Tuple[str, ...]:
+        """Property to get the headers a file must have to follow the spec.
+
+        Returns:
+            A tuple with the required column headers.
+        """
+        columns = (self.date_column, self.name_column, self.amount_column)
+        return columns + (self.installments_column,) if self.installments_column else columns
+
+class CsvStatementParser(IPDFParser):
+    """Table-driven parser for CSV statement exports described by a CsvStatementSpec.
+
+    The file is decoded and split one line at a time, so memory does not grow with the
+    statement, and no PDF decoding is involved. Payments and refunds, which the banks
+    export as non-positive amounts, are skipped.
+
+    Attributes:
+        spec: The CsvStatementSpec describing the file layout.
+    """
+    _INSTALLMENTS = re.compile(r"(?P<of>\d+)\s*/\s*(?P<to>\d+)")
+
+    def __init__(self, spec: CsvStatementSpec) -> None:
+        """Initializes CsvStatementParser with the given spec.
+
+        Args:
+            spec: The CsvStatementSpec describing the file layout.
+        """
+        self.spec = spec
+        self._date_parser = DateParser(date_format=spec.date_format, months=spec.months)
+        self._required_columns = {column.lower() for column in spec.required_columns}
+
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Checks whether the header of a statement has every column of the spec.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if the first line of the statement has the spec columns, False otherwise.
+        """
+        if fingerprint.head.startswith(b'%PDF'):
+            return False
+
+        header = fingerprint.head.split(b'\n', 1)[0]
+        try:
+            text = header.decode(self.spec.encoding)
+        except UnicodeDecodeError:
+            return False
+
+        columns = next(csv.reader([text], delimiter=self.spec.delimiter), [])
+        return self._required_columns.issubset(column.strip().lower() for column in columns)
+
+    def parse_amount(self, amount: str) -> float:
+        """Parses an amount written with the spec separators.
+
+        Args:
+            amount: A string with the amount.
+
+        Returns:
+            The amount as a float.
+
+        Raises:
+            ValueError: If the string is not a number.
+        """
+        amount = amount.strip()
+        if self.spec.thousands_separator:
+            amount = amount.replace(self.spec.thousands_separator, '')
+        return float(amount.replace(self.spec.decimal_separator, '.'))
+
+    def iter_expenses(self,
+                      source: StatementSource) -> Iterator[MonetaryValues]:
+        """Lazily extracts the expenses from the CSV file, row by row.
+
+        Args:
+            source: A CSV file path, bytes-like buffer or binary file.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses, in file order.
+
+        Raises:
+            Exception: If the file does not have the spec columns.
+        """
+        with MappedFile.open(source) as buffered_file:
+            yield from self._iter_rows(buffered_file)
+
+    def _iter_rows(self, buffered_file: BinaryIO) -> Iterator[MonetaryValues]:
+        """Parses the rows of an open CSV file, see `iter_expenses`."""
+        rows = csv.reader(codecs.iterdecode(buffered_file, self.spec.encoding), delimiter=self.spec.delimiter)
+        header = [column.strip().lower() for column in next(rows, [])]
+        if not self._required_columns.issubset(header):
+            raise Exception(f'The statement is not a {self.spec.name} CSV export.')
+
+        date_index = header.index(self.spec.date_column.lower())
+        name_index = header.index(self.spec.name_column.lower())
+        amount_index = header.index(self.spec.amount_column.lower())
+        installments_index = header.index(self.spec.installments_column.lower()) \
+            if self.spec.installments_column else None
+        installment_suffix = self.spec.installment_suffix
+        parse_date = self._date_parser.parse
+
+        for row in rows:
+            if not row:
+                continue
+
+            try:
+                amount = self.parse_amount(row[amount_index])
+                if amount <= 0:
+                    continue
+
+                name = row[name_index]
+                installment_of = None
+                installment_to = None
+
+                installments = self._INSTALLMENTS.search(row[installments_index]) \
+                    if installments_index is not None else None
+                if installments is not None:
+                    installment_of, installment_to = installments.group('of'), installments.group('to')
+                elif installment_suffix is not None:
+                    suffix = installment_suffix.search(name)
+                    if suffix is not None:
+                        installment_of, installment_to = suffix.group('of'), suffix.group('to')
+                        name = name[:suffix.start()]
+
+                purchased_at = parse_date(row[date_index])
+                if installment_of is not None and self.spec.purchase_dated_installments:
+                    purchased_at = InstallmentScheduler.add_months(purchased_at, int(installment_of) - 1)
+
+                yield MonetaryValues(purchased_at=purchased_at,
+                                     name=name.strip(),
+                                     amount=str(amount),
+                                     installment_of=installment_of,
+                                     installment_to=installment_to)
+            except Exception as err:
+                logging.warning(f'Could not process an item. {err}')
+                continue
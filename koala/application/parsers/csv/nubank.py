@@ -0,0 +1,19 @@
+# parsers
+from koala.application.parsers.csv.engine import CsvStatementParser, CsvStatementSpec
+
+NUBANK_CSV = CsvStatementSpec(name='nubank',
+                              date_column='date',
+                              name_column='title',
+                              amount_column='amount',
+                              date_format='%Y-%m-%d')
+
+
+class NubankCsvParser(CsvStatementParser):
+    """Parser for extracting monetary values from Nubank CSV exports.
+
+    The export has a `date,title,amount` header, ISO dates and the installments appended
+    to the title, as in "Loja - Parcela 2/5".
+    """
+    def __init__(self) -> None:
+        """Initializes NubankCsvParser."""
+        super().__init__(spec=NUBANK_CSV)
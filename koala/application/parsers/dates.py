@@ -0,0 +1,80 @@
+# built-in
+from datetime import datetime
+import re
+from typing import Dict, Mapping, Union
+
+PT_MONTHS: Mapping[str, int] = {'JAN': 1, 'FEV': 2, 'MAR': 3, 'ABR': 4, 'MAI': 5, 'JUN': 6,
+                                'JUL': 7, 'AGO': 8, 'SET': 9, 'OUT': 10, 'NOV': 11, 'DEZ': 12}
+
+class DateParser:
+    """Lookup-table based parser for the dates of a bank statement.
+
+    The date format is compiled into a regex once, month abbreviations are resolved through
+    a dictionary and every parsed string is memoized, so repeated dates cost a single lookup.
+
+    Attributes:
+        year: The year used when the date format has no year.
+    """
+    _DIRECTIVES = {'%d': r'(?P<day>\d{1,2})',
+                   '%m': r'(?P<month>\d{1,2})',
+                   '%b': r'(?P<month_name>\w{3})',
+                   '%y': r'(?P<short_year>\d{2})',
+                   '%Y': r'(?P<year>\d{4})'}
+
+    def __init__(self,
+                 date_format: str,
+                 months: Mapping[str, int],
+                 year: Union[int, None] = None) -> None:
+        """Initializes DateParser with the given format.
+
+        Args:
+            date_format: A string with the layout of the dates.
+            months: A mapping from month abbreviations to month numbers.
+            year: The year used when the format has no year. Defaults to the current year.
+        """
+        self.year = year if year is not None else datetime.now().year
+        self._months = {abbreviation.upper(): number for abbreviation, number in months.items()}
+        pattern = re.escape(date_format)
+        for directive, group in self._DIRECTIVES.items():
+            pattern = pattern.replace(re.escape(directive), group)
+        self._regex = re.compile(pattern + '$')
+        self._parsed: Dict[str, datetime] = {}
+
+    def parse(self, date_str: str) -> datetime:
+        """Parses a date string.
+
+        Args:
+            date_str: A string containing a date in the parser format.
+
+        Returns:
+            A datetime object.
+
+        Raises:
+            ValueError: If the string does not follow the format or has an unknown month.
+        """
+        parsed = self._parsed.get(date_str)
+        if parsed is not None:
+            return parsed
+
+        match = self._regex.match(date_str.strip().upper())
+        if match is None:
+            raise ValueError(f'Date "{date_str}" does not match the format.')
+
+        fields = match.groupdict()
+        if fields.get('month_name') is not None:
+            month = self._months.get(fields['month_name'])
+            if month is None:
+                raise ValueError(f'Unknown month "{fields["month_name"]}".')
+        else:
+            month = int(fields['month'])
+
+        if fields.get('year') is not None:
+            year = int(fields['year'])
+        elif fields.get('short_year') is not None:
+            year = 2000 + int(fields['short_year'])
+        else:
+            year = self.year
+
+        parsed = datetime(year, month, int(fields['day']))
+        self._parsed[date_str] = parsed
+        return parsed
@@ -0,0 +1,12 @@
+# parsers
+from koala.application.parsers.ofx.engine import OfxStatementParser, OfxStatementSpec
+
+C6_OFX = OfxStatementSpec(name='c6',
+                          fingerprints=('c6 bank', 'banco c6'))
+
+
+class C6OfxParser(OfxStatementParser):
+    """Parser for extracting monetary values from C6 Bank OFX exports."""
+    def __init__(self) -> None:
+        """Initializes C6OfxParser."""
+        super().__init__(spec=C6_OFX)
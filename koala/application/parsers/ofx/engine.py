@@ -0,0 +1,190 @@
+# built-in
+from dataclasses import dataclass
+from html import unescape
+import logging
+import re
+from typing import BinaryIO, Dict, Iterator, Pattern, Tuple, Union
+
+# parsers
+from koala.application.parsers.csv.engine import INSTALLMENT_SUFFIX
+from koala.application.parsers.dates import PT_MONTHS, DateParser
+
+# interfaces
+from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues, StatementFingerprint, StatementSource
+from koala.infra.core.utils.mapped_file import MappedFile
+
+@dataclass(frozen=True)
+class OfxStatementSpec:
+    """Data class to describe the OFX statement export of a bank.
+
+    Attributes:
+        name: A string identifying the bank.
+        fingerprints: Case-insensitive snippets that identify the bank in the first bytes of
+            the file, usually its `<ORG>` or `<FID>`, used for automatic detection.
+        name_tags: The transaction tags holding the expense name, by preference.
+        installment_suffix: An optional compiled regex for banks that append the installments
+            to the expense name. It must define the groups `of` and `to`.
+    """
+    name: str
+    fingerprints: Tuple[str, ...] = ()
+    name_tags: Tuple[str, ...] = ('MEMO', 'NAME')
+    installment_suffix: Union[Pattern, None] = INSTALLMENT_SUFFIX
+
+class OfxTagReader:
+    """Incremental reader for the SGML (OFX 1.x) and XML (OFX 2.x) tags of an OFX file.
+
+    The file is read in fixed-size chunks and only the transaction being assembled is kept,
+    so memory does not grow with the statement. SGML leaf elements have no closing tag,
+    so a leaf value is the text after its opening tag, whatever follows it.
+
+    Attributes:
+        chunk_size: The number of bytes read at a time.
+    """
+    _TAG = re.compile(rb'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+
+    def __init__(self, chunk_size: int = 64 * 1024) -> None:
+        """Initializes OfxTagReader.
+
+        Args:
+            chunk_size: The number of bytes read at a time. Defaults to 64 KiB.
+        """
+        self.chunk_size = chunk_size
+
+    def iter_tags(self, buffered_file: BinaryIO) -> Iterator[Tuple[bool, str, bytes]]:
+        """Lazily tokenizes the tags of an OFX file.
+
+        Args:
+            buffered_file: A buffered OFX file.
+
+        Yields:
+            Tuples with whether the tag is a closing one, its upper-cased name and the raw
+            text following it up to the next tag.
+        """
+        pending = b''
+        while True:
+            chunk = buffered_file.read(self.chunk_size)
+            data = pending + chunk
+            # Keep the last, possibly incomplete, tag for the next chunk.
+            end = data.rfind(b'<') if chunk else len(data)
+            for match in self._TAG.finditer(data, 0, max(end, 0)):
+                yield match.group(1) == b'/', match.group(2).decode('ascii').upper(), match.group(3)
+            if not chunk:
+                return
+            pending = data[end:] if end >= 0 else b''
+
+    def iter_transactions(self, buffered_file: BinaryIO) -> Iterator[Dict[str, bytes]]:
+        """Lazily reads the `<STMTTRN>` aggregates of an OFX file.
+
+        Args:
+            buffered_file: A buffered OFX file.
+
+        Yields:
+            Dictionaries mapping the leaf tags of each transaction to their raw values.
+        """
+        transaction: Union[Dict[str, bytes], None] = None
+        for closing, tag, text in self.iter_tags(buffered_file):
+            if tag == 'STMTTRN':
+                if closing and transaction is not None:
+                    yield transaction
+                transaction = None if closing else {}
+            elif transaction is not None and not closing:
+                transaction[tag] = text.strip()
+
+class OfxStatementParser(IPDFParser):
+    """Parser for OFX statement exports described by an OfxStatementSpec.
+
+    Card purchases are debits, exported with negative amounts, and become positive
+    expenses. Payments, refunds and other credits are skipped.
+
+    Attributes:
+        spec: The OfxStatementSpec describing the bank export.
+        reader: The OfxTagReader used to stream the file.
+    """
+    def __init__(self,
+                 spec: OfxStatementSpec,
+                 reader: Union[OfxTagReader, None] = None) -> None:
+        """Initializes OfxStatementParser with the given spec.
+
+        Args:
+            spec: The OfxStatementSpec describing the bank export.
+            reader: An optional OfxTagReader. Defaults to one reading 64 KiB at a time.
+        """
+        self.spec = spec
+        self.reader = reader if reader is not None else OfxTagReader()
+        self._date_parser = DateParser(date_format='%Y%m%d', months=PT_MONTHS)
+        self._fingerprint = re.compile('|'.join(re.escape(snippet) for snippet in spec.fingerprints), re.I) \
+            if spec.fingerprints else None
+
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Checks whether a statement is an OFX file carrying any of the spec fingerprints.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if the statement is an OFX file of the bank, False otherwise.
+        """
+        if self._fingerprint is None:
+            return False
+
+        head = fingerprint.head.decode('latin-1')
+        return ('OFXHEADER' in head or '<OFX>' in head.upper()) and self._fingerprint.search(head) is not None
+
+    @staticmethod
+    def decode(value: bytes) -> str:
+        """Decodes a tag value, which is UTF-8 in OFX 2.x and usually CP1252 in OFX 1.x.
+
+        Args:
+            value: The raw tag value.
+
+        Returns:
+            The decoded value, with character references resolved.
+        """
+        try:
+            text = value.decode('utf-8')
+        except UnicodeDecodeError:
+            text = value.decode('cp1252', errors='replace')
+        return unescape(text)
+
+    def iter_expenses(self,
+                      source: StatementSource) -> Iterator[MonetaryValues]:
+        """Lazily extracts the expenses from the OFX file, transaction by transaction.
+
+        Args:
+            source: An OFX file path, bytes-like buffer or binary file.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses, in file order.
+        """
+        with MappedFile.open(source) as buffered_file:
+            yield from self._iter_transactions(buffered_file)
+
+    def _iter_transactions(self, buffered_file: BinaryIO) -> Iterator[MonetaryValues]:
+        """Converts the transactions of an open OFX file, see `iter_expenses`."""
+        installment_suffix = self.spec.installment_suffix
+        parse_date = self._date_parser.parse
+
+        for transaction in self.reader.iter_transactions(buffered_file):
+            try:
+                amount = -float(transaction['TRNAMT'].replace(b',', b'.'))
+                if amount <= 0:
+                    continue
+
+                name = next((self.decode(transaction[tag]) for tag in self.spec.name_tags if transaction.get(tag)), '')
+                installment_of = None
+                installment_to = None
+
+                if installment_suffix is not None:
+                    suffix = installment_suffix.search(name)
+                    if suffix is not None:
+                        installment_of, installment_to = suffix.group('of'), suffix.group('to')
+                        name = name[:suffix.start()]
+
+                yield MonetaryValues(purchased_at=parse_date(transaction['DTPOSTED'][:8].decode('ascii')),
+                                     name=name.strip(),
+                                     amount=str(amount),
+                                     installment_of=installment_of,
+                                     installment_to=installment_to)
+            except Exception as err:
+                logging.warning(f'Could not process an item. {err}')
+                continue
@@ -0,0 +1,12 @@
+# parsers
+from koala.application.parsers.ofx.engine import OfxStatementParser, OfxStatementSpec
+
+NUBANK_OFX = OfxStatementSpec(name='nubank',
+                              fingerprints=('nu pagamentos', 'nubank'))
+
+
+class NubankOfxParser(OfxStatementParser):
+    """Parser for extracting monetary values from Nubank OFX exports."""
+    def __init__(self) -> None:
+        """Initializes NubankOfxParser."""
+        super().__init__(spec=NUBANK_OFX)
@@ -0,0 +1,81 @@
+# built-in
+import logging
+from typing import BinaryIO, Dict, TypeVar, Union
+
+# interfaces
+from koala.infra.core.interfaces.pdf_parser import StatementFingerprint
+from koala.infra.core.utils.profiler import Profiler
+
+T = TypeVar('T')
+
+
+class StatementDetector:
+    """Identifies the bank of a statement without decoding the whole document.
+
+    Only the first bytes, the document metadata and the first page are read, so
+    detecting a statement costs a fraction of extracting it.
+
+    Attributes:
+        head_size: The number of leading bytes kept in the fingerprint.
+    """
+    def __init__(self, head_size: int = 1024) -> None:
+        """Initializes StatementDetector.
+
+        Args:
+            head_size: The number of leading bytes kept in the fingerprint. Defaults to 1024.
+        """
+        self.head_size = head_size
+
+    def fingerprint(self, buffered_file: BinaryIO) -> StatementFingerprint:
+        """Reads the fingerprint of a statement.
+
+        The buffer is rewound to its original position afterwards, so it can still be
+        handed to a parser.
+
+        Args:
+            buffered_file: A seekable binary statement file.
+
+        Returns:
+            A StatementFingerprint of the statement.
+        """
+        position = buffered_file.tell()
+        head = buffered_file.read(self.head_size)
+        buffered_file.seek(position)
+
+        if not head.startswith(b'%PDF'):
+            return StatementFingerprint(head=head, first_page=head.decode('utf-8', errors='ignore'))
+
+        import PyPDF2
+
+        metadata: Dict[str, str] = {}
+        first_page = ''
+        try:
+            pdf = PyPDF2.PdfReader(buffered_file)
+            metadata = {str(key): str(value) for key, value in (pdf.metadata or {}).items()}
+            first_page = pdf.pages[0].extract_text() if len(pdf.pages) else ''
+        except Exception as err:
+            logging.warning(f'Could not read the statement fingerprint. {err}')
+        finally:
+            buffered_file.seek(position)
+
+        return StatementFingerprint(head=head, metadata=metadata, first_page=first_page)
+
+    def detect(self, 
+               buffered_file: BinaryIO, 
+               candidates: Dict[str, T]) -> Union[str, None]:
+        """Finds the candidate that handles a statement.
+
+        Args:
+            buffered_file: A seekable binary statement file.
+            candidates: A dictionary mapping names to objects exposing a `matches` method
+                that receives a StatementFingerprint.
+
+        Returns:
+            The name of the first matching candidate, or None if none of them matches.
+        """
+        with Profiler.span('detector.fingerprint'):
+            fingerprint = self.fingerprint(buffered_file)
+        for name, candidate in candidates.items():
+            if candidate.matches(fingerprint): # type: ignore
+                return name
+        return None
@@ -0,0 +1,339 @@
+# built-in
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import multiprocessing
+import os
+import re
+from typing import BinaryIO, Iterator, List, Mapping, Pattern, Tuple, Union
+
+# third-party
+import PyPDF2
+
+# parsers
+from koala.application.parsers.dates import PT_MONTHS, DateParser
+
+# interfaces
+from koala.infra.core.interfaces.page_text_cache import IPageTextCache
+from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues, StatementFingerprint, StatementSource
+from koala.infra.core.utils.digest import Digest
+from koala.infra.core.utils.mapped_file import MappedFile
+from koala.infra.core.utils.profiler import Profiler
+
+@dataclass(frozen=True)
+class BankStatementSpec:
+    """Data class to describe the layout of a bank statement.
+
+    The pattern must define the named groups `date`, `name` and `amount`, and may define
+    an `installments` group holding the "<of>/<to>" installment syntax.
+
+    Attributes:
+        name: A string identifying the bank.
+        pattern: A compiled regex matching a single expense row of a page.
+        initial_costs_page: An integer indicating the page number where the costs
+            information starts in the PDF.
+        date_format: A string with the layout of the row date. Supports %d, %m, %b, %y and %Y.
+        installment_suffix: An optional compiled regex for banks that append the installments
+            to the expense name. It must define the groups `of` and `to`.
+        months: A mapping from month abbreviations to month numbers, used by %b.
+        decimal_separator: The decimal separator of the amounts.
+        fingerprints: Case-insensitive snippets that identify the bank in the document
+            metadata or first page, used for automatic detection.
+    """
+    name: str
+    pattern: Pattern
+    initial_costs_page: int
+    date_format: str = '%d %b'
+    installment_suffix: Union[Pattern, None] = None
+    months: Mapping[str, int] = field(default_factory=lambda: PT_MONTHS)
+    decimal_separator: str = ','
+    fingerprints: Tuple[str, ...] = ()
+
+# Pages handed to each worker when the pages of a single PDF are extracted in parallel.
+DEFAULT_SHARD_SIZE = 16
+
+# Characters of page text held in memory to be cached once a PDF is extracted. Larger PDFs are not cached.
+DEFAULT_CACHE_LIMIT = 4 * 1024 * 1024
+
+def extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Extracts the text of a range of pages of a PDF.
+
+    This function runs inside the worker processes, so it must stay at module level. Each
+    worker maps the PDF on its own, so only the path and the page numbers are sent to it,
+    and the file content is shared through the OS page cache rather than read again.
+
+    Args:
+        path: The PDF file path.
+        start: The index of the first page of the range.
+        stop: The index after the last page of the range.
+
+    Returns:
+        A list of strings, each representing the text content of a page, in page order.
+    """
+    with MappedFile.open(path) as pdf:
+        return [page.extract_text() for page in PyPDF2.PdfReader(pdf).pages[start:stop]]
+
+class StatementParser(IPDFParser):
+    """Table-driven parser for bank statements described by a BankStatementSpec.
+
+    Adding a bank only requires a new spec. Everything the rows need is compiled once, so
+    each row costs a single regex match plus dictionary lookups.
+
+    Attributes:
+        spec: The BankStatementSpec describing the statement layout.
+        initial_costs_page: An integer indicating the page number where the costs
+            information starts in the PDF.
+        page_cache: An optional cache of extracted page text, keyed by the PDF content.
+        shard_size: The number of pages each worker extracts when a PDF is split across
+            worker processes.
+        max_workers: The maximum number of worker processes, or None to use the CPU count.
+        cache_limit: The number of characters of page text a PDF may have to be cached.
+    """
+    def __init__(self,
+                 spec: BankStatementSpec,
+                 initial_costs_page: Union[int, None] = None,
+                 page_cache: Union[IPageTextCache, None] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE,
+                 max_workers: Union[int, None] = None,
+                 cache_limit: int = DEFAULT_CACHE_LIMIT) -> None:
+        """Initializes StatementParser with the given spec.
+
+        Args:
+            spec: The BankStatementSpec describing the statement layout.
+            initial_costs_page: An optional integer overriding the spec initial costs page.
+            page_cache: An optional cache of extracted page text, keyed by the PDF content.
+            shard_size: The number of pages each worker extracts when a PDF is split across
+                worker processes. Defaults to 16.
+            max_workers: The maximum number of worker processes. Defaults to the CPU count.
+            cache_limit: The number of characters of page text a PDF may have to be cached.
+                Defaults to 4 Mi characters.
+
+        Raises:
+            Exception: If the shard size is not positive.
+        """
+        if shard_size < 1:
+            raise Exception('The shard size must be at least 1.')
+
+        self.spec = spec
+        self.initial_costs_page = initial_costs_page if initial_costs_page is not None else spec.initial_costs_page
+        self.page_cache = page_cache
+        self.shard_size = shard_size
+        self.max_workers = max_workers
+        self.cache_limit = cache_limit
+        self._date_parser = DateParser(date_format=spec.date_format, months=spec.months)
+        self._has_installments_group = 'installments' in spec.pattern.groupindex
+        self._fingerprint = re.compile('|'.join(re.escape(snippet) for snippet in spec.fingerprints), re.I) \
+            if spec.fingerprints else None
+
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Checks whether a statement carries any of the spec fingerprints.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if the statement is a PDF whose metadata or first page mention the bank,
+            False otherwise.
+        """
+        if self._fingerprint is None or not fingerprint.head.startswith(b'%PDF'):
+            return False
+
+        return any(self._fingerprint.search(text) 
+                   for text in (*fingerprint.metadata.values(), fingerprint.first_page))
+
+    def iter_pages(self, source: StatementSource) -> Iterator[str]:
+        """Lazily extracts text from the PDF pages starting from `initial_costs_page`.
+
+        Pages are decoded one at a time, or shard by shard when the PDF is large enough to
+        be split across worker processes, see `_extract_pages`. When a page cache is set, a
+        PDF with already known content is not decoded again, and the pages of a new one are
+        cached once the iteration is complete. The pages are held until then, so a PDF whose
+        text outgrows `cache_limit` is not cached, and its pages are released as they are yielded.
+
+        Args:
+            source: A PDF file path, which is memory-mapped, a bytes-like buffer or a binary file.
+
+        Yields:
+            Strings, each representing the text content of a PDF page.
+        """
+        with MappedFile.open(source) as buffered_pdf:
+            yield from self._iter_pages(buffered_pdf)
+
+    def _iter_pages(self, buffered_pdf: BinaryIO) -> Iterator[str]:
+        """Extracts text from the pages of an open PDF, see `iter_pages`."""
+        if self.page_cache is None:
+            yield from self._extract_pages(buffered_pdf)
+            return
+
+        with Profiler.span('pdf.page_cache'):
+            key = self.page_cache.make_key(content_hash=Digest.of_buffer(buffered_pdf),
+                                           parser=self.spec.name,
+                                           initial_costs_page=self.initial_costs_page)
+            cached_pages = self.page_cache.get(key)
+        if cached_pages is not None:
+            yield from cached_pages
+            return
+
+        pages: Union[List[str], None] = []
+        size = 0
+        for text in self._extract_pages(buffered_pdf):
+            if pages is not None:
+                size += len(text)
+                if size <= self.cache_limit:
+                    pages.append(text)
+                else:
+                    pages = None
+            yield text
+        if pages is None:
+            logging.info(f'Not caching the pages of a PDF with more than {self.cache_limit} characters of text.')
+            return
+        with Profiler.span('pdf.page_cache'):
+            self.page_cache.set(key, pages)
+
+    def _count_workers(self, buffered_pdf: BinaryIO, page_count: int) -> int:
+        """Tells how many worker processes should extract the pages of a PDF.
+
+        Pages are only split across workers from the main process, for a PDF that can be
+        reopened by path and spans more than one shard. Worker processes, such as the ones
+        extracting many PDFs at once, and profiled runs extract their pages serially.
+
+        Args:
+            buffered_pdf: A seekable binary PDF file.
+            page_count: The number of pages to be extracted.
+
+        Returns:
+            The number of worker processes, or 1 to extract the pages in this process.
+        """
+        path = getattr(buffered_pdf, 'name', None)
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return 1
+        if Profiler.enabled or multiprocessing.parent_process() is not None:
+            return 1
+
+        shards = -(-page_count // self.shard_size)
+        return max(1, min(self.max_workers or os.cpu_count() or 1, shards))
+
+    def _extract_pages(self, buffered_pdf: BinaryIO) -> Iterator[str]:
+        """Lazily extracts text from the PDF pages starting from `initial_costs_page`.
+
+        A PDF spanning many shards is split into page ranges of `shard_size` pages, which a
+        pool of worker processes extracts while the pages of the finished shards are yielded,
+        always in page order.
+
+        Args:
+            buffered_pdf: A seekable binary PDF file.
+
+        Yields:
+            Strings, each representing the text content of a PDF page.
+        """
+        with Profiler.span('pdf.open'):
+            pdf_pages = PyPDF2.PdfReader(buffered_pdf).pages
+            page_count = len(pdf_pages)
+
+        workers = self._count_workers(buffered_pdf, page_count - self.initial_costs_page)
+        if workers <= 1:
+            for page in pdf_pages[self.initial_costs_page:]:
+                with Profiler.span('pdf.extract_text'):
+                    text = page.extract_text()
+                yield text
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(extract_page_range, buffered_pdf.name, start, min(start + self.shard_size, page_count))
+                       for start in range(self.initial_costs_page, page_count, self.shard_size)]
+            try:
+                for future in futures:
+                    yield from future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def count_pages(self, source: StatementSource) -> int:
+        """Counts every page of the PDF, including the ones before `initial_costs_page`.
+
+        Only the document cross-reference table is read, no page is decoded. A binary file
+        is rewound to its original position afterwards.
+
+        Args:
+            source: A PDF file path, bytes-like buffer or binary file.
+
+        Returns:
+            The number of pages.
+        """
+        with MappedFile.open(source) as buffered_pdf:
+            position = buffered_pdf.tell()
+            try:
+                with Profiler.span('pdf.open'):
+                    return len(PyPDF2.PdfReader(buffered_pdf).pages)
+            finally:
+                buffered_pdf.seek(position)
+
+    def get_pages(self, source: StatementSource) -> List[str]:
+        """Extracts text from the PDF pages starting from `initial_costs_page`.
+
+        Args:
+            source: A PDF file path, bytes-like buffer or binary file.
+
+        Returns:
+            A list of strings, each representing the text content of a PDF page.
+        """
+        return list(self.iter_pages(source=source))
+
+    def get_monetary_values(self, page: str) -> List[MonetaryValues]:
+        """Extracts monetary values from a given PDF page.
+
+        Args:
+            page: A string containing the text content of a PDF page.
+
+        Returns:
+            A list of MonetaryValues objects representing the extracted monetary values.
+        """
+        with Profiler.span('parser.match_rows'):
+            return self._match_rows(page)
+
+    def _match_rows(self, page: str) -> List[MonetaryValues]:
+        """Matches the expense rows of a page, see `get_monetary_values`."""
+        installment_suffix = self.spec.installment_suffix
+        decimal_separator = self.spec.decimal_separator
+        parse_date = self._date_parser.parse
+
+        expenses = []
+
+        for match in self.spec.pattern.finditer(page):
+            try:
+                name = match.group('name')
+                installment_of = None
+                installment_to = None
+
+                installments = match.group('installments') if self._has_installments_group else None
+                if installments:
+                    installment_of, installment_to = installments.split('/')
+                elif installment_suffix is not None:
+                    suffix = installment_suffix.search(name)
+                    if suffix is not None:
+                        installment_of, installment_to = suffix.group('of'), suffix.group('to')
+                        name = name[:suffix.start()]
+
+                expenses.append(MonetaryValues(purchased_at=parse_date(match.group('date')),
+                                               name=name.strip(),
+                                               amount=match.group('amount').replace(decimal_separator, '.'),
+                                               installment_of=installment_of,
+                                               installment_to=installment_to))
+            except Exception as err:
+                logging.warning(f'Could not process an item. {err}')
+                continue
+
+        return expenses
+
+    def iter_expenses(self,
+                      source: StatementSource) -> Iterator[MonetaryValues]:
+        """Lazily extracts the expenses from the PDF, page by page.
+
+        Args:
+            source: A PDF file path, bytes-like buffer or binary file.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses, in page order.
+        """
+        for page in self.iter_pages(source=source):
+            yield from self.get_monetary_values(page)
@@ -1,108 +1,48 @@
 # built-in
-from datetime import datetime
-from io import BufferedReader
-import logging
 import re
-from typing import List
+from typing import Union
 
-# third-party
-import PyPDF2
+# parsers
+from koala.application.parsers.pdf.engine import DEFAULT_CACHE_LIMIT, DEFAULT_SHARD_SIZE, BankStatementSpec, StatementParser
 
 # interfaces
-from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues
+from koala.infra.core.interfaces.page_text_cache import IPageTextCache
 
+NUBANK = BankStatementSpec(name='nubank',
+                           pattern=re.compile(r"(?P<date>\d{2} \w{3})\s*\n\s*\n(?P<name>[^\n]+)(?:\s+-\s+(?P<installments>\d+/\d+))?\s*\n(?P<amount>[\d,]+)"),
+                           initial_costs_page=3,
+                           date_format='%d %b',
+                           installment_suffix=re.compile(r"\s*-\s*(?P<of>\d+)\s*/\s*(?P<to>\d+)\s*$"),
+                           fingerprints=('nubank', 'nu pagamentos'))
 
-class NubankParser(IPDFParser):
+
+class NubankParser(StatementParser):
     """Parser for extracting monetary values from Nubank PDFs.
 
     Attributes:
         initial_costs_page (int): The page number where the costs start in the PDF.
     """
     def __init__(self, 
-                 initial_costs_page: int = 3) -> None:
+                 initial_costs_page: int = NUBANK.initial_costs_page,
+                 page_cache: Union[IPageTextCache, None] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE,
+                 max_workers: Union[int, None] = None,
+                 cache_limit: int = DEFAULT_CACHE_LIMIT) -> None:
         """Initializes NubankParser with the given page number.
 
         Args:
             initial_costs_page: An integer indicating the page number where the costs
                 information starts in the PDF. Defaults to 3.
+            page_cache: An optional cache of extracted page text, keyed by the PDF content.
+            shard_size: The number of pages each worker extracts when the PDF is split across
+                worker processes. Defaults to 16.
+            max_workers: The maximum number of worker processes. Defaults to the CPU count.
+            cache_limit: The number of characters of page text the PDF may have to be cached.
+                Defaults to 4 Mi characters.
         """
-        self.initial_costs_page = initial_costs_page
-
-    def get_pages(self, buffered_pdf: BufferedReader) -> List[str]:
-        """Extracts text from the PDF pages starting from `initial_costs_page`.
-
-        Args:
-            buffered_pdf: A buffered PDF file.
-
-        Returns:
-            A list of strings, each representing the text content of a PDF page.
-        """
-        pdf = PyPDF2.PdfReader(buffered_pdf)
-        return [page.extract_text() for page in pdf.pages[self.initial_costs_page:]]
-    
-    def replace_month_pt_to_en(self, date_str):
-        """Replaces Portuguese month abbreviations with English ones in a date string.
-
-        Args:
-            date_str: A string containing a date with Portuguese month abbreviations.
-
-        Returns:
-            A string containing the date with English month abbreviations.
-        """
-        pt_months = ('JAN', 'FEV', 'MAR', 'ABR', 'MAI', 'JUN', 'JUL', 'AGO', 'SET', 'OUT', 'NOV', 'DEZ')
-        en_months = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
-        for pt, en in zip(pt_months, en_months):
-            date_str = date_str.replace(pt, en)
-        return date_str
-    
-    def get_monetary_values(self, page: str) -> List[MonetaryValues]:
-        """Extracts monetary values from a given PDF page.
-
-        Args:
-            page: A string containing the text content of a PDF page.
-
-        Returns:
-            A list of MonetaryValues objects representing the extracted monetary values.
-        """
-        pattern = r"(\d{2} \w{3})\s*\n\s*\n([^\n]+)(?:\s+-\s+(\d+/\d+))?\s*\n([\d,]+)"
-        matches = re.findall(pattern, page)
-
-        expenses = []
-
-        for date, name, _, value in matches:
-            try:
-                splitted_name = name.split('-')
-                installment_of = splitted_name[-1].split('/')[0].strip() if len(splitted_name) > 1 else None
-                installment_to = splitted_name[-1].split('/')[1].strip() if len(splitted_name) > 1 else None
-
-                name = "-".join(splitted_name[:-1]).strip() if len(splitted_name) > 1 else splitted_name[0].strip()
-                date = self.replace_month_pt_to_en(f"{date} {datetime.now().year}")
-                expenses.append(MonetaryValues(purchased_at=datetime.strptime(date, "%d %b %Y"),
-                                               name=name,
-                                               amount=str(value.replace(',', '.')),
-                                               installment_of=installment_of,
-                                               installment_to=installment_to))
-            except Exception as err:
-                logging.warn(f'Could not process an item. {err}')
-                continue
-
-        return expenses
-            
-
-    def extract_expenses(self, 
-                         buffered_pdf: BufferedReader) -> List[MonetaryValues]:
-        """Extracts all expenses from the PDF.
-
-        Args:
-            buffered_pdf: A buffered PDF file.
-
-        Returns:
-            A list of MonetaryValues objects representing all extracted expenses.
-        """
-        pages = self.get_pages(buffered_pdf=buffered_pdf)
-        
-        expenses = []
-        for page in pages:
-            expenses.extend(self.get_monetary_values(page))
-
-        return expenses
+        super().__init__(spec=NUBANK,
+                         initial_costs_page=initial_costs_page,
+                         page_cache=page_cache,
+                         shard_size=shard_size,
+                         max_workers=max_workers,
+                         cache_limit=cache_limit)
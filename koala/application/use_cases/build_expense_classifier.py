@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from typing import List
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.domain.services.expense_classifier import ClassificationRule, ExpenseClassifier
+from koala.infra.core.interfaces.expense_repository import IExpensesRepository
+
+@dataclass
+class BuildExpenseClassifierUseCaseRequestDTO:
+    """Data class to represent the request for BuildExpenseClassifierUseCase.
+
+    Attributes:
+        rules: A list of ClassificationRule objects, in priority order.
+        learn_from_history: Whether the merchants already classified in the stored
+            expenses should be used as a fallback.
+    """
+    rules: List[ClassificationRule] = field(default_factory=list)
+    learn_from_history: bool = True
+
+@dataclass
+class BuildExpenseClassifierUseCaseResponseDTO:
+    """Data class to represent the response for BuildExpenseClassifierUseCase.
+
+    Attributes:
+        classifier: The compiled ExpenseClassifier.
+    """
+    classifier: ExpenseClassifier
+
+class BuildExpenseClassifierUseCase(IUseCase):
+    """Implements the BuildExpenseClassifierUseCase interface.
+
+    This class is responsible for compiling a user rule set, together with the merchants
+    already classified, into an ExpenseClassifier.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self,
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes BuildExpenseClassifierUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+
+    def execute(self, data: DTO[BuildExpenseClassifierUseCaseRequestDTO]) -> BuildExpenseClassifierUseCaseResponseDTO:
+        """Executes the use case to build an expense classifier.
+
+        Args:
+            data: A DTO object containing the BuildExpenseClassifierUseCaseRequestDTO.
+
+        Returns:
+            A BuildExpenseClassifierUseCaseResponseDTO object representing the response.
+        """
+        known_merchants = self._expenses_repository.find_merchant_types() \
+            if data.data.learn_from_history else None
+
+        return BuildExpenseClassifierUseCaseResponseDTO(classifier=ExpenseClassifier(rules=data.data.rules,
+                                                                                     known_merchants=known_merchants))
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Union
+from typing import List, Union
 from koala.application.core.interfaces.use_case import DTO, IUseCase
 from koala.domain.entities.expense import Expense, ExpenseType
+from koala.domain.entities.statement import Statement
+from koala.domain.services.installment_scheduler import InstallmentScheduler
 from koala.infra.core.interfaces.expense_repository import IExpensesRepository
+from koala.infra.core.utils.profiler import Profiler
 
 @dataclass
 class CreateExpenseUseCaseRequestDTO:
@@ -16,6 +19,7 @@ class CreateExpenseUseCaseRequestDTO:
         amount: A float representing the amount spent.
         installment_of: An optional integer representing the current installment number.
         installment_to: An optional integer representing the total number of installments.
+        source_statement: An optional string identifying the statement the expense was imported from.
     """
     name: str
     purchased_at: str
@@ -23,6 +27,7 @@ class CreateExpenseUseCaseRequestDTO:
     amount: float
     installment_of: Union[None, int] = None
     installment_to: Union[None, int] = None
+    source_statement: Union[None, str] = None
 
 @dataclass
 class CreateExpenseUseCaseResponseDTO:
@@ -35,6 +40,72 @@ class CreateExpenseUseCaseResponseDTO:
     id: Union[str, int]
     created: bool
 
+@dataclass
+class ImportedStatementDTO:
+    """Data class to represent the statement file a batch of expenses was extracted from.
+
+    Attributes:
+        hash: A string representing the SHA-256 hex digest of the file content.
+        bank: A string representing the name of the extractor that imported the statement.
+        page_count: An optional integer representing the number of pages of the statement.
+    """
+    hash: str
+    bank: str
+    page_count: Union[int, None] = None
+
+@dataclass
+class CreateExpensesUseCaseRequestDTO:
+    """Data class to represent the request for CreateExpensesUseCase.
+
+    Attributes:
+        expenses: A list of CreateExpenseUseCaseRequestDTO objects to be created at once.
+        project_installments: A boolean indicating whether the remaining installments of each
+            installment expense should be created too.
+        statement: An optional ImportedStatementDTO to be recorded in the same transaction,
+            so the statement file is skipped by later imports.
+    """
+    expenses: List[CreateExpenseUseCaseRequestDTO]
+    project_installments: bool = False
+    statement: Union[ImportedStatementDTO, None] = None
+
+@dataclass
+class CreateExpensesUseCaseResponseDTO:
+    """Data class to represent the response for CreateExpensesUseCase.
+
+    Attributes:
+        ids: A list with the IDs of the inserted expenses, in the requested order.
+        created: A boolean indicating whether the expenses were successfully created.
+        inserted: The number of expenses that were written.
+        skipped: The number of expenses that were already stored and therefore ignored.
+        statement_id: The ID of the recorded statement, or None if no statement was given.
+    """
+    ids: List[Union[str, int]]
+    created: bool
+    inserted: int = 0
+    skipped: int = 0
+    statement_id: Union[int, None] = None
+
+def build_expense(expense_data: CreateExpenseUseCaseRequestDTO) -> Expense:
+    """Builds an Expense entity from a CreateExpenseUseCaseRequestDTO.
+
+    Args:
+        expense_data: The request data of a single expense.
+
+    Returns:
+        An Expense entity that was not persisted yet.
+    """
+    date = datetime.strptime(expense_data.purchased_at, '%Y-%m-%d') \
+        if isinstance(expense_data.purchased_at, str) \
+        else expense_data.purchased_at
+
+    return Expense(purchased_at=date,
+                   amount=expense_data.amount,
+                   name=expense_data.name,
+                   type=expense_data.type,
+                   installment_of=expense_data.installment_of,
+                   installment_to=expense_data.installment_to,
+                   source_statement=expense_data.source_statement)
+
 class CreateExpenseUseCase(IUseCase):
     """Implements the CreateExpenseUseCase interface.
 
@@ -63,20 +134,66 @@ class CreateExpenseUseCase(IUseCase):
             A CreateExpenseUseCaseResponseDTO object representing the response.
         """
         expense_data: CreateExpenseUseCaseRequestDTO = data.data # type: ignore
-        date = datetime.strptime(expense_data.purchased_at, '%Y-%m-%d') \
-            if isinstance(expense_data.purchased_at, str) \
-            else expense_data.purchased_at
-
-        expense = Expense(purchased_at=date,
-                          amount=expense_data.amount,
-                          name=expense_data.name,
-                          type=expense_data.type,
-                          installment_of=expense_data.installment_of,
-                          installment_to=expense_data.installment_to)
+        expense = build_expense(expense_data)
         
         expense = self._expenses_repository.create_expense(expense=expense)
 
         return CreateExpenseUseCaseResponseDTO(id=expense.id,
                                                created=True)
 
+class CreateExpensesUseCase(IUseCase):
+    """Implements the batch version of CreateExpenseUseCase.
+
+    This class is responsible for creating many expenses at once, storing them in the
+    repository within a single transaction. When requested, the remaining installments of
+    each installment expense are scheduled and written in the same batch, and the statement
+    the expenses were extracted from is recorded along with them.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self, 
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes CreateExpensesUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+    
+    def execute(self, data: DTO) -> CreateExpensesUseCaseResponseDTO:
+        """Executes the use case to create many expenses at once.
+
+        Args:
+            data: A DTO object containing a CreateExpensesUseCaseRequestDTO.
+
+        Returns:
+            A CreateExpensesUseCaseResponseDTO object representing the response.
+        """
+        request: CreateExpensesUseCaseRequestDTO = data.data # type: ignore
+        with Profiler.span('expenses.build_entities'):
+            expenses = [build_expense(expense_data) for expense_data in request.expenses]
+
+        statement = None
+        if request.statement is not None:
+            latest = max((expense.purchased_at for expense in expenses), default=None)
+            statement = Statement(hash=request.statement.hash,
+                                  bank=request.statement.bank,
+                                  period=latest.strftime('%Y-%m') if latest is not None else None,
+                                  page_count=request.statement.page_count,
+                                  row_count=len(expenses))
+
+        if request.project_installments:
+            with Profiler.span('expenses.schedule_installments'):
+                expenses = InstallmentScheduler.expand(expenses)
+
+        result = self._expenses_repository.create_expenses(expenses=expenses, statement=statement)
+
+        return CreateExpensesUseCaseResponseDTO(ids=[expense.id for expense in result.inserted],
+                                                created=True,
+                                                inserted=len(result.inserted),
+                                                skipped=len(result.skipped),
+                                                statement_id=statement.id if statement is not None else None) # type: ignore
+
 
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Union
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.application.use_cases.report_expenses import ReportExpensesUseCase
+from koala.domain.entities.expense import Expense, ExpenseType
+from koala.infra.core.interfaces.expense_exporter import IExpenseExporter
+from koala.infra.core.interfaces.expense_repository import ExpenseFilters, IExpensesRepository
+
+@dataclass
+class ExportExpensesUseCaseRequestDTO:
+    """Data class to represent the request for ExportExpensesUseCase.
+
+    Attributes:
+        exporter: An instance of a class that implements the IExpenseExporter interface.
+        destination: The file path to write to, or "-" for the standard output.
+        start: An optional string (YYYY-MM-DD) or datetime with the first purchase date included.
+        end: An optional string (YYYY-MM-DD) or datetime with the last purchase date included.
+        type: An optional ExpenseType the expenses must have.
+        name_prefix: An optional string the expense names must start with.
+        installment_to: An optional integer with the total number of installments of the plan.
+        updated_since: An optional datetime watermark; only expenses updated after it are exported.
+        batch_size: An optional number of expenses fetched and written at a time.
+    """
+    exporter: IExpenseExporter
+    destination: str = '-'
+    start: Union[str, datetime, None] = None
+    end: Union[str, datetime, None] = None
+    type: Union[ExpenseType, None] = None
+    name_prefix: Union[str, None] = None
+    installment_to: Union[int, None] = None
+    updated_since: Union[datetime, None] = None
+    batch_size: Union[int, None] = None
+
+@dataclass
+class ExportExpensesUseCaseResponseDTO:
+    """Data class to represent the response for ExportExpensesUseCase.
+
+    Attributes:
+        rows: The number of exported expenses.
+        batches: The number of written batches.
+        watermark: The latest update time among the exported expenses, to be passed as
+            `updated_since` by the next incremental export. None if nothing was exported.
+    """
+    rows: int = 0
+    batches: int = 0
+    watermark: Union[datetime, None] = None
+
+class ExportExpensesUseCase(IUseCase):
+    """Implements the ExportExpensesUseCase interface.
+
+    This class is responsible for streaming the stored expenses to an exporter, one batch
+    at a time, so the memory used does not grow with the size of the table.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self,
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes ExportExpensesUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+
+    @staticmethod
+    def track(batches: Iterable[List[Expense]],
+              response: ExportExpensesUseCaseResponseDTO) -> Iterator[List[Expense]]:
+        """Passes the batches through while counting them into the response.
+
+        Args:
+            batches: An iterable of lists of Expense entities.
+            response: The ExportExpensesUseCaseResponseDTO updated as batches are consumed.
+
+        Yields:
+            The given batches, unchanged.
+        """
+        for batch in batches:
+            response.rows += len(batch)
+            response.batches += 1
+            for expense in batch:
+                if expense.updated_at is not None and (response.watermark is None or expense.updated_at > response.watermark):
+                    response.watermark = expense.updated_at
+            yield batch
+
+    def execute(self, data: DTO) -> ExportExpensesUseCaseResponseDTO:
+        """Executes the use case to export expenses.
+
+        Args:
+            data: A DTO object containing an ExportExpensesUseCaseRequestDTO.
+
+        Returns:
+            An ExportExpensesUseCaseResponseDTO object representing the response.
+        """
+        request: ExportExpensesUseCaseRequestDTO = data.data # type: ignore
+        filters = ExpenseFilters(start=ReportExpensesUseCase.parse_date(request.start),
+                                 end=ReportExpensesUseCase.parse_date(request.end, end_of_day=True),
+                                 type=request.type,
+                                 name_prefix=request.name_prefix,
+                                 installment_to=request.installment_to,
+                                 updated_since=request.updated_since)
+
+        response = ExportExpensesUseCaseResponseDTO()
+        batches = self._expenses_repository.find_expense_batches(filters=filters, batch_size=request.batch_size)
+        request.exporter.write(self.track(batches, response), request.destination)
+
+        return response
@@ -0,0 +1,98 @@
+# built-in
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Union
+
+# interfaces
+from koala.application.core.interfaces.extract_expenses_from_pdf import (ExtractExpensesFromPDFUseCaseRequestDTO, 
+                                                                         IExtractExpensesFromPDF)
+from koala.application.core.interfaces.extract_expenses_from_pdfs import (ExtractedStatement, 
+                                                                          ExtractExpensesFromPDFsUseCaseRequestDTO, 
+                                                                          ExtractExpensesFromPDFsUseCaseResponseDTO, 
+                                                                          IExtractExpensesFromPDFs)
+from koala.application.core.interfaces.use_case import DTO
+from koala.application.parsers.pdf.detector import StatementDetector
+from koala.infra.core.utils.mapped_file import MappedFile
+from koala.infra.core.utils.profiler import Profiler
+
+
+def extract_statement(extractor: Union[IExtractExpensesFromPDF, None], 
+                      path: str,
+                      candidates: Union[Dict[str, IExtractExpensesFromPDF], None] = None,
+                      count_pages: bool = False) -> ExtractedStatement:
+    """Extracts the expenses of a single PDF, capturing any failure.
+
+    This function runs inside the worker processes, so it must stay at module level. The
+    file is memory-mapped once and shared by the detection and the extraction.
+
+    Args:
+        extractor: The extractor to run against the PDF, or None to detect it among the candidates.
+        path: The PDF file path.
+        candidates: A dictionary mapping names to the extractors available for detection.
+        count_pages: Whether the pages of the PDF should be counted too.
+
+    Returns:
+        An ExtractedStatement object with either the expenses or the error.
+    """
+    detected = None
+    try:
+        with MappedFile.open(path) as statement:
+            if extractor is None:
+                detected = StatementDetector().detect(statement, candidates or {})
+                if detected is None:
+                    return ExtractedStatement(path=path, error='Could not detect the bank of the statement.')
+                extractor = (candidates or {})[detected]
+
+            response = extractor.execute(data=DTO(data=ExtractExpensesFromPDFUseCaseRequestDTO(source=statement,
+                                                                                                count_pages=count_pages)))
+        return ExtractedStatement(path=path, expenses=response.expenses, detected=detected, page_count=response.page_count)
+    except Exception as err:
+        return ExtractedStatement(path=path, error=f'{type(err).__name__}: {err}', detected=detected)
+
+class ExtractExpensesFromPDFsUseCase(IExtractExpensesFromPDFs):
+    """Implements the IExtractExpensesFromPDFs interface.
+
+    This class fans the single-file extraction out over a process pool, since PDF text
+    extraction is CPU-bound, and merges the results in the requested order.
+
+    Attributes:
+        _max_workers: The maximum number of worker processes, or None to use the CPU count.
+    """
+    def __init__(self, 
+                 max_workers: Union[int, None] = None) -> None:
+        """Initializes ExtractExpensesFromPDFsUseCase.
+
+        Args:
+            max_workers: The maximum number of worker processes. Defaults to the CPU count.
+        """
+        self._max_workers = max_workers
+
+    def execute(self, data: DTO[ExtractExpensesFromPDFsUseCaseRequestDTO]) -> ExtractExpensesFromPDFsUseCaseResponseDTO:
+        """Executes the use case to extract expenses from many PDFs.
+
+        A failure on one PDF is reported in its ExtractedStatement and does not abort the batch.
+        When no extractor is given, each worker detects the bank of its own PDF, so folders
+        mixing banks are imported in one pass. While profiling, the PDFs are extracted in
+        this process, so their spans are recorded too.
+
+        Args:
+            data: A DTO object containing the request data.
+
+        Returns:
+            An ExtractExpensesFromPDFsUseCaseResponseDTO object representing the response.
+        """
+        dto_data = data.data
+
+        if len(dto_data.paths) <= 1 or self._max_workers == 1 or Profiler.enabled:
+            return ExtractExpensesFromPDFsUseCaseResponseDTO(statements=[extract_statement(dto_data.extractor, path, dto_data.candidates) 
+                                                                         for path in dto_data.paths])
+
+        statements = []
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(extract_statement, dto_data.extractor, path, dto_data.candidates) for path in dto_data.paths]
+            for path, future in zip(dto_data.paths, futures):
+                try:
+                    statements.append(future.result())
+                except Exception as err:
+                    statements.append(ExtractedStatement(path=path, error=f'{type(err).__name__}: {err}'))
+
+        return ExtractExpensesFromPDFsUseCaseResponseDTO(statements=statements)
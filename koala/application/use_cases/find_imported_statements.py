@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.expense_repository import IExpensesRepository
+from koala.infra.core.utils.digest import Digest
+
+@dataclass
+class FindImportedStatementsUseCaseRequestDTO:
+    """Data class to represent the request for FindImportedStatementsUseCase.
+
+    Attributes:
+        paths: A list of statement file paths about to be imported.
+        force: Whether the ledger is ignored, so the statements are scanned again. Paths
+            repeating the content of an earlier path of the request are still skipped.
+    """
+    paths: List[str]
+    force: bool = False
+
+@dataclass
+class FindImportedStatementsUseCaseResponseDTO:
+    """Data class to represent the response for FindImportedStatementsUseCase.
+
+    Attributes:
+        pending: A list of the paths still to be imported, in the requested order.
+        imported: A list of the paths whose content was already imported, or repeats the
+            content of an earlier path of the request.
+        hashes: A dictionary mapping each pending path to its content hash.
+    """
+    pending: List[str] = field(default_factory=list)
+    imported: List[str] = field(default_factory=list)
+    hashes: Dict[str, str] = field(default_factory=dict)
+
+class FindImportedStatementsUseCase(IUseCase):
+    """Implements the FindImportedStatementsUseCase.
+
+    This class tells the statement files already recorded in the ledger apart from the
+    ones still to be imported. Only the file content is hashed, so no statement is parsed.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self,
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes FindImportedStatementsUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+
+    def execute(self, data: DTO) -> FindImportedStatementsUseCaseResponseDTO:
+        """Executes the use case to find the statements that were already imported.
+
+        A path that cannot be read is left pending, so the import reports its error.
+
+        Args:
+            data: A DTO object containing a FindImportedStatementsUseCaseRequestDTO.
+
+        Returns:
+            A FindImportedStatementsUseCaseResponseDTO object representing the response.
+        """
+        request: FindImportedStatementsUseCaseRequestDTO = data.data # type: ignore
+
+        hashes: Dict[str, str] = {}
+        for path in request.paths:
+            try:
+                hashes[path] = Digest.of_file(path)
+            except OSError:
+                continue
+
+        imported_hashes = self._expenses_repository.find_imported_statements(list(hashes.values())) \
+            if not request.force else set()
+
+        response = FindImportedStatementsUseCaseResponseDTO()
+        for path in request.paths:
+            content_hash = hashes.get(path)
+            if content_hash is not None and content_hash in imported_hashes:
+                response.imported.append(path)
+                continue
+
+            response.pending.append(path)
+            if content_hash is not None:
+                response.hashes[path] = content_hash
+                imported_hashes.add(content_hash)
+
+        return response
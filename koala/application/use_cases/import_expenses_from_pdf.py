@@ -1,9 +1,12 @@
+# built-in
+from typing import Iterator
+
 # interfaces
 from koala.application.core.interfaces.extract_expenses_from_pdf import (ExtractExpensesFromPDFUseCaseRequestDTO, 
                                                                          ExtractExpensesFromPDFUseCaseResponseDTO, 
                                                                          IExtractExpensesFromPDF)
 from koala.application.core.interfaces.use_case import DTO
-from koala.infra.core.interfaces.pdf_parser import IPDFParser
+from koala.infra.core.interfaces.pdf_parser import IPDFParser, MonetaryValues, StatementFingerprint
 
 
 class ExtractExpensesFromPDFUseCase(IExtractExpensesFromPDF):
@@ -33,5 +36,31 @@ class ExtractExpensesFromPDFUseCase(IExtractExpensesFromPDF):
             An ExtractExpensesFromPDFUseCaseResponseDTO object representing the response.
         """
         dto_data = data.data
-        return ExtractExpensesFromPDFUseCaseResponseDTO(expenses=self._pdf_parser.extract_expenses(buffered_pdf=dto_data.pdf_buffer))
+        expenses = self._pdf_parser.extract_expenses(source=dto_data.source)
+        page_count = self._pdf_parser.count_pages(source=dto_data.source) if dto_data.count_pages else None
+        return ExtractExpensesFromPDFUseCaseResponseDTO(expenses=expenses, page_count=page_count)
+
+    def stream(self, data: DTO[ExtractExpensesFromPDFUseCaseRequestDTO]) -> Iterator[MonetaryValues]:
+        """Lazily extracts expenses from a PDF, page by page.
+
+        A binary file source must stay open until the iterator is exhausted.
+
+        Args:
+            data: A DTO object containing the request data.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses.
+        """
+        dto_data = data.data
+        yield from self._pdf_parser.iter_expenses(source=dto_data.source)
 
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Checks whether the PDF parser handles a statement.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if the PDF parser can handle the statement, False otherwise.
+        """
+        return self._pdf_parser.matches(fingerprint)
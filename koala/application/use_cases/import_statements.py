@@ -0,0 +1,317 @@
+# built-in
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+import logging
+import os
+from queue import Empty, Full, Queue
+import signal
+import threading
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+# interfaces
+from koala.application.core.interfaces.extract_expenses_from_pdf import IExtractExpensesFromPDF
+from koala.application.core.interfaces.extract_expenses_from_pdfs import ExtractedStatement
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.application.use_cases.create_expense import (CreateExpenseUseCaseRequestDTO,
+                                                        CreateExpensesUseCaseRequestDTO,
+                                                        CreateExpensesUseCaseResponseDTO,
+                                                        ImportedStatementDTO)
+from koala.application.use_cases.extract_expenses_from_pdfs import extract_statement
+from koala.domain.entities.expense import ExpenseType
+from koala.infra.core.interfaces.pdf_parser import MonetaryValues
+from koala.infra.core.utils.profiler import Profiler
+
+# Marks the end of the items of a stage queue.
+_DONE = object()
+
+@dataclass
+class ImportStatementsUseCaseRequestDTO:
+    """Data class to represent the request for ImportStatementsUseCase.
+
+    Attributes:
+        paths: A list of statement file paths to be imported.
+        classify: A callable telling the type of a non-installment expense. It runs on the
+            classification thread, so it must not prompt the user.
+        extractor: The single-file extractor to run against each statement, or None to detect
+            the bank of each statement among the candidates.
+        candidates: A dictionary mapping names to the extractors available for detection.
+        project_installments: A boolean indicating whether the remaining installments of each
+            installment expense should be created too.
+        queue_size: An optional bound of the queues between stages. Defaults to twice the
+            number of extraction workers.
+        hashes: A dictionary mapping paths to their content hashes. The statements of these
+            paths are recorded in the ledger along with their expenses, unless no expense
+            was extracted from them.
+        bank: The name of the extractor, recorded for the statements that are not detected.
+    """
+    paths: List[str]
+    classify: Callable[[MonetaryValues], ExpenseType]
+    extractor: Union[IExtractExpensesFromPDF, None] = None
+    candidates: Dict[str, IExtractExpensesFromPDF] = field(default_factory=dict)
+    project_installments: bool = False
+    queue_size: Union[int, None] = None
+    hashes: Dict[str, str] = field(default_factory=dict)
+    bank: Union[str, None] = None
+
+@dataclass
+class ImportStatementsUseCaseResponseDTO:
+    """Data class to represent the response for ImportStatementsUseCase.
+
+    Attributes:
+        statements: A list of ExtractedStatement objects, in path order, without their expenses,
+            which are dropped once written. Statements not reached before a cancellation are
+            missing.
+        extracted: The number of extracted expenses.
+        inserted: The number of expenses that were written.
+        skipped: The number of expenses that were already stored and therefore ignored.
+        cancelled: A boolean indicating whether the import was interrupted.
+    """
+    statements: List[ExtractedStatement] = field(default_factory=list)
+    extracted: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    cancelled: bool = False
+
+    @property
+    def failures(self) -> List[ExtractedStatement]:
+        """Lists the statements that could not be processed.
+
+        Returns:
+            A list of ExtractedStatement objects with their error set.
+        """
+        return [statement for statement in self.statements if statement.error is not None]
+
+def ignore_interrupts() -> None:
+    """Makes a worker process leave Ctrl-C to the main process, which cancels the import."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+class ImportStatementsUseCase(IUseCase):
+    """Implements the ImportStatementsUseCase interface.
+
+    This class imports many statements through a pipeline of stages connected by bounded
+    queues, so CPU-bound extraction overlaps with classification and database writes:
+
+    1. Extraction: statements are extracted, pages and rows alike, by a pool of worker
+       processes. A feeder thread submits them in path order and blocks while the queue is
+       full, so at most `queue_size` extracted statements wait for the next stage.
+    2. Classification: a thread types the expenses of each statement as it arrives.
+    3. Writing: the calling thread writes each statement in its own transaction, together
+       with its ledger entry when its hash is known, so a cancelled import keeps the
+       statements already written and re-running it resumes from there.
+
+    Ctrl-C cancels the import: pending statements are dropped, the ones being extracted
+    are waited for, and nothing half-written is committed.
+
+    Attributes:
+        _create_expenses_use_case: A use case for creating many expenses at once.
+        _max_workers: The maximum number of extraction processes, or None to use the CPU count.
+        _poll_interval: How often, in seconds, blocked stages check for a cancellation.
+    """
+
+    def __init__(self,
+                 create_expenses_use_case: IUseCase[CreateExpensesUseCaseRequestDTO,
+                                                    CreateExpensesUseCaseResponseDTO],
+                 max_workers: Union[int, None] = None,
+                 poll_interval: float = 0.1) -> None:
+        """Initializes ImportStatementsUseCase.
+
+        Args:
+            create_expenses_use_case: A use case for creating many expenses at once.
+            max_workers: The maximum number of extraction processes. Defaults to the CPU count.
+            poll_interval: How often, in seconds, blocked stages check for a cancellation.
+        """
+        self._create_expenses_use_case = create_expenses_use_case
+        self._max_workers = max_workers
+        self._poll_interval = poll_interval
+
+    def _create_executor(self, paths: List[str]) -> Executor:
+        """Creates the executor of the extraction stage.
+
+        A single statement, a single worker or a profiled run are extracted by one thread,
+        which still overlaps with the database writes, since SQLite releases the GIL.
+
+        Args:
+            paths: The statement file paths to be imported.
+
+        Returns:
+            An Executor instance.
+        """
+        if len(paths) <= 1 or self._max_workers == 1 or Profiler.enabled:
+            return ThreadPoolExecutor(max_workers=1)
+        return ProcessPoolExecutor(max_workers=self._max_workers, initializer=ignore_interrupts)
+
+    def _put(self, queue: Queue, item: Any, cancelled: threading.Event) -> bool:
+        """Puts an item in a bounded queue, waiting for room unless the import is cancelled.
+
+        Returns:
+            True if the item was queued, False if the import was cancelled first.
+        """
+        while not cancelled.is_set():
+            try:
+                queue.put(item, timeout=self._poll_interval)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _get(self, queue: Queue, cancelled: threading.Event) -> Any:
+        """Takes an item from a queue, waiting for one unless the import is cancelled.
+
+        Returns:
+            The item, or `_DONE` if the import was cancelled first.
+        """
+        while not cancelled.is_set():
+            try:
+                return queue.get(timeout=self._poll_interval)
+            except Empty:
+                continue
+        return _DONE
+
+    def _result(self, path: str, future: Future, cancelled: threading.Event) -> Union[ExtractedStatement, None]:
+        """Waits for the extraction of a statement unless the import is cancelled.
+
+        Returns:
+            The ExtractedStatement, or None if the import was cancelled first.
+        """
+        while not cancelled.is_set():
+            try:
+                return future.result(timeout=self._poll_interval)
+            except FutureTimeoutError:
+                continue
+            except BaseException as err:
+                return ExtractedStatement(path=path, error=f'{type(err).__name__}: {err}')
+        return None
+
+    def _feed(self,
+              executor: Executor,
+              request: ImportStatementsUseCaseRequestDTO,
+              extracted: Queue,
+              cancelled: threading.Event) -> None:
+        """Runs the feeder of the extraction stage."""
+        try:
+            for path in request.paths:
+                future = executor.submit(extract_statement, request.extractor, path, request.candidates, path in request.hashes)
+                if not self._put(extracted, (path, future), cancelled):
+                    future.cancel()
+                    return
+        finally:
+            self._put(extracted, _DONE, cancelled)
+
+    def _classify(self,
+                  request: ImportStatementsUseCaseRequestDTO,
+                  extracted: Queue,
+                  classified: Queue,
+                  cancelled: threading.Event,
+                  errors: List[BaseException]) -> None:
+        """Runs the classification stage."""
+        try:
+            while True:
+                item = self._get(extracted, cancelled)
+                if item is _DONE:
+                    return
+                path, future = item
+                statement = self._result(path, future, cancelled)
+                if statement is None:
+                    return
+
+                with Profiler.span('import.classify'):
+                    expenses = [CreateExpenseUseCaseRequestDTO(name=expense.name,
+                                                               purchased_at=expense.purchased_at, # type: ignore
+                                                               amount=float(expense.amount),
+                                                               installment_of=expense.installment_of, # type: ignore
+                                                               installment_to=expense.installment_to, # type: ignore
+                                                               type=ExpenseType.INSTALLMENT if expense.installment_of is not None
+                                                                   else request.classify(expense))
+                                for expense in statement.expenses]
+                if not self._put(classified, (statement, expenses), cancelled):
+                    return
+        except BaseException as err:
+            errors.append(err)
+            cancelled.set()
+        finally:
+            self._put(classified, _DONE, cancelled)
+
+    def execute(self, data: DTO) -> ImportStatementsUseCaseResponseDTO:
+        """Executes the use case to import many statements.
+
+        Args:
+            data: A DTO object containing an ImportStatementsUseCaseRequestDTO.
+
+        Returns:
+            An ImportStatementsUseCaseResponseDTO object representing the response.
+
+        Raises:
+            Exception: Any error raised by the classification or the writes.
+        """
+        request: ImportStatementsUseCaseRequestDTO = data.data # type: ignore
+        response = ImportStatementsUseCaseResponseDTO()
+        if not request.paths:
+            return response
+
+        workers = self._max_workers or os.cpu_count() or 1
+        queue_size = request.queue_size or 2 * workers
+        extracted: Queue = Queue(maxsize=queue_size)
+        classified: Queue = Queue(maxsize=queue_size)
+        cancelled = threading.Event()
+        errors: List[BaseException] = []
+
+        executor = self._create_executor(request.paths)
+        stages = [threading.Thread(target=self._feed, args=(executor, request, extracted, cancelled), daemon=True),
+                  threading.Thread(target=self._classify, args=(request, extracted, classified, cancelled, errors), daemon=True)]
+        for stage in stages:
+            stage.start()
+
+        try:
+            while True:
+                item = self._get(classified, cancelled)
+                if item is _DONE:
+                    break
+                statement, expenses = item
+                response.statements.append(ExtractedStatement(path=statement.path,
+                                                              error=statement.error,
+                                                              detected=statement.detected,
+                                                              page_count=statement.page_count))
+                content_hash = request.hashes.get(statement.path)
+                # A statement without rows may have been read with the wrong layout, so it is
+                # not recorded, and the next import scans it again.
+                if statement.error is not None or not expenses:
+                    continue
+
+                ledger_entry = ImportedStatementDTO(hash=content_hash,
+                                                    bank=statement.detected or request.bank or 'unknown',
+                                                    page_count=statement.page_count) if content_hash is not None else None
+
+                response.extracted += len(expenses)
+                created = self._create_expenses_use_case.execute(
+                    data=DTO(data=CreateExpensesUseCaseRequestDTO(expenses=expenses,
+                                                                  project_installments=request.project_installments,
+                                                                  statement=ledger_entry)))
+                response.inserted += created.inserted
+                response.skipped += created.skipped
+        except KeyboardInterrupt:
+            logging.warning('Cancelling the import, waiting for the statements being extracted.')
+            response.cancelled = True
+        finally:
+            cancelled.set()
+            for stage in stages:
+                stage.join()
+            # Drop the statements still waiting to be extracted.
+            self._cancel_pending(extracted)
+            executor.shutdown(wait=True)
+
+        if errors:
+            raise errors[0]
+
+        return response
+
+    @staticmethod
+    def _cancel_pending(extracted: Queue) -> None:
+        """Cancels the extractions left in the queue of the extraction stage."""
+        while True:
+            try:
+                item: Union[Tuple[str, Future], object] = extracted.get_nowait()
+            except Empty:
+                return
+            if item is not _DONE:
+                item[1].cancel() # type: ignore
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.expense_repository import IExpensesRepository
+
+@dataclass
+class RebuildMonthlyTotalsUseCaseResponseDTO:
+    """Data class to represent the response for RebuildMonthlyTotalsUseCase.
+
+    Attributes:
+        rows: The number of monthly totals after the rebuild.
+    """
+    rows: int
+
+class RebuildMonthlyTotalsUseCase(IUseCase):
+    """Implements the RebuildMonthlyTotalsUseCase interface.
+
+    This class is responsible for recomputing the monthly totals from the stored expenses,
+    repairing any drift between them.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self, 
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes RebuildMonthlyTotalsUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+
+    def execute(self, data: DTO) -> RebuildMonthlyTotalsUseCaseResponseDTO:
+        """Executes the use case to rebuild the monthly totals.
+
+        Args:
+            data: A DTO object. Its data is not used.
+
+        Returns:
+            A RebuildMonthlyTotalsUseCaseResponseDTO object representing the response.
+        """
+        return RebuildMonthlyTotalsUseCaseResponseDTO(rows=self._expenses_repository.rebuild_monthly_totals())
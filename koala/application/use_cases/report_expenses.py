@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from datetime import datetime, time
+from typing import Iterator, Union
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.domain.entities.expense import Expense, ExpenseType
+from koala.infra.core.interfaces.expense_repository import ExpenseFilters, IExpensesRepository, MonthlyTotal
+
+@dataclass
+class ReportExpensesUseCaseRequestDTO:
+    """Data class to represent the request for ReportExpensesUseCase.
+
+    Attributes:
+        start: An optional string (YYYY-MM-DD) or datetime with the first purchase date included.
+        end: An optional string (YYYY-MM-DD) or datetime with the last purchase date included.
+        type: An optional ExpenseType the expenses must have.
+        name_prefix: An optional string the expense names must start with.
+        installment_to: An optional integer with the total number of installments of the plan.
+        detailed: A boolean indicating whether the matching expenses should be listed too.
+    """
+    start: Union[str, datetime, None] = None
+    end: Union[str, datetime, None] = None
+    type: Union[ExpenseType, None] = None
+    name_prefix: Union[str, None] = None
+    installment_to: Union[int, None] = None
+    detailed: bool = False
+
+@dataclass
+class ReportExpensesUseCaseResponseDTO:
+    """Data class to represent the response for ReportExpensesUseCase.
+
+    Both iterators are lazy and stream rows from the repository as they are consumed.
+
+    Attributes:
+        totals: An iterator of MonthlyTotal objects ordered by month and type.
+        expenses: An iterator of the matching Expense entities, or None if no details were requested.
+    """
+    totals: Iterator[MonthlyTotal]
+    expenses: Union[Iterator[Expense], None] = None
+
+class ReportExpensesUseCase(IUseCase):
+    """Implements the ReportExpensesUseCase interface.
+
+    This class is responsible for querying the stored expenses, aggregating them per month
+    and type.
+
+    Attributes:
+        _expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+    """
+
+    def __init__(self, 
+                 expenses_repository: IExpensesRepository) -> None:
+        """Initializes ReportExpensesUseCase with a given expenses repository.
+
+        Args:
+            expenses_repository: An instance of a class that implements the IExpensesRepository interface.
+        """
+        self._expenses_repository: IExpensesRepository = expenses_repository
+
+    @staticmethod
+    def parse_date(date: Union[str, datetime, None], end_of_day: bool = False) -> Union[datetime, None]:
+        """Parses an optional report boundary.
+
+        Args:
+            date: An optional string (YYYY-MM-DD) or datetime.
+            end_of_day: Whether a string date should include the whole day.
+
+        Returns:
+            A datetime object, or None if no date was given.
+
+        Raises:
+            ValueError: If a string date is not formatted as YYYY-MM-DD.
+        """
+        if not isinstance(date, str):
+            return date
+
+        parsed = datetime.strptime(date, '%Y-%m-%d')
+        return datetime.combine(parsed.date(), time.max) if end_of_day else parsed
+
+    def execute(self, data: DTO) -> ReportExpensesUseCaseResponseDTO:
+        """Executes the use case to report expenses.
+
+        Args:
+            data: A DTO object containing a ReportExpensesUseCaseRequestDTO.
+
+        Returns:
+            A ReportExpensesUseCaseResponseDTO object representing the response.
+        """
+        request: ReportExpensesUseCaseRequestDTO = data.data # type: ignore
+        filters = ExpenseFilters(start=self.parse_date(request.start),
+                                 end=self.parse_date(request.end, end_of_day=True),
+                                 type=request.type,
+                                 name_prefix=request.name_prefix,
+                                 installment_to=request.installment_to)
+
+        return ReportExpensesUseCaseResponseDTO(totals=self._expenses_repository.summarize_by_month(filters=filters),
+                                                expenses=self._expenses_repository.find_expenses(filters=filters) 
+                                                    if request.detailed else None)
@@ -1,14 +1,15 @@
-from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Generic, TypeVar, Union
+from typing import Any, Dict, Generic, Tuple, TypeVar, Union
 
 T = TypeVar('T')
 
-@dataclass
 class Entity(Generic[T]):
     """Base class for entities in the domain model.
 
-    This class provides common attributes and methods for all entities.
+    This class provides common attributes and methods for all entities. Entities are
+    slotted, so each instance stores its attributes inline instead of in a dictionary.
+    Subclasses must declare their own `__slots__` and extend `_fields`, which drives
+    equality, representation and serialization.
 
     Attributes:
         id: A Union of int and str representing the entity's ID.
@@ -16,9 +17,9 @@ class Entity(Generic[T]):
         updated_at: A datetime object representing when the entity was last updated.
     """
 
-    id: Union[int, str]
-    created_at: datetime
-    updated_at: datetime
+    __slots__ = ('id', 'created_at', 'updated_at')
+    _fields: Tuple[str, ...] = ('id', 'created_at', 'updated_at')
+    __hash__ = None  # type: ignore
 
     def __init__(self, 
                  id: Union[int, str, None] = None,
@@ -31,15 +32,41 @@ class Entity(Generic[T]):
             created_at: A Union of datetime and None representing when the entity was created. Defaults to current UTC time.
             updated_at: A Union of datetime and None representing when the entity was last updated. Defaults to current UTC time.
         """
+        now = datetime.utcnow() if created_at is None or updated_at is None else None
 
         self.id = id if id is not None else 0
-        self.created_at = created_at if created_at is not None else datetime.utcnow()
-        self.updated_at = updated_at if updated_at is not None else datetime.utcnow()
+        self.created_at = created_at if created_at is not None else now
+        self.updated_at = updated_at if updated_at is not None else now
+
+    def __eq__(self, other: object) -> bool:
+        """Compares two entities of the same class field by field.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            True if every field is equal, False otherwise.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+    def __repr__(self) -> str:
+        """Represents the entity with its fields.
+
+        Returns:
+            A string such as `Expense(id=1, ...)`.
+        """
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{self.__class__.__qualname__}({fields})'
 
     def to_dict(self) -> T:
         """Converts the entity to a dictionary.
 
+        The conversion is shallow: values are referenced, not copied.
+
         Returns:
             A dictionary representation of the entity.
         """
-        return asdict(self) # type: ignore
\ No newline at end of file
+        entity: Dict[str, Any] = {field: getattr(self, field) for field in self._fields}
+        return entity # type: ignore
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Union
+import hashlib
+from typing import Any, Dict, Union
 from koala.domain.entities.base import Entity
 
 class ExpenseType(Enum):
@@ -16,7 +16,6 @@ class ExpenseType(Enum):
     INSTALLMENT = 'installment'
     VARIABLE = 'variable'
 
-@dataclass
 class Expense(Entity):
     """Class to represent an Expense entity.
 
@@ -28,11 +27,12 @@ class Expense(Entity):
         name: A string representing the name of the expense.
         type: An ExpenseType enum representing the type of expense.
         amount: A float representing the amount of the expense.
+        source_statement: A string identifying the statement the expense was imported from, if any.
+        statement_id: The ID of the recorded Statement the expense was imported with, if any.
     """
-    purchased_at: datetime
-    name: str
-    type: ExpenseType
-    amount: float
+    __slots__ = ('purchased_at', 'name', 'type', 'amount', '_installment_of', '_installment_to', 'source_statement',
+                 'statement_id')
+    _fields = Entity._fields + ('purchased_at', 'name', 'type', 'amount', 'source_statement', 'statement_id')
 
     def __init__(self,
                  purchased_at: datetime,
@@ -41,6 +41,8 @@ class Expense(Entity):
                  amount: float,
                  installment_of: Union[int, None] = None,
                  installment_to: Union[int, None] = None,
+                 source_statement: Union[str, None] = None,
+                 statement_id: Union[int, None] = None,
                  id: Union[int, str, None] = None, 
                  created_at: Union[datetime, None] = None, 
                  updated_at: Union[datetime, None] = None) -> None:
@@ -53,19 +55,113 @@ class Expense(Entity):
             amount: A float representing the amount of the expense.
             installment_of: An optional integer representing the current installment number.
             installment_to: An optional integer representing the total number of installments.
+            source_statement: An optional string identifying the statement the expense was imported from.
+            statement_id: An optional ID of the recorded Statement the expense was imported with.
             id: An optional Union of int, str, and None representing the entity's ID.
             created_at: An optional Union of datetime and None representing when the entity was created.
             updated_at: An optional Union of datetime and None representing when the entity was last updated.
         """
-        super().__init__(id=id, 
-                         created_at=created_at, 
-                         updated_at=updated_at)
+        # Entity.__init__ is inlined, since an expense is built for every streamed row.
+        now = datetime.utcnow() if created_at is None or updated_at is None else None
+        self.id = id if id is not None else 0
+        self.created_at = created_at if created_at is not None else now
+        self.updated_at = updated_at if updated_at is not None else now
         self.purchased_at = purchased_at
         self.name = name
         self.type = type
         self.amount = amount
         self._installment_of = int(installment_of) if installment_of is not None else None
         self._installment_to = int(installment_to) if installment_to is not None else None
+        self.source_statement = source_statement
+        self.statement_id = statement_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the expense to a dictionary, including its installments.
+
+        The conversion is shallow: values are referenced, not copied.
+
+        Returns:
+            A dictionary representation of the expense.
+        """
+        expense: Dict[str, Any] = super().to_dict()
+        expense['installment_of'] = self._installment_of
+        expense['installment_to'] = self._installment_to
+        return expense
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Normalizes an expense name so that spacing and casing differences are ignored.
+
+        Args:
+            name: A string representing the name of the expense.
+
+        Returns:
+            The normalized name.
+        """
+        return ' '.join(name.split()).casefold()
+
+    def fingerprint(self, occurrence: int = 0) -> str:
+        """Builds the deterministic natural key of the expense.
+
+        Two expenses with the same purchase date, normalized name, amount, installments and
+        source statement share the same fingerprint. The occurrence tells apart genuinely
+        repeated expenses inside the same batch, such as two identical purchases on a day.
+
+        An installment is keyed by the month of the first installment of its plan rather than
+        by its own date, so a projected installment and the row a later statement carries for
+        it match even when the day was clamped to a shorter month.
+
+        Args:
+            occurrence: The zero-based position of the expense among its identical siblings.
+
+        Returns:
+            A string representing the SHA-256 hex digest of the natural key.
+        """
+        return self.make_fingerprint(purchased_at=self.purchased_at,
+                                     name=self.name,
+                                     amount=self.amount,
+                                     installment_of=self.installment_of,
+                                     installment_to=self.installment_to,
+                                     source_statement=self.source_statement,
+                                     occurrence=occurrence)
+
+    @classmethod
+    def make_fingerprint(cls,
+                         purchased_at: datetime,
+                         name: str,
+                         amount: float,
+                         installment_of: Union[int, None] = None,
+                         installment_to: Union[int, None] = None,
+                         source_statement: Union[str, None] = None,
+                         occurrence: int = 0) -> str:
+        """Builds the natural key of an expense from its raw values, see `fingerprint`.
+
+        Args:
+            purchased_at: A datetime object representing when the expense was purchased.
+            name: A string representing the name of the expense.
+            amount: A float representing the amount of the expense.
+            installment_of: An optional integer representing the current installment number.
+            installment_to: An optional integer representing the total number of installments.
+            source_statement: An optional string identifying the statement the expense was imported from.
+            occurrence: The zero-based position of the expense among its identical siblings.
+
+        Returns:
+            A string representing the SHA-256 hex digest of the natural key.
+        """
+        if installment_of is None:
+            date_key = purchased_at.strftime('%Y-%m-%d')
+        else:
+            month = purchased_at.year * 12 + purchased_at.month - int(installment_of)
+            date_key = f'{month // 12:04d}-{month % 12 + 1:02d}'
+
+        key = '|'.join((date_key,
+                        cls.normalize_name(name),
+                        f'{float(amount):.2f}',
+                        str(installment_of or ''),
+                        str(installment_to or ''),
+                        source_statement or '',
+                        str(occurrence)))
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
     
     @property
     def installment_of(self) -> Union[int, None]:
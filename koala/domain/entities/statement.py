@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Union
+from koala.domain.entities.base import Entity
+
+class Statement(Entity):
+    """Class to represent an imported Statement entity.
+
+    This class inherits from the Entity base class and records a statement file whose
+    expenses were imported, so the same file is never extracted again.
+
+    Attributes:
+        hash: A string representing the SHA-256 hex digest of the file content.
+        bank: A string representing the name of the extractor that imported the statement.
+        period: A string representing the month of the latest purchase, formatted as YYYY-MM,
+            or None for a statement without expenses.
+        page_count: An integer representing the number of pages, or None for formats without pages.
+        row_count: An integer representing the number of extracted expenses.
+        imported_at: A datetime object representing when the statement was imported.
+    """
+    __slots__ = ('hash', 'bank', 'period', 'page_count', 'row_count', 'imported_at')
+    _fields = Entity._fields + ('hash', 'bank', 'period', 'page_count', 'row_count', 'imported_at')
+
+    def __init__(self,
+                 hash: str,
+                 bank: str,
+                 row_count: int,
+                 period: Union[str, None] = None,
+                 page_count: Union[int, None] = None,
+                 imported_at: Union[datetime, None] = None,
+                 id: Union[int, str, None] = None,
+                 created_at: Union[datetime, None] = None,
+                 updated_at: Union[datetime, None] = None) -> None:
+        """Initializes a Statement entity with given or default values.
+
+        Args:
+            hash: A string representing the SHA-256 hex digest of the file content.
+            bank: A string representing the name of the extractor that imported the statement.
+            row_count: An integer representing the number of extracted expenses.
+            period: An optional string representing the month of the latest purchase, formatted as YYYY-MM.
+            page_count: An optional integer representing the number of pages.
+            imported_at: An optional datetime representing when the statement was imported. Defaults to current UTC time.
+            id: An optional Union of int, str, and None representing the entity's ID.
+            created_at: An optional Union of datetime and None representing when the entity was created.
+            updated_at: An optional Union of datetime and None representing when the entity was last updated.
+        """
+        super().__init__(id=id, created_at=created_at, updated_at=updated_at)
+        self.hash = hash
+        self.bank = bank
+        self.period = period
+        self.page_count = page_count
+        self.row_count = row_count
+        self.imported_at = imported_at if imported_at is not None else datetime.utcnow()
@@ -0,0 +1,234 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+import re
+from typing import Any, Dict, List, Mapping, Pattern, Sequence, Tuple, Union
+
+from koala.domain.entities.expense import Expense, ExpenseType
+
+class RuleKind(Enum):
+    """Enum for the ways a classification rule matches an expense name."""
+    EXACT = 'exact'
+    PREFIX = 'prefix'
+    CONTAINS = 'contains'
+    REGEX = 'regex'
+
+@dataclass(frozen=True)
+class ClassificationRule:
+    """Data class to represent a merchant classification rule.
+
+    Exact, prefix and contains patterns are compared with the normalized expense name, so
+    spacing and casing are ignored. Regex patterns are searched case-insensitively in it.
+
+    Attributes:
+        kind: A RuleKind telling how the pattern matches.
+        pattern: A string representing the pattern.
+        type: The ExpenseType given to the matching expenses.
+    """
+    kind: RuleKind
+    pattern: str
+    type: ExpenseType
+
+class PrefixTrie:
+    """Character trie answering the longest stored prefix of a string.
+
+    A lookup walks the string once, so its cost depends on the string length only and not
+    on the number of stored prefixes.
+    """
+
+    def __init__(self) -> None:
+        self._root: Dict[Union[str, None], Any] = {}
+
+    def add(self, prefix: str, value: ExpenseType) -> None:
+        """Stores a prefix. The first value stored for a prefix is kept.
+
+        Args:
+            prefix: A string representing the prefix.
+            value: The value of the prefix.
+        """
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, value)
+
+    def longest(self, text: str) -> Union[ExpenseType, None]:
+        """Finds the value of the longest stored prefix of a string.
+
+        Args:
+            text: A string.
+
+        Returns:
+            The value of the longest matching prefix, or None if no prefix matches.
+        """
+        node = self._root
+        found = node.get(None)
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+class SubstringAutomaton:
+    """Aho-Corasick automaton answering the longest stored pattern contained in a string.
+
+    Every pattern is found in a single pass over the string, regardless of how many
+    patterns are stored. Ties between patterns of the same length go to the first added.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, ExpenseType]]) -> None:
+        """Builds the automaton.
+
+        Args:
+            patterns: A sequence of (pattern, value) tuples, in priority order.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Union[Tuple[int, int, ExpenseType], None]] = [None]
+
+        for priority, (pattern, value) in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                state = next_state
+            if self._output[state] is None:
+                self._output[state] = (len(pattern), -priority, value)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0) if state else 0
+                inherited = self._output[self._fail[next_state]]
+                own = self._output[next_state]
+                if own is None or (inherited is not None and inherited[:2] > own[:2]):
+                    self._output[next_state] = inherited
+
+    def longest(self, text: str) -> Union[ExpenseType, None]:
+        """Finds the value of the longest stored pattern contained in a string.
+
+        Args:
+            text: A string.
+
+        Returns:
+            The value of the longest contained pattern, or None if no pattern is contained.
+        """
+        best: Union[Tuple[int, int, ExpenseType], None] = None
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            output = self._output[state]
+            if output is not None and (best is None or output[:2] > best[:2]):
+                best = output
+        return best[2] if best is not None else None
+
+class ExpenseClassifier:
+    """Domain service that classifies expenses by their merchant name.
+
+    The rules are compiled once into a dictionary of exact names, a prefix trie, an
+    Aho-Corasick automaton and a single alternation regex, so classifying a name costs a
+    few passes over it no matter how many rules exist. Regex rules are only tried one by
+    one, in priority order, for the names the combined regex matched.
+
+    Names are resolved in this order: exact rules, longest prefix rule, longest contains
+    rule, first matching regex rule and finally the merchants already classified. Every
+    result is memoized per normalized name.
+    """
+
+    def __init__(self,
+                 rules: Sequence[ClassificationRule] = (),
+                 known_merchants: Union[Mapping[str, ExpenseType], None] = None) -> None:
+        """Compiles the rules.
+
+        Args:
+            rules: A sequence of ClassificationRule objects, in priority order.
+            known_merchants: An optional mapping from normalized merchant names to the type
+                they were classified with before.
+
+        Raises:
+            Exception: If a regex rule is invalid.
+        """
+        self._exact: Dict[str, ExpenseType] = {}
+        self._prefixes = PrefixTrie()
+        contains: List[Tuple[str, ExpenseType]] = []
+        self._regexes: List[Tuple[Pattern, ExpenseType]] = []
+
+        for rule in rules:
+            if rule.kind == RuleKind.REGEX:
+                try:
+                    self._regexes.append((re.compile(rule.pattern, re.IGNORECASE), rule.type))
+                except re.error as err:
+                    raise Exception(f'Invalid regex rule "{rule.pattern}". {err}')
+                continue
+
+            pattern = Expense.normalize_name(rule.pattern)
+            if rule.kind == RuleKind.EXACT:
+                self._exact.setdefault(pattern, rule.type)
+            elif rule.kind == RuleKind.PREFIX:
+                self._prefixes.add(pattern, rule.type)
+            else:
+                contains.append((pattern, rule.type))
+
+        self._contains = SubstringAutomaton(contains) if contains else None
+        self._regex: Union[Pattern, None] = None
+        if len(self._regexes) > 1:
+            try:
+                self._regex = re.compile('|'.join(f'(?:{regex.pattern})' for regex, _ in self._regexes), re.IGNORECASE)
+            except re.error:
+                # Patterns valid on their own may clash once joined, e.g. repeated group names
+                # or inline flags, so they are searched one by one without the prefilter.
+                self._regex = None
+        self._known_merchants: Dict[str, ExpenseType] = dict(known_merchants or {})
+        self._memo: Dict[str, Union[ExpenseType, None]] = {}
+
+    def classify(self, name: str) -> Union[ExpenseType, None]:
+        """Classifies an expense by its name.
+
+        Args:
+            name: A string representing the name of the expense.
+
+        Returns:
+            The ExpenseType of the expense, or None if no rule nor known merchant matches.
+        """
+        normalized = Expense.normalize_name(name)
+        if normalized in self._memo:
+            return self._memo[normalized]
+
+        expense_type = self._exact.get(normalized)
+        if expense_type is None:
+            expense_type = self._prefixes.longest(normalized)
+        if expense_type is None and self._contains is not None:
+            expense_type = self._contains.longest(normalized)
+        if expense_type is None and self._regexes and (self._regex is None or self._regex.search(normalized)):
+            expense_type = next((rule_type for regex, rule_type in self._regexes if regex.search(normalized)), None)
+        if expense_type is None:
+            expense_type = self._known_merchants.get(normalized)
+
+        self._memo[normalized] = expense_type
+        return expense_type
+
+    def learn(self, name: str, expense_type: ExpenseType) -> None:
+        """Remembers the type of a merchant, so it is not asked again.
+
+        Args:
+            name: A string representing the name of the expense.
+            expense_type: The ExpenseType the expense was classified with.
+        """
+        normalized = Expense.normalize_name(name)
+        self._known_merchants[normalized] = expense_type
+        if self._memo.get(normalized) is None:
+            self._memo[normalized] = expense_type
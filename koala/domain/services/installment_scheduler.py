@@ -0,0 +1,81 @@
+import calendar
+from datetime import datetime
+from typing import List, Sequence
+
+from koala.domain.entities.expense import Expense, ExpenseType
+
+class InstallmentScheduler:
+    """Domain service that projects installment expenses forward.
+
+    Every installment date is computed from the anchor installment rather than from the
+    previous one, so a purchase on the 31st lands on the last day of shorter months and
+    returns to the 31st afterwards instead of drifting.
+
+    Methods:
+        add_months: Static method to shift a date by a number of months, clamping to month end.
+        schedule: Static method to produce an installment and all the ones after it.
+        expand: Static method to schedule every installment expense of a batch.
+    """
+
+    @staticmethod
+    def add_months(date: datetime, months: int) -> datetime:
+        """Shifts a date by a number of months, clamping the day to the target month end.
+
+        Args:
+            date: A datetime object.
+            months: The number of months to shift, possibly negative.
+
+        Returns:
+            The shifted datetime object.
+        """
+        month_index = date.month - 1 + months
+        year = date.year + month_index // 12
+        month = month_index % 12 + 1
+        day = min(date.day, calendar.monthrange(year, month)[1])
+        return date.replace(year=year, month=month, day=day)
+
+    @staticmethod
+    def schedule(expense: Expense) -> List[Expense]:
+        """Produces an installment expense followed by all its remaining installments.
+
+        The expense purchase date is taken as the date of its own installment, which is what
+        the parsers report and what the interactive command computes from the date of the first
+        installment. Projected installments therefore share their fingerprint with the rows
+        the next statements carry for them.
+
+        Args:
+            expense: An Expense entity with installment_of and installment_to set.
+
+        Returns:
+            A list of Expense entities, from installment_of up to installment_to. Expenses
+            that are not installments are returned alone.
+        """
+        if expense.installment_of is None or expense.installment_to is None:
+            return [expense]
+
+        anchor = expense.installment_of
+        return [expense] + [Expense(purchased_at=InstallmentScheduler.add_months(expense.purchased_at, installment - anchor),
+                                    name=expense.name,
+                                    type=expense.type,
+                                    amount=expense.amount,
+                                    installment_of=installment,
+                                    installment_to=expense.installment_to,
+                                    source_statement=expense.source_statement)
+                            for installment in range(anchor + 1, expense.installment_to + 1)]
+
+    @staticmethod
+    def expand(expenses: Sequence[Expense]) -> List[Expense]:
+        """Schedules the remaining installments of every installment expense of a batch.
+
+        Args:
+            expenses: A sequence of Expense entities.
+
+        Returns:
+            A list of Expense entities with the projected installments right after the
+            installment they were projected from.
+        """
+        return [scheduled 
+                for expense in expenses 
+                for scheduled in (InstallmentScheduler.schedule(expense) 
+                                  if expense.type == ExpenseType.INSTALLMENT 
+                                  else [expense])]
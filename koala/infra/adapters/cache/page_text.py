@@ -0,0 +1,115 @@
+# built-in
+import json
+import logging
+import os
+import tempfile
+from typing import List, Union
+
+# interfaces
+from koala.infra.core.interfaces.page_text_cache import IPageTextCache
+
+
+class DiskPageTextCache(IPageTextCache):
+    """Implements the IPageTextCache interface on the local filesystem.
+
+    Each entry is stored as a JSON file named after its key. Reading an entry refreshes
+    its modification time, and once the directory grows past `max_bytes` the least
+    recently used entries are evicted.
+
+    Attributes:
+        _directory: A string representing the directory where the entries are stored.
+        _max_bytes: The maximum size, in bytes, of all entries together.
+    """
+
+    def __init__(self, 
+                 directory: str, 
+                 max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initializes DiskPageTextCache with a given directory.
+
+        Args:
+            directory: A string representing the directory where the entries are stored.
+            max_bytes: The maximum size, in bytes, of all entries together. Defaults to 64 MiB.
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> str:
+        """Builds the file path of an entry.
+
+        Args:
+            key: A string representing the cache key.
+
+        Returns:
+            A string representing the entry file path.
+        """
+        return os.path.join(self._directory, f'{key}.json')
+
+    def get(self, key: str) -> Union[List[str], None]:
+        """Retrieves the cached pages of a PDF.
+
+        Args:
+            key: A string representing the cache key.
+
+        Returns:
+            A list of strings, each representing the text content of a PDF page, or None on a cache miss.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as entry:
+                pages = json.load(entry)
+            os.utime(path)
+            return pages
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logging.warning(f'Could not read cached pages. {err}')
+            return None
+
+    def set(self, key: str, pages: List[str]) -> None:
+        """Stores the pages of a PDF, evicting old entries if needed.
+
+        Args:
+            key: A string representing the cache key.
+            pages: A list of strings, each representing the text content of a PDF page.
+        """
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as entry:
+                json.dump(pages, entry, ensure_ascii=False)
+            os.replace(temporary_path, self._entry_path(key))
+        except Exception as err:
+            logging.warning(f'Could not cache pages. {err}')
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Removes the least recently used entries until the cache fits in `max_bytes`.
+
+        Returns:
+            The number of evicted entries.
+        """
+        entries = []
+        for name in os.listdir(self._directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self._directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, name in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self._directory, name))
+                evicted += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        return evicted
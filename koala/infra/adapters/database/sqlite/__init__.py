@@ -1,14 +1,39 @@
 # built-in
 import logging
-from typing import Union
+from typing import Any, Dict, Union
 
 # third-party
-from sqlalchemy import Connection, Engine, create_engine
+from sqlalchemy import Connection, Engine, create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 # interfaces
+from koala.infra.adapters.database.sqlite.migrations import SchemaMigrator
 from koala.infra.core.interfaces.database import IDatabase
 
+# Named sets of pragmas applied to every new connection. `safe` keeps the SQLite defaults,
+# `balanced` uses WAL so readers never block the writer, and `fast` also skips fsync, trading
+# durability on power loss for import speed. Negative cache sizes are expressed in KiB.
+PERFORMANCE_PROFILES: Dict[str, Dict[str, Union[str, int]]] = {
+    'safe': {'journal_mode': 'DELETE',
+             'synchronous': 'FULL',
+             'mmap_size': 0,
+             'cache_size': -2000,
+             'temp_store': 'DEFAULT',
+             'busy_timeout': 5000},
+    'balanced': {'journal_mode': 'WAL',
+                 'synchronous': 'NORMAL',
+                 'mmap_size': 64 * 1024 * 1024,
+                 'cache_size': -16000,
+                 'temp_store': 'MEMORY',
+                 'busy_timeout': 5000},
+    'fast': {'journal_mode': 'WAL',
+             'synchronous': 'OFF',
+             'mmap_size': 256 * 1024 * 1024,
+             'cache_size': -64000,
+             'temp_store': 'MEMORY',
+             'busy_timeout': 10000},
+}
+
 
 class SQLite(IDatabase[Connection]):
     """Implements the IDatabase interface for SQLite databases.
@@ -20,19 +45,98 @@ class SQLite(IDatabase[Connection]):
         _engine: An Engine object for the SQLite database.
         _connection: A Connection object for the SQLite database.
         _session: A Session object for the SQLite database.
+        _profile: A string representing the name of the performance profile in use.
     """
 
-    def __init__(self, connection_str: str) -> None:
+    def __init__(self, connection_str: str, profile: str = 'balanced') -> None:
         """Initializes SQLite with a given connection string.
 
         Args:
             connection_str: A string representing the SQLite database connection string.
+            profile: The name of one of the PERFORMANCE_PROFILES. Defaults to "balanced".
+
+        Raises:
+            Exception: If the profile does not exist.
         """
+        if profile not in PERFORMANCE_PROFILES:
+            raise Exception(f'Unknown SQLite profile "{profile}". Available: {", ".join(PERFORMANCE_PROFILES)}.')
+
         self._connection_str = connection_str
+        self._profile = profile
         self._engine: Engine = create_engine(self._connection_str, echo=False)
+        event.listen(self._engine, 'connect', self._apply_profile)
         self._connection: Union[Connection, None] = None
         self._session: Union[None, Session] = None
 
+    @property
+    def profile(self) -> str:
+        """Property to get the name of the performance profile in use.
+
+        Returns:
+            A string representing the profile name.
+        """
+        return self._profile
+
+    def _apply_profile(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Applies the performance profile pragmas to a new DBAPI connection.
+
+        Args:
+            dbapi_connection: The raw sqlite3 connection.
+            connection_record: The pool record of the connection.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in PERFORMANCE_PROFILES[self._profile].items():
+                cursor.execute(f'PRAGMA {pragma} = {value}')
+        finally:
+            cursor.close()
+
+    def get_pragmas(self) -> Dict[str, Any]:
+        """Reads the pragmas that are actually active on a connection.
+
+        Returns:
+            A dictionary mapping each profile pragma to its current value.
+        """
+        connection = self._engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            pragmas = {}
+            for pragma in PERFORMANCE_PROFILES[self._profile]:
+                row = cursor.execute(f'PRAGMA {pragma}').fetchone()
+                pragmas[pragma] = row[0] if row else None
+            cursor.close()
+            return pragmas
+        finally:
+            connection.close()
+
+    def migrate(self, migrator: Union[SchemaMigrator, None] = None) -> int:
+        """Brings the database schema to the latest version.
+
+        Args:
+            migrator: An optional SchemaMigrator. Defaults to one with every known migration.
+
+        Returns:
+            The number of applied migrations, 0 when the schema was already up to date.
+        """
+        migrator = migrator if migrator is not None else SchemaMigrator()
+        connection = self._engine.raw_connection()
+        try:
+            return migrator.migrate(connection.driver_connection)
+        finally:
+            connection.close()
+
+    def get_schema_version(self) -> int:
+        """Reads the schema version stamped in the database.
+
+        Returns:
+            An integer representing the schema version.
+        """
+        connection = self._engine.raw_connection()
+        try:
+            return SchemaMigrator.get_version(connection.driver_connection)
+        finally:
+            connection.close()
+
     def __enter__(self):
         """Context manager enter method to connect to the database."""
         self.connect()
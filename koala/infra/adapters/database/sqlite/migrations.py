@@ -0,0 +1,293 @@
+# built-in
+from collections import defaultdict
+from dataclasses import dataclass
+import hashlib
+import logging
+import sqlite3
+from typing import Any, Callable, Dict, Sequence, Set
+
+@dataclass(frozen=True)
+class Migration:
+    """Data class to represent a schema migration step.
+
+    Attributes:
+        version: The schema version the database is at after the step.
+        description: A short description of the step.
+        upgrade: A callable applying the step to a sqlite3 connection, inside a transaction.
+    """
+    version: int
+    description: str
+    upgrade: Callable[[sqlite3.Connection], None]
+
+def _columns(connection: sqlite3.Connection, table: str) -> Set[str]:
+    """Lists the columns of a table.
+
+    Args:
+        connection: A sqlite3 connection.
+        table: The name of the table.
+
+    Returns:
+        A set with the column names, empty if the table does not exist.
+    """
+    return {row[1] for row in connection.execute(f'PRAGMA table_info({table})')}
+
+def _create_expenses(connection: sqlite3.Connection) -> None:
+    """Creates the expenses table as first released."""
+    connection.execute('CREATE TABLE IF NOT EXISTS expenses ('
+                       'id INTEGER NOT NULL, '
+                       'created_at DATETIME, '
+                       'updated_at DATETIME, '
+                       'purchased_at DATETIME NOT NULL, '
+                       'name VARCHAR NOT NULL, '
+                       'type VARCHAR(11) NOT NULL, '
+                       'installment_of INTEGER, '
+                       'installment_to INTEGER, '
+                       'amount FLOAT NOT NULL, '
+                       'PRIMARY KEY (id), '
+                       'UNIQUE (id))')
+
+def _add_expense_fingerprint(connection: sqlite3.Connection) -> None:
+    """Adds the columns and unique index that make expense imports idempotent."""
+    columns = _columns(connection, 'expenses')
+    if 'source_statement' not in columns:
+        connection.execute('ALTER TABLE expenses ADD COLUMN source_statement VARCHAR')
+    if 'fingerprint' not in columns:
+        connection.execute('ALTER TABLE expenses ADD COLUMN fingerprint VARCHAR(64)')
+    connection.execute('CREATE UNIQUE INDEX IF NOT EXISTS ix_expenses_fingerprint ON expenses (fingerprint)')
+
+def _add_expense_query_indexes(connection: sqlite3.Connection) -> None:
+    """Adds the indexes used by the expense reports."""
+    connection.execute('CREATE INDEX IF NOT EXISTS ix_expenses_purchased_at ON expenses (purchased_at)')
+    connection.execute('CREATE INDEX IF NOT EXISTS ix_expenses_type ON expenses (type)')
+
+def _create_monthly_totals(connection: sqlite3.Connection) -> None:
+    """Creates the monthly totals rollup and fills it from the stored expenses."""
+    connection.execute('CREATE TABLE IF NOT EXISTS monthly_totals ('
+                       'month VARCHAR(7) NOT NULL, '
+                       'type VARCHAR(11) NOT NULL, '
+                       'total FLOAT NOT NULL, '
+                       'count INTEGER NOT NULL, '
+                       'updated_at DATETIME, '
+                       'PRIMARY KEY (month, type))')
+    _fill_monthly_totals(connection)
+
+def _fill_monthly_totals(connection: sqlite3.Connection) -> None:
+    """Recomputes the monthly totals rollup from the stored expenses."""
+    connection.execute('DELETE FROM monthly_totals')
+    connection.execute("INSERT INTO monthly_totals (month, type, total, count, updated_at) "
+                       "SELECT strftime('%Y-%m', purchased_at), type, sum(amount), count(id), datetime('now') "
+                       "FROM expenses GROUP BY strftime('%Y-%m', purchased_at), type")
+
+def _add_expense_updated_at_index(connection: sqlite3.Connection) -> None:
+    """Adds the index used by incremental exports."""
+    connection.execute('CREATE INDEX IF NOT EXISTS ix_expenses_updated_at ON expenses (updated_at)')
+
+def _create_statements(connection: sqlite3.Connection) -> None:
+    """Creates the ledger of imported statements and links the expenses to it."""
+    connection.execute('CREATE TABLE IF NOT EXISTS statements ('
+                       'id INTEGER NOT NULL, '
+                       'created_at DATETIME, '
+                       'updated_at DATETIME, '
+                       'hash VARCHAR(64) NOT NULL, '
+                       'bank VARCHAR NOT NULL, '
+                       'period VARCHAR(7), '
+                       'page_count INTEGER, '
+                       'row_count INTEGER NOT NULL, '
+                       'imported_at DATETIME NOT NULL, '
+                       'PRIMARY KEY (id))')
+    connection.execute('CREATE UNIQUE INDEX IF NOT EXISTS ix_statements_hash ON statements (hash)')
+    if 'statement_id' not in _columns(connection, 'expenses'):
+        connection.execute('ALTER TABLE expenses ADD COLUMN statement_id INTEGER REFERENCES statements (id)')
+    connection.execute('CREATE INDEX IF NOT EXISTS ix_expenses_statement_id ON expenses (statement_id)')
+
+def _expense_fingerprint_v7(purchased_at: Any,
+                            name: str,
+                            amount: float,
+                            installment_of: Any,
+                            installment_to: Any,
+                            source_statement: Any,
+                            occurrence: int) -> str:
+    """Builds the expense fingerprint as `Expense.fingerprint` did when version 7 was released.
+
+    It is frozen here, so this migration keeps producing the same keys whatever later
+    changes are made to the entity.
+    """
+    key = '|'.join((str(purchased_at)[:10],
+                    ' '.join(name.split()).casefold(),
+                    f'{float(amount):.2f}',
+                    str(installment_of or ''),
+                    str(installment_to or ''),
+                    source_statement or '',
+                    str(occurrence)))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def _backfill_expense_fingerprints(connection: sqlite3.Connection) -> None:
+    """Fingerprints the expenses stored before imports were idempotent.
+
+    Without a fingerprint these expenses never conflict with a new import, so importing their
+    statement again would duplicate them. Identical expenses are numbered in insertion order,
+    like the expenses of an import batch, and an occurrence already taken by a fingerprinted
+    expense is skipped. The monthly totals are rebuilt afterwards.
+    """
+    rows = connection.execute('SELECT id, purchased_at, name, amount, installment_of, installment_to, source_statement '
+                              'FROM expenses WHERE fingerprint IS NULL ORDER BY id').fetchall()
+    occurrences: Dict[str, int] = defaultdict(int)
+    for id, *values in rows:
+        base = _expense_fingerprint_v7(*values, occurrence=0)
+        while True:
+            fingerprint = _expense_fingerprint_v7(*values, occurrence=occurrences[base])
+            occurrences[base] += 1
+            if connection.execute('SELECT 1 FROM expenses WHERE fingerprint = ?', (fingerprint,)).fetchone() is None:
+                break
+        connection.execute('UPDATE expenses SET fingerprint = ? WHERE id = ?', (fingerprint, id))
+
+    if rows:
+        logging.info(f'Fingerprinted {len(rows)} expenses imported before fingerprints existed.')
+    _fill_monthly_totals(connection)
+
+def _expense_fingerprint_v8(purchased_at: Any,
+                            name: str,
+                            amount: float,
+                            installment_of: Any,
+                            installment_to: Any,
+                            source_statement: Any,
+                            occurrence: int) -> str:
+    """Builds the expense fingerprint as `Expense.fingerprint` did when version 8 was released.
+
+    An installment is keyed by the month of the first installment of its plan instead of its
+    own date. Frozen for the same reason as `_expense_fingerprint_v7`.
+    """
+    date_key = str(purchased_at)[:10]
+    if installment_of is not None:
+        month = int(date_key[:4]) * 12 + int(date_key[5:7]) - int(installment_of)
+        date_key = f'{month // 12:04d}-{month % 12 + 1:02d}'
+
+    key = '|'.join((date_key,
+                    ' '.join(name.split()).casefold(),
+                    f'{float(amount):.2f}',
+                    str(installment_of or ''),
+                    str(installment_to or ''),
+                    source_statement or '',
+                    str(occurrence)))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+def _refingerprint_installments(connection: sqlite3.Connection) -> None:
+    """Keys the stored installments by the month their plan started.
+
+    Installments were keyed by their own date, so one projected from a purchase on the 31st
+    and the row a later statement carried for it were stored twice whenever the day had been
+    clamped to a shorter month. Identical installments are numbered in insertion order. The
+    new keys never clash with the old ones, which always carry a full date.
+    """
+    rows = connection.execute('SELECT id, purchased_at, name, amount, installment_of, installment_to, source_statement '
+                              'FROM expenses WHERE installment_of IS NOT NULL ORDER BY id').fetchall()
+    occurrences: Dict[str, int] = defaultdict(int)
+    for id, *values in rows:
+        base = _expense_fingerprint_v8(*values, occurrence=0)
+        fingerprint = _expense_fingerprint_v8(*values, occurrence=occurrences[base])
+        occurrences[base] += 1
+        connection.execute('UPDATE expenses SET fingerprint = ? WHERE id = ?', (fingerprint, id))
+
+    if rows:
+        logging.info(f'Fingerprinted again {len(rows)} installments by the month their plan started.')
+
+# Ordered schema history. Append new steps with the next version and never edit a released
+# one. Steps must also cope with databases created before versioning, which start at version
+# 0 whatever tables they already have. Keep the SQLAlchemy models in sync with the result.
+MIGRATIONS: Sequence[Migration] = (
+    Migration(version=1, description='Create the expenses table', upgrade=_create_expenses),
+    Migration(version=2, description='Add the expense fingerprint and source statement', upgrade=_add_expense_fingerprint),
+    Migration(version=3, description='Index expenses by purchase date and type', upgrade=_add_expense_query_indexes),
+    Migration(version=4, description='Create the monthly totals rollup', upgrade=_create_monthly_totals),
+    Migration(version=5, description='Index expenses by update time', upgrade=_add_expense_updated_at_index),
+    Migration(version=6, description='Create the imported statements ledger', upgrade=_create_statements),
+    Migration(version=7, description='Fingerprint the expenses stored before version 2', upgrade=_backfill_expense_fingerprints),
+    Migration(version=8, description='Key installments by the month their plan started', upgrade=_refingerprint_installments),
+)
+
+class SchemaMigrator:
+    """Brings a SQLite database to the latest schema version.
+
+    The version is stamped in `PRAGMA user_version`, so a database that is up to date costs
+    a single integer read. Each pending step runs in its own write transaction together with
+    its version stamp, so an interrupted upgrade resumes from the last completed step and
+    concurrent processes never apply the same step twice.
+
+    Attributes:
+        migrations: The ordered sequence of Migration steps.
+    """
+
+    def __init__(self, migrations: Sequence[Migration] = MIGRATIONS) -> None:
+        """Initializes SchemaMigrator with the given migrations.
+
+        Args:
+            migrations: The ordered sequence of Migration steps. Defaults to MIGRATIONS.
+
+        Raises:
+            Exception: If the versions are not consecutive, starting from 1.
+        """
+        if [migration.version for migration in migrations] != list(range(1, len(migrations) + 1)):
+            raise Exception('Migration versions must be consecutive, starting from 1.')
+        self.migrations = migrations
+
+    @property
+    def latest_version(self) -> int:
+        """Property to get the schema version after every migration.
+
+        Returns:
+            An integer representing the latest schema version.
+        """
+        return len(self.migrations)
+
+    @staticmethod
+    def get_version(connection: sqlite3.Connection) -> int:
+        """Reads the schema version of a database.
+
+        Args:
+            connection: A sqlite3 connection.
+
+        Returns:
+            An integer representing the schema version, 0 for unversioned databases.
+        """
+        return connection.execute('PRAGMA user_version').fetchone()[0]
+
+    def migrate(self, connection: sqlite3.Connection) -> int:
+        """Applies every pending migration.
+
+        Args:
+            connection: A sqlite3 connection.
+
+        Returns:
+            The number of applied migrations.
+
+        Raises:
+            Exception: If the database is newer than the known migrations.
+        """
+        version = self.get_version(connection)
+        if version == self.latest_version:
+            return 0
+
+        if version > self.latest_version:
+            raise Exception(f'The database schema version {version} is newer than the supported '
+                            f'version {self.latest_version}.')
+
+        applied = 0
+        isolation_level = connection.isolation_level
+        connection.isolation_level = None
+        try:
+            for migration in self.migrations[version:]:
+                connection.execute('BEGIN IMMEDIATE')
+                try:
+                    if self.get_version(connection) < migration.version:
+                        logging.info(f'Migrating the database to version {migration.version}: {migration.description}.')
+                        migration.upgrade(connection)
+                        connection.execute(f'PRAGMA user_version = {migration.version}')
+                        applied += 1
+                    connection.execute('COMMIT')
+                except Exception:
+                    connection.execute('ROLLBACK')
+                    raise
+        finally:
+            connection.isolation_level = isolation_level
+
+        return applied
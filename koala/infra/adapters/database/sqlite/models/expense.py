@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, Float, Integer, String
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String
 
 from koala.infra.adapters.database.sqlite.models.base import Base
 
@@ -20,6 +20,9 @@ class Expense(Base):
         installment_of: An Integer column representing the current installment number.
         installment_to: An Integer column representing the total number of installments.
         amount: A Float column representing the amount of the expense.
+        source_statement: A String column identifying the statement the expense was imported from.
+        fingerprint: A String column holding the natural key of the expense, unique across the table.
+        statement_id: An Integer column referencing the statement the expense was imported with.
     """
     __tablename__ = 'expenses'
 
@@ -32,13 +35,16 @@ class Expense(Base):
                         default=datetime.utcnow)
     updated_at = Column(DateTime, 
                         default=datetime.utcnow, 
-                        onupdate=datetime.utcnow)
+                        onupdate=datetime.utcnow,
+                        index=True)
     purchased_at = Column(DateTime, 
-                          nullable=False)
+                          nullable=False,
+                          index=True)
     name = Column(String, 
                   nullable=False)
     type = Column(Enum('fixed', 'variable', 'installment'),
-                  nullable=False)
+                  nullable=False,
+                  index=True)
     installment_of = Column(Integer,
                             nullable=True,
                             default=None)
@@ -48,3 +54,15 @@ class Expense(Base):
     amount = Column(Float(2), 
                     nullable=False, 
                     default=0.0)
+    source_statement = Column(String,
+                              nullable=True,
+                              default=None)
+    fingerprint = Column(String(64),
+                         nullable=True,
+                         unique=True,
+                         index=True)
+    statement_id = Column(Integer,
+                          ForeignKey('statements.id'),
+                          nullable=True,
+                          default=None,
+                          index=True)
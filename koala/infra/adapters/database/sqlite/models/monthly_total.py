@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, Float, Integer, String
+
+from koala.infra.adapters.database.sqlite.models.base import Base
+
+class MonthlyTotal(Base):
+    """SQLAlchemy model for the monthly expenses rollup.
+
+    This class maps the aggregated expenses of each month and type to a SQL table. It is
+    maintained incrementally by the expenses repository, in the same transaction as the
+    inserts, and can be rebuilt from the expenses table at any time.
+
+    Attributes:
+        __tablename__: A string representing the name of the table in the database.
+        month: A String column representing the month, formatted as YYYY-MM.
+        type: An Enum column representing the type of the aggregated expenses.
+        total: A Float column representing the sum of the expense amounts.
+        count: An Integer column representing the number of expenses.
+        updated_at: A DateTime column representing when the row was last updated.
+    """
+    __tablename__ = 'monthly_totals'
+
+    month = Column(String(7),
+                   primary_key=True,
+                   nullable=False)
+    type = Column(Enum('fixed', 'variable', 'installment'),
+                  primary_key=True,
+                  nullable=False)
+    total = Column(Float(2),
+                   nullable=False,
+                   default=0.0)
+    count = Column(Integer,
+                   nullable=False,
+                   default=0)
+    updated_at = Column(DateTime, 
+                        default=datetime.utcnow, 
+                        onupdate=datetime.utcnow)
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from koala.infra.adapters.database.sqlite.models.base import Base
+
+class Statement(Base):
+    """SQLAlchemy model for the Statement entity.
+
+    This class maps the ledger of imported statement files to a SQL table. A file whose
+    content hash is already stored is skipped by the importer without being opened.
+
+    Attributes:
+        __tablename__: A string representing the name of the table in the database.
+        id: An integer column serving as the unique identifier for each statement.
+        created_at: A DateTime column representing when the statement was created.
+        updated_at: A DateTime column representing when the statement was last updated.
+        hash: A String column holding the SHA-256 hex digest of the file content, unique across the table.
+        bank: A String column representing the name of the extractor that imported the statement.
+        period: A String column representing the month of the latest purchase, formatted as YYYY-MM.
+        page_count: An Integer column representing the number of pages of the statement.
+        row_count: An Integer column representing the number of extracted expenses.
+        imported_at: A DateTime column representing when the statement was imported.
+    """
+    __tablename__ = 'statements'
+
+    id = Column(Integer,
+                autoincrement=True,
+                primary_key=True,
+                nullable=False)
+    created_at = Column(DateTime,
+                        default=datetime.utcnow)
+    updated_at = Column(DateTime,
+                        default=datetime.utcnow,
+                        onupdate=datetime.utcnow)
+    hash = Column(String(64),
+                  nullable=False,
+                  unique=True,
+                  index=True)
+    bank = Column(String,
+                  nullable=False)
+    period = Column(String(7),
+                    nullable=True,
+                    default=None)
+    page_count = Column(Integer,
+                        nullable=True,
+                        default=None)
+    row_count = Column(Integer,
+                       nullable=False,
+                       default=0)
+    imported_at = Column(DateTime,
+                         nullable=False,
+                         default=datetime.utcnow)
@@ -0,0 +1,151 @@
+# built-in
+from contextlib import contextmanager
+import csv
+from datetime import datetime
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
+
+# entities
+from koala.domain.entities.expense import Expense
+
+# interfaces
+from koala.infra.core.interfaces.expense_exporter import IExpenseExporter
+
+# Exported columns, in order.
+COLUMNS: Tuple[str, ...] = ('id', 'created_at', 'updated_at', 'purchased_at', 'name', 'type', 'amount',
+                            'installment_of', 'installment_to', 'source_statement', 'statement_id')
+
+def to_record(expense: Expense) -> Dict[str, Any]:
+    """Converts an expense to a flat record of JSON-compatible values.
+
+    Args:
+        expense: An Expense entity.
+
+    Returns:
+        A dictionary mapping every column to its value, with dates in ISO 8601.
+    """
+    record = expense.to_dict()
+    for column in ('created_at', 'updated_at', 'purchased_at'):
+        if isinstance(record[column], datetime):
+            record[column] = record[column].isoformat()
+    record['type'] = expense.type.value
+
+    return {column: record[column] for column in COLUMNS}
+
+@contextmanager
+def open_text(destination: str) -> Iterator[TextIO]:
+    """Opens a text destination, where "-" is the standard output.
+
+    Args:
+        destination: A file path or "-".
+
+    Yields:
+        The text stream, closed on exit unless it is the standard output.
+    """
+    if destination == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+
+    with open(destination, 'w', encoding='utf-8', newline='') as stream:
+        yield stream
+
+class CsvExpenseExporter(IExpenseExporter):
+    """Writes expenses as CSV with a header row, one batch at a time."""
+
+    def write(self,
+              batches: Iterable[List[Expense]],
+              destination: str) -> None:
+        """Writes batches of expenses as CSV.
+
+        Args:
+            batches: An iterable of lists of Expense entities.
+            destination: The file path to write to, or "-" for the standard output.
+        """
+        with open_text(destination) as stream:
+            writer = csv.DictWriter(stream, fieldnames=COLUMNS)
+            writer.writeheader()
+            for batch in batches:
+                writer.writerows(to_record(expense) for expense in batch)
+
+class JsonLinesExpenseExporter(IExpenseExporter):
+    """Writes expenses as JSON Lines, one object per line, one batch at a time."""
+
+    def write(self,
+              batches: Iterable[List[Expense]],
+              destination: str) -> None:
+        """Writes batches of expenses as JSON Lines.
+
+        Args:
+            batches: An iterable of lists of Expense entities.
+            destination: The file path to write to, or "-" for the standard output.
+        """
+        with open_text(destination) as stream:
+            for batch in batches:
+                stream.writelines(json.dumps(to_record(expense), ensure_ascii=False) + '\n' for expense in batch)
+
+class ParquetExpenseExporter(IExpenseExporter):
+    """Writes expenses as Parquet, one row group per batch.
+
+    pyarrow is an optional dependency, imported only when a Parquet export runs.
+
+    Attributes:
+        compression: The Parquet compression codec.
+    """
+
+    def __init__(self, compression: str = 'snappy') -> None:
+        """Initializes ParquetExpenseExporter with the given compression.
+
+        Args:
+            compression: The Parquet compression codec. Defaults to "snappy".
+        """
+        self.compression = compression
+
+    def write(self,
+              batches: Iterable[List[Expense]],
+              destination: str) -> None:
+        """Writes batches of expenses as Parquet.
+
+        Args:
+            batches: An iterable of lists of Expense entities.
+            destination: The file path to write to.
+
+        Raises:
+            Exception: If pyarrow is not installed or the destination is the standard output.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise Exception('Exporting to Parquet requires pyarrow. Install it with `pip install pyarrow`.')
+
+        if destination == '-':
+            raise Exception('Parquet exports must be written to a file.')
+
+        schema = pyarrow.schema([('id', pyarrow.int64()),
+                                 ('created_at', pyarrow.timestamp('us')),
+                                 ('updated_at', pyarrow.timestamp('us')),
+                                 ('purchased_at', pyarrow.timestamp('us')),
+                                 ('name', pyarrow.string()),
+                                 ('type', pyarrow.string()),
+                                 ('amount', pyarrow.float64()),
+                                 ('installment_of', pyarrow.int64()),
+                                 ('installment_to', pyarrow.int64()),
+                                 ('source_statement', pyarrow.string()),
+                                 ('statement_id', pyarrow.int64())])
+
+        with pyarrow.parquet.ParquetWriter(destination, schema, compression=self.compression) as writer:
+            for batch in batches:
+                writer.write_table(pyarrow.Table.from_pydict({'id': [expense.id for expense in batch],
+                                                              'created_at': [expense.created_at for expense in batch],
+                                                              'updated_at': [expense.updated_at for expense in batch],
+                                                              'purchased_at': [expense.purchased_at for expense in batch],
+                                                              'name': [expense.name for expense in batch],
+                                                              'type': [expense.type.value for expense in batch],
+                                                              'amount': [expense.amount for expense in batch],
+                                                              'installment_of': [expense.installment_of for expense in batch],
+                                                              'installment_to': [expense.installment_to for expense in batch],
+                                                              'source_statement': [expense.source_statement for expense in batch],
+                                                              'statement_id': [expense.statement_id for expense in batch]},
+                                                             schema=schema))
@@ -1,17 +1,28 @@
 # built-in
-from typing import cast
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Sequence, Set, Tuple, Union, cast
 
 # third-party
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
 
 # entities
-from koala.domain.entities.expense import Expense
+from koala.domain.entities.expense import Expense, ExpenseType
+from koala.domain.entities.statement import Statement
 
 # models
 from koala.infra.adapters.database.sqlite.models.expense import Expense as ExpenseModel
+from koala.infra.adapters.database.sqlite.models.monthly_total import MonthlyTotal as MonthlyTotalModel
+from koala.infra.adapters.database.sqlite.models.statement import Statement as StatementModel
 
 # interfaces
-from koala.infra.core.interfaces.expense_repository import IExpensesRepository
+from koala.infra.core.interfaces.expense_repository import (CreateExpensesResult, 
+                                                            ExpenseFilters, 
+                                                            IExpensesRepository, 
+                                                            MonthlyTotal)
+from koala.infra.core.utils.profiler import Profiler
 
 class ExpensesRepository(IExpensesRepository):
     """Implements the IExpensesRepository interface for SQLite databases.
@@ -20,16 +31,20 @@ class ExpensesRepository(IExpensesRepository):
 
     Attributes:
         _session: A Session object for the SQLite database.
+        _chunk_size: The number of rows fetched at a time by streaming queries.
     """
 
     def __init__(self, 
-                 session: Session) -> None:
+                 session: Session,
+                 chunk_size: int = 1000) -> None:
         """Initializes ExpensesRepository with a given SQLAlchemy session.
 
         Args:
             session: A Session object for the SQLite database.
+            chunk_size: The number of rows fetched at a time by streaming queries. Defaults to 1000.
         """
         self._session = session
+        self._chunk_size = chunk_size
 
     def create_expense(self, 
                        expense: Expense) -> Expense:
@@ -39,15 +54,424 @@ class ExpensesRepository(IExpensesRepository):
             expense: An Expense entity to be created in the database.
 
         Returns:
-            The created Expense entity with its ID updated.
+            The created Expense entity with its ID updated. If the expense was already stored,
+            the ID of the stored row is used instead.
         """
-        model = ExpenseModel(purchased_at=expense.purchased_at,
-                             name=expense.name,
-                             type=expense.type.value,
-                             amount=expense.amount,
-                             installment_of=expense.installment_of,
-                             installment_to=expense.installment_to)
-        self._session.add(model)
-        self._session.commit()
-        expense.id = cast(int, model.id)
-        return expense
\ No newline at end of file
+        result = self.create_expenses(expenses=[expense])
+        if result.skipped:
+            expense.id = cast(int, self._session.scalar(select(ExpenseModel.id)
+                                                        .where(ExpenseModel.fingerprint == expense.fingerprint())))
+        return expense
+
+    def create_expenses(self, 
+                        expenses: Sequence[Expense],
+                        statement: Union[Statement, None] = None) -> CreateExpensesResult:
+        """Creates many Expense entities in the SQLite database within a single transaction.
+
+        The rows are sent as one executemany-style INSERT ... ON CONFLICT DO NOTHING statement
+        against the unique fingerprint index, so the whole batch costs a single commit and
+        expenses that were already imported are skipped by SQLite itself. The monthly totals
+        of the inserted expenses, and the statement they were extracted from, are written in
+        the same transaction, so a statement is only recorded along with its expenses.
+
+        Args:
+            expenses: A sequence of Expense entities to be created in the database.
+            statement: An optional Statement the expenses were extracted from. Its ID is
+                updated and the inserted expenses are linked to it.
+
+        Returns:
+            A CreateExpensesResult telling the inserted entities apart from the skipped ones.
+        """
+        if not expenses and statement is None:
+            return CreateExpensesResult()
+
+        with Profiler.span('repository.fingerprint'):
+            occurrences: Dict[str, int] = defaultdict(int)
+            fingerprints = []
+            for expense in expenses:
+                base = expense.fingerprint()
+                fingerprints.append(expense.fingerprint(occurrence=occurrences[base]))
+                occurrences[base] += 1
+
+        statement_id = None
+        try:
+            if statement is not None:
+                statement_id = self._record_statement(statement)
+
+            rows = [{'purchased_at': expense.purchased_at,
+                     'name': expense.name,
+                     'type': expense.type.value,
+                     'amount': expense.amount,
+                     'installment_of': expense.installment_of,
+                     'installment_to': expense.installment_to,
+                     'source_statement': expense.source_statement,
+                     'statement_id': statement_id if statement_id is not None else expense.statement_id,
+                     'fingerprint': fingerprint} for expense, fingerprint in zip(expenses, fingerprints)]
+
+            ids: Dict[str, Any] = {}
+            if rows:
+                statement_insert = insert(ExpenseModel) \
+                    .on_conflict_do_nothing(index_elements=[ExpenseModel.fingerprint]) \
+                    .returning(ExpenseModel.id, ExpenseModel.fingerprint)
+                with Profiler.span('repository.insert'):
+                    ids = {fingerprint: id for id, fingerprint in self._session.execute(statement_insert, rows)}
+
+            result = CreateExpensesResult()
+            for expense, fingerprint in zip(expenses, fingerprints):
+                if fingerprint in ids:
+                    expense.id = cast(int, ids[fingerprint])
+                    if statement_id is not None:
+                        expense.statement_id = statement_id
+                    result.inserted.append(expense)
+                else:
+                    result.skipped.append(expense)
+
+            with Profiler.span('repository.monthly_totals'):
+                self._add_to_monthly_totals(result.inserted)
+            with Profiler.span('repository.commit'):
+                self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+        if statement is not None:
+            statement.id = cast(int, statement_id)
+        return result
+
+    def _record_statement(self, 
+                          statement: Statement) -> int:
+        """Records an imported statement, without committing.
+
+        A statement whose hash is already recorded, because it is being scanned again, has
+        its row refreshed and keeps its ID.
+
+        Args:
+            statement: The Statement entity to be recorded.
+
+        Returns:
+            The ID of the statement row.
+        """
+        statement_id = self._session.scalar(insert(StatementModel)
+                                            .values(hash=statement.hash,
+                                                    bank=statement.bank,
+                                                    period=statement.period,
+                                                    page_count=statement.page_count,
+                                                    row_count=statement.row_count,
+                                                    imported_at=statement.imported_at)
+                                            .on_conflict_do_update(index_elements=[StatementModel.hash],
+                                                                   set_={'bank': statement.bank,
+                                                                         'period': statement.period,
+                                                                         'page_count': statement.page_count,
+                                                                         'row_count': statement.row_count,
+                                                                         'imported_at': statement.imported_at,
+                                                                         'updated_at': datetime.utcnow()})
+                                            .returning(StatementModel.id))
+        return cast(int, statement_id)
+
+    def find_imported_statements(self, 
+                                 hashes: Sequence[str]) -> Set[str]:
+        """Tells which statement files were already imported.
+
+        The hashes are looked up in chunks against the unique hash index.
+
+        Args:
+            hashes: A sequence of statement content hashes.
+
+        Returns:
+            The subset of the hashes that belong to recorded statements.
+        """
+        imported: Set[str] = set()
+        unique_hashes = list(dict.fromkeys(hashes))
+        # SQLite before 3.32 binds at most 999 parameters per statement.
+        step = min(self._chunk_size, 500)
+        for start in range(0, len(unique_hashes), step):
+            chunk = unique_hashes[start:start + step]
+            imported.update(self._session.scalars(select(StatementModel.hash).where(StatementModel.hash.in_(chunk))))
+        return imported
+
+    def _add_to_monthly_totals(self, 
+                               expenses: Sequence[Expense]) -> None:
+        """Adds some newly inserted expenses to the monthly totals, without committing.
+
+        Args:
+            expenses: A sequence of Expense entities that were just inserted.
+        """
+        totals: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0.0, 0])
+        for expense in expenses:
+            total = totals[(expense.purchased_at.strftime('%Y-%m'), expense.type.value)]
+            total[0] += float(expense.amount)
+            total[1] += 1
+
+        if not totals:
+            return
+
+        statement = insert(MonthlyTotalModel)
+        statement = statement.on_conflict_do_update(index_elements=[MonthlyTotalModel.month, MonthlyTotalModel.type],
+                                                    set_={'total': MonthlyTotalModel.total + statement.excluded.total,
+                                                          'count': MonthlyTotalModel.count + statement.excluded.count,
+                                                          'updated_at': datetime.utcnow()})
+        self._session.execute(statement, [{'month': month, 'type': type, 'total': total, 'count': count} 
+                                          for (month, type), (total, count) in totals.items()])
+
+    def rebuild_monthly_totals(self) -> int:
+        """Recomputes the monthly totals from the expenses table, repairing any drift.
+
+        Returns:
+            The number of monthly totals rows after the rebuild.
+        """
+        month = func.strftime('%Y-%m', ExpenseModel.purchased_at)
+        try:
+            self._session.execute(delete(MonthlyTotalModel))
+            self._session.execute(insert(MonthlyTotalModel).from_select(
+                ['month', 'type', 'total', 'count', 'updated_at'],
+                select(month, 
+                       ExpenseModel.type, 
+                       func.sum(ExpenseModel.amount), 
+                       func.count(ExpenseModel.id), 
+                       func.datetime('now'))
+                .group_by(month, ExpenseModel.type)))
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+        return cast(int, self._session.scalar(select(func.count()).select_from(MonthlyTotalModel)))
+
+    def find_merchant_types(self) -> Dict[str, ExpenseType]:
+        """Tells the type each merchant was classified with.
+
+        The expenses are grouped by name and type inside SQLite, so a single row per
+        distinct merchant and type is transferred. Ties between both types go to the type
+        used most recently.
+
+        Returns:
+            A dictionary mapping normalized merchant names to their types.
+        """
+        statement = select(ExpenseModel.name,
+                           ExpenseModel.type,
+                           func.count(ExpenseModel.id).label('count'),
+                           func.max(ExpenseModel.purchased_at).label('last_purchased_at')) \
+            .where(ExpenseModel.type.in_([ExpenseType.FIXED.value, ExpenseType.VARIABLE.value])) \
+            .group_by(ExpenseModel.name, ExpenseModel.type) \
+            .execution_options(yield_per=self._chunk_size)
+
+        votes: Dict[str, Dict[ExpenseType, List[Any]]] = defaultdict(dict)
+        for row in self._session.execute(statement):
+            vote = votes[Expense.normalize_name(row.name)].setdefault(ExpenseType(row.type), [0, row.last_purchased_at])
+            vote[0] += row.count
+            vote[1] = max(vote[1], row.last_purchased_at)
+
+        return {merchant: max(types.items(), key=lambda item: (item[1][0], item[1][1]))[0] 
+                for merchant, types in votes.items()}
+
+    def _apply_filters(self, 
+                       statement: Select, 
+                       filters: ExpenseFilters) -> Select:
+        """Adds the WHERE clauses of some filters to a statement.
+
+        Args:
+            statement: A SELECT statement over the expenses table.
+            filters: An ExpenseFilters object.
+
+        Returns:
+            The filtered SELECT statement.
+        """
+        conditions: List[Any] = []
+        if filters.start is not None:
+            conditions.append(ExpenseModel.purchased_at >= filters.start)
+        if filters.end is not None:
+            conditions.append(ExpenseModel.purchased_at <= filters.end)
+        if filters.type is not None:
+            conditions.append(ExpenseModel.type == filters.type.value)
+        if filters.name_prefix:
+            conditions.append(ExpenseModel.name.startswith(filters.name_prefix, autoescape=True))
+        if filters.installment_to is not None:
+            conditions.append(ExpenseModel.installment_to == filters.installment_to)
+        if filters.updated_since is not None:
+            conditions.append(ExpenseModel.updated_at > filters.updated_since)
+
+        return statement.where(*conditions) if conditions else statement
+
+    def _select_expenses(self, 
+                         filters: ExpenseFilters) -> Select:
+        """Builds the SELECT of the plain expense columns matching some filters.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Returns:
+            The filtered SELECT statement, without any ordering.
+        """
+        return self._apply_filters(select(ExpenseModel.id,
+                                          ExpenseModel.created_at,
+                                          ExpenseModel.updated_at,
+                                          ExpenseModel.purchased_at,
+                                          ExpenseModel.name,
+                                          ExpenseModel.type,
+                                          ExpenseModel.amount,
+                                          ExpenseModel.installment_of,
+                                          ExpenseModel.installment_to,
+                                          ExpenseModel.source_statement,
+                                          ExpenseModel.statement_id), filters)
+
+    @staticmethod
+    def _to_expense(row: Any) -> Expense:
+        """Builds an Expense entity from a row of `_select_expenses`.
+
+        Args:
+            row: A row with the plain expense columns.
+
+        Returns:
+            The Expense entity.
+        """
+        return Expense(purchased_at=row.purchased_at,
+                       name=row.name,
+                       type=ExpenseType(row.type),
+                       amount=row.amount,
+                       installment_of=row.installment_of,
+                       installment_to=row.installment_to,
+                       source_statement=row.source_statement,
+                       statement_id=row.statement_id,
+                       id=row.id,
+                       created_at=row.created_at,
+                       updated_at=row.updated_at)
+
+    def find_expenses(self, 
+                      filters: ExpenseFilters) -> Iterator[Expense]:
+        """Streams the Expense entities matching some filters.
+
+        Plain rows are fetched `chunk_size` at a time, so no ORM objects are kept around
+        and memory does not grow with the result.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Yields:
+            Expense entities ordered by purchase date.
+        """
+        statement = self._select_expenses(filters) \
+            .order_by(ExpenseModel.purchased_at, ExpenseModel.id) \
+            .execution_options(yield_per=self._chunk_size)
+
+        for row in self._session.execute(statement):
+            yield self._to_expense(row)
+
+    def find_expense_batches(self, 
+                             filters: ExpenseFilters, 
+                             batch_size: Union[int, None] = None) -> Iterator[List[Expense]]:
+        """Streams the Expense entities matching some filters in fixed-size batches.
+
+        The rows are read through a server-side cursor and buffered one batch at a time, so
+        memory stays constant regardless of the table size. Ordering by the primary key
+        lets SQLite walk the table without sorting it.
+
+        Args:
+            filters: An ExpenseFilters object.
+            batch_size: The number of entities per batch. Defaults to `chunk_size`.
+
+        Yields:
+            Lists of at most `batch_size` Expense entities, ordered by ID.
+        """
+        statement = self._select_expenses(filters) \
+            .order_by(ExpenseModel.id) \
+            .execution_options(stream_results=True, 
+                               yield_per=batch_size if batch_size is not None else self._chunk_size)
+
+        for partition in self._session.execute(statement).partitions():
+            yield [self._to_expense(row) for row in partition]
+
+    def summarize_by_month(self, 
+                           filters: ExpenseFilters) -> Iterator[MonthlyTotal]:
+        """Aggregates the expenses matching some filters per month and type.
+
+        Filters made only of whole months and a type are answered from the monthly totals
+        table, in O(months) regardless of history size. Any other filter runs a GROUP BY
+        inside SQLite, so only one row per month and type is transferred.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Yields:
+            MonthlyTotal objects ordered by month and type.
+        """
+        months = self._whole_months(filters)
+        if months is not None:
+            yield from self._read_monthly_totals(filters, *months)
+            return
+
+        month = func.strftime('%Y-%m', ExpenseModel.purchased_at).label('month')
+        statement = self._apply_filters(select(month,
+                                               ExpenseModel.type,
+                                               func.sum(ExpenseModel.amount).label('total'),
+                                               func.count(ExpenseModel.id).label('count')), filters) \
+            .group_by(month, ExpenseModel.type) \
+            .order_by(month, ExpenseModel.type) \
+            .execution_options(yield_per=self._chunk_size)
+
+        for row in self._session.execute(statement):
+            yield MonthlyTotal(month=row.month,
+                               type=ExpenseType(row.type),
+                               total=row.total,
+                               count=row.count)
+
+    @staticmethod
+    def _whole_months(filters: ExpenseFilters) -> Union[Tuple[Union[str, None], Union[str, None]], None]:
+        """Checks whether some filters can be answered from the monthly totals table.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Returns:
+            The first and last months (YYYY-MM) covered by the filters, or None if the filters
+            select anything other than whole months and a type.
+        """
+        if filters.name_prefix or filters.installment_to is not None or filters.updated_since is not None:
+            return None
+
+        start = filters.start
+        if start is not None and start != datetime(start.year, start.month, 1):
+            return None
+
+        end = filters.end
+        if end is not None:
+            next_instant = end + timedelta(microseconds=1)
+            if next_instant != datetime(next_instant.year, next_instant.month, 1):
+                return None
+
+        return (start.strftime('%Y-%m') if start is not None else None,
+                end.strftime('%Y-%m') if end is not None else None)
+
+    def _read_monthly_totals(self, 
+                             filters: ExpenseFilters, 
+                             first_month: Union[str, None], 
+                             last_month: Union[str, None]) -> Iterator[MonthlyTotal]:
+        """Reads the monthly totals table.
+
+        Args:
+            filters: An ExpenseFilters object.
+            first_month: The first month included (YYYY-MM), if any.
+            last_month: The last month included (YYYY-MM), if any.
+
+        Yields:
+            MonthlyTotal objects ordered by month and type.
+        """
+        conditions: List[Any] = [MonthlyTotalModel.count > 0]
+        if first_month is not None:
+            conditions.append(MonthlyTotalModel.month >= first_month)
+        if last_month is not None:
+            conditions.append(MonthlyTotalModel.month <= last_month)
+        if filters.type is not None:
+            conditions.append(MonthlyTotalModel.type == filters.type.value)
+
+        statement = select(MonthlyTotalModel.month,
+                           MonthlyTotalModel.type,
+                           MonthlyTotalModel.total,
+                           MonthlyTotalModel.count) \
+            .where(*conditions) \
+            .order_by(MonthlyTotalModel.month, MonthlyTotalModel.type)
+
+        for row in self._session.execute(statement):
+            yield MonthlyTotal(month=row.month,
+                               type=ExpenseType(row.type),
+                               total=row.total,
+                               count=row.count)
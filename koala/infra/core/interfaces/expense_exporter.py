@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+from koala.domain.entities.expense import Expense
+
+class IExpenseExporter(ABC):
+    """Abstract base class for expense exporters.
+
+    This class defines the interface for writing expenses to an external format.
+
+    Methods:
+        write: Abstract method that must be implemented by subclasses to write batches of expenses.
+    """
+
+    @abstractmethod
+    def write(self,
+              batches: Iterable[List[Expense]],
+              destination: str) -> None:
+        """Abstract method to write batches of expenses.
+
+        This method should be implemented by subclasses to write each batch as soon as it
+        is received, keeping a single batch in memory at a time.
+
+        Args:
+            batches: An iterable of lists of Expense entities.
+            destination: The file path to write to, or "-" for the standard output when the
+                format supports it.
+        """
+        ...
@@ -1,15 +1,74 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence, Set, Union
 
-from koala.domain.entities.expense import Expense
+from koala.domain.entities.expense import Expense, ExpenseType
+from koala.domain.entities.statement import Statement
 
 
+@dataclass
+class CreateExpensesResult:
+    """Data class to represent the outcome of a conflict-ignoring batch insert.
+
+    Attributes:
+        inserted: The Expense entities that were written, with their IDs updated.
+        skipped: The Expense entities that were already stored and therefore ignored.
+    """
+    inserted: List[Expense] = field(default_factory=list)
+    skipped: List[Expense] = field(default_factory=list)
+
+@dataclass
+class ExpenseFilters:
+    """Data class to represent the filters of an expenses query.
+
+    Every filter is optional and they are combined with AND.
+
+    Attributes:
+        start: The first purchase date included, if any.
+        end: The last purchase date included, if any.
+        type: An ExpenseType the expenses must have, if any.
+        name_prefix: A string the expense names must start with, case-insensitively, if any.
+        installment_to: The total number of installments of the plan, if any.
+        updated_since: A watermark the expenses must have been updated after, if any.
+    """
+    start: Union[datetime, None] = None
+    end: Union[datetime, None] = None
+    type: Union[ExpenseType, None] = None
+    name_prefix: Union[str, None] = None
+    installment_to: Union[int, None] = None
+    updated_since: Union[datetime, None] = None
+
+@dataclass
+class MonthlyTotal:
+    """Data class to represent the aggregated expenses of a month and type.
+
+    Attributes:
+        month: A string representing the month, formatted as YYYY-MM.
+        type: The ExpenseType of the aggregated expenses.
+        total: The sum of the expense amounts.
+        count: The number of expenses.
+    """
+    month: str
+    type: ExpenseType
+    total: float
+    count: int
+
 class IExpensesRepository(ABC):
     """Abstract base class for ExpensesRepository objects.
 
     This class defines the interface for all ExpensesRepository objects in the application.
+    Writes are idempotent: an expense whose fingerprint is already stored is skipped.
 
     Methods:
         create_expense: Abstract method that must be implemented by subclasses to create an Expense entity.
+        create_expenses: Abstract method that must be implemented by subclasses to create many Expense entities at once.
+        find_imported_statements: Abstract method that must be implemented by subclasses to tell which statement files were already imported.
+        find_expenses: Abstract method that must be implemented by subclasses to stream the Expense entities matching some filters.
+        find_expense_batches: Abstract method that must be implemented by subclasses to stream the Expense entities matching some filters in fixed-size batches.
+        summarize_by_month: Abstract method that must be implemented by subclasses to aggregate expenses per month and type.
+        rebuild_monthly_totals: Abstract method that must be implemented by subclasses to recompute the monthly totals.
+        find_merchant_types: Abstract method that must be implemented by subclasses to tell the type merchants were classified with.
     """
 
     @abstractmethod
@@ -22,6 +81,103 @@ class IExpensesRepository(ABC):
             expense: An Expense entity to be created.
 
         Returns:
-            The created Expense entity.
+            The created Expense entity, or the stored one if it already existed.
+        """
+        ...
+
+    @abstractmethod
+    def create_expenses(self, 
+                        expenses: Sequence[Expense],
+                        statement: Union[Statement, None] = None) -> CreateExpensesResult:
+        """Abstract method to create many Expense entities in a single transaction.
+
+        This method should be implemented by subclasses to write the whole batch at once,
+        either persisting every new entity or none of them. When a statement is given, it
+        is recorded in the same transaction and the inserted expenses are linked to it.
+
+        Args:
+            expenses: A sequence of Expense entities to be created.
+            statement: An optional Statement the expenses were extracted from.
+
+        Returns:
+            A CreateExpensesResult telling the inserted entities apart from the skipped ones.
+        """
+        ...
+
+    @abstractmethod
+    def find_imported_statements(self, hashes: Sequence[str]) -> Set[str]:
+        """Abstract method to tell which statement files were already imported.
+
+        Args:
+            hashes: A sequence of statement content hashes.
+
+        Returns:
+            The subset of the hashes that belong to recorded statements.
+        """
+        ...
+
+    @abstractmethod
+    def find_expenses(self, filters: ExpenseFilters) -> Iterator[Expense]:
+        """Abstract method to stream the Expense entities matching some filters.
+
+        This method should be implemented by subclasses to fetch the rows in chunks instead
+        of loading the whole result at once.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Yields:
+            Expense entities ordered by purchase date.
+        """
+        ...
+
+    @abstractmethod
+    def find_expense_batches(self, 
+                             filters: ExpenseFilters, 
+                             batch_size: Union[int, None] = None) -> Iterator[List[Expense]]:
+        """Abstract method to stream the Expense entities matching some filters in batches.
+
+        This method should be implemented by subclasses with a server-side cursor, holding a
+        single batch in memory at a time.
+
+        Args:
+            filters: An ExpenseFilters object.
+            batch_size: The number of entities per batch, or None for the repository default.
+
+        Yields:
+            Lists of at most `batch_size` Expense entities, ordered by ID.
+        """
+        ...
+
+    @abstractmethod
+    def summarize_by_month(self, filters: ExpenseFilters) -> Iterator[MonthlyTotal]:
+        """Abstract method to aggregate the expenses matching some filters per month and type.
+
+        Args:
+            filters: An ExpenseFilters object.
+
+        Yields:
+            MonthlyTotal objects ordered by month and type.
+        """
+        ...
+
+    @abstractmethod
+    def rebuild_monthly_totals(self) -> int:
+        """Abstract method to recompute the monthly totals from the stored expenses.
+
+        Returns:
+            The number of monthly totals after the rebuild.
+        """
+        ...
+
+    @abstractmethod
+    def find_merchant_types(self) -> Dict[str, ExpenseType]:
+        """Abstract method to tell the type each merchant was classified with.
+
+        Only fixed and variable expenses are considered. A merchant classified with both
+        types gets the one it was classified with most often.
+
+        Returns:
+            A dictionary mapping normalized merchant names to their types.
         """
-        ...
\ No newline at end of file
+        ...
@@ -0,0 +1,46 @@
+# built-in
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+class IPageTextCache(ABC):
+    """Abstract base class for caches of text extracted from PDF pages.
+
+    This class defines the interface for storing the page strings of a PDF under a key
+    derived from its content, so the same document never has to be decoded twice.
+    """
+
+    @staticmethod
+    def make_key(content_hash: str, parser: str, initial_costs_page: int) -> str:
+        """Builds the cache key of a PDF processed by a given parser.
+
+        Args:
+            content_hash: A string representing the hash of the PDF content.
+            parser: A string identifying the parser that extracted the pages.
+            initial_costs_page: The first page extracted from the PDF.
+
+        Returns:
+            A string representing the cache key.
+        """
+        return f'{content_hash}-{parser.lower()}-{initial_costs_page}'
+
+    @abstractmethod
+    def get(self, key: str) -> Union[List[str], None]:
+        """Abstract method to retrieve the cached pages of a PDF.
+
+        Args:
+            key: A string representing the cache key.
+
+        Returns:
+            A list of strings, each representing the text content of a PDF page, or None on a cache miss.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, key: str, pages: List[str]) -> None:
+        """Abstract method to store the pages of a PDF.
+
+        Args:
+            key: A string representing the cache key.
+            pages: A list of strings, each representing the text content of a PDF page.
+        """
+        ...
@@ -1,41 +1,103 @@
 # built-in
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from io import BufferedReader
-from typing import List, Union
+from os import PathLike
+from typing import BinaryIO, Dict, Iterator, List, Union
+
+# A statement file path, bytes-like buffer or binary file.
+StatementSource = Union[str, 'PathLike[str]', bytes, bytearray, memoryview, BinaryIO]
 
 @dataclass
 class MonetaryValues:
     """Data class to represent monetary values extracted from a PDF.
 
     Attributes:
-        :purchased_at: A Union of str and datetime representing the date of purchase.
+        :purchased_at: A Union of str and datetime representing the date of purchase. For an
+            installment, the date of that installment, one month after the previous one.
         name: A string representing the name of the item or service purchased.
         amount: A string representing the amount spent.
         installment_of: A Union of str and None representing the current installment number.
         installment_to: A Union of str and None representing the total number of installments.
     """
+    __slots__ = ('purchased_at', 'name', 'amount', 'installment_of', 'installment_to')
+
     purchased_at: Union[str, datetime]
     name: str
     amount: str
     installment_of: Union[str, None]
     installment_to: Union[str, None]
 
+@dataclass
+class StatementFingerprint:
+    """Data class to represent the cheap-to-read traits of a statement file.
+
+    Attributes:
+        head: The first bytes of the file.
+        metadata: A dictionary with the document metadata, such as its title and producer.
+        first_page: A string representing the text content of the first page only.
+    """
+    head: bytes
+    metadata: Dict[str, str] = field(default_factory=dict)
+    first_page: str = ''
+
 class IPDFParser(ABC):
     """Abstract base class for PDF parsers.
 
     This class defines the interface for extracting expenses from a PDF.
     """
+    def matches(self, fingerprint: StatementFingerprint) -> bool:
+        """Checks whether a statement looks like the ones handled by this parser.
+
+        Parsers that do not override this method are never picked automatically.
+
+        Args:
+            fingerprint: A StatementFingerprint of the statement.
+
+        Returns:
+            True if this parser can handle the statement, False otherwise.
+        """
+        return False
+
+    def count_pages(self, source: StatementSource) -> Union[int, None]:
+        """Counts the pages of a statement.
+
+        Parsers of formats without pages do not override this method.
+
+        Args:
+            source: A statement file path, bytes-like buffer or binary file.
+
+        Returns:
+            The number of pages, or None if the format has no pages.
+        """
+        return None
+
     @abstractmethod
+    def iter_expenses(self, 
+                      source: StatementSource) -> Iterator[MonetaryValues]:
+        """Abstract method to lazily extract expenses from a PDF.
+
+        Implementations should decode one page at a time, yielding its expenses before
+        moving to the next page, so memory does not grow with the whole document. A path
+        should be memory-mapped rather than read, see `MappedFile.open`, and a binary file
+        must stay open until the iterator is exhausted.
+
+        Args:
+            source: A statement file path, bytes-like buffer or binary file.
+
+        Yields:
+            MonetaryValues objects representing the extracted expenses, in page order.
+        """
+        ...
+
     def extract_expenses(self, 
-                         buffered_pdf: BufferedReader) -> List[MonetaryValues]:
-        """Abstract method to extract expenses from a PDF.
+                         source: StatementSource) -> List[MonetaryValues]:
+        """Extracts all expenses from a PDF at once.
 
         Args:
-            buffered_pdf: A buffered PDF file.
+            source: A statement file path, bytes-like buffer or binary file.
 
         Returns:
             A list of MonetaryValues objects representing the extracted expenses.
         """
-        ...
\ No newline at end of file
+        return list(self.iter_expenses(source=source))
\ No newline at end of file
@@ -0,0 +1,47 @@
+import hashlib
+from typing import BinaryIO
+
+class Digest:
+    """Utility class for content hashing.
+
+    This class provides static methods for hashing files and file-like objects.
+
+    Methods:
+        of_buffer: Static method to hash the content of a file-like object.
+        of_file: Static method to hash the content of a file.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    @staticmethod
+    def of_buffer(buffer: BinaryIO) -> str:
+        """Hashes the content of a file-like object.
+
+        The buffer is read from its current position and rewound to it afterwards, so it
+        can still be handed to a reader.
+
+        Args:
+            buffer: A seekable binary file-like object.
+
+        Returns:
+            A string representing the SHA-256 hex digest of the content.
+        """
+        position = buffer.tell()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: buffer.read(Digest.CHUNK_SIZE), b''):
+            digest.update(chunk)
+        buffer.seek(position)
+        return digest.hexdigest()
+
+    @staticmethod
+    def of_file(path: str) -> str:
+        """Hashes the content of a file.
+
+        Args:
+            path: A string representing the file path.
+
+        Returns:
+            A string representing the SHA-256 hex digest of the content.
+        """
+        with open(path, 'rb') as buffer:
+            return Digest.of_buffer(buffer)
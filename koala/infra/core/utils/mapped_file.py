@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+import io
+import mmap
+import os
+from typing import BinaryIO, Iterator, Union
+
+from koala.infra.core.interfaces.pdf_parser import StatementSource
+
+class MemoryReader(io.RawIOBase):
+    """Read-only, seekable raw stream over a bytes-like buffer.
+
+    Reads copy straight from a view of the buffer into the caller buffer, so the content
+    is never duplicated up front, and a memory-mapped file is only paged in where it is read.
+
+    Attributes:
+        name: The path of the mapped file, or None for an in-memory buffer.
+    """
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap], name: Union[str, None] = None) -> None:
+        """Initializes MemoryReader.
+
+        Args:
+            buffer: A bytes-like buffer or a memory-mapped file.
+            name: The path of the mapped file, or None for an in-memory buffer.
+        """
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int: # type: ignore
+        size = max(0, min(len(buffer), len(self._view) - self._position))
+        buffer[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError('Negative seek position.')
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+class MappedFile:
+    """Utility class for reading statements without loading them into memory.
+
+    This class provides a static method turning any statement source into a seekable
+    binary stream.
+
+    Methods:
+        open: Static method to open a statement path, bytes-like buffer or binary file.
+    """
+
+    @staticmethod
+    @contextmanager
+    def open(source: StatementSource) -> Iterator[BinaryIO]:
+        """Opens a statement source as a seekable binary stream.
+
+        A path is memory-mapped read-only, so its pages are read from the OS page cache on
+        demand and shared with any other process mapping the same file, such as the workers
+        extracting its pages. The stream keeps the path as its `name`. A bytes-like buffer is
+        read in place, and a binary file is handed back as is and left open.
+
+        Args:
+            source: A statement file path, bytes-like buffer or binary file.
+
+        Yields:
+            A seekable binary stream over the statement content.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            with io.BufferedReader(MemoryReader(source)) as stream:
+                yield stream # type: ignore
+            return
+
+        if not isinstance(source, (str, os.PathLike)):
+            yield source
+            return
+
+        path = os.fspath(source)
+        with open(path, 'rb') as statement:
+            # Empty files cannot be mapped.
+            if os.fstat(statement.fileno()).st_size == 0:
+                yield statement
+                return
+
+            mapping = mmap.mmap(statement.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                with io.BufferedReader(MemoryReader(mapping, name=path)) as stream:
+                    yield stream # type: ignore
+            finally:
+                mapping.close()
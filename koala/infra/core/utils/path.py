@@ -1,4 +1,6 @@
+import glob
 import os
+from typing import List, Tuple, Union
 
 class Path:
     """Utility class for file path operations.
@@ -7,6 +9,8 @@ class Path:
 
     Methods:
         join: Static method to join the current file path with a target path.
+        is_pattern: Static method to check whether a target path points to many files.
+        expand: Static method to expand a file, directory or glob pattern into file paths.
     """
 
     @staticmethod
@@ -23,4 +27,46 @@ class Path:
         Returns:
             A string representing the absolute path resulting from joining the current file path and target path.
         """
-        return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(current_file)), target_path))
\ No newline at end of file
+        return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(current_file)), target_path))
+
+    @staticmethod
+    def is_pattern(target_path: str) -> bool:
+        """Checks whether a target path points to many files.
+
+        A leading "~" is expanded first, like `expand` does.
+
+        Args:
+            target_path: A string representing a file path, a directory or a glob pattern.
+
+        Returns:
+            True if the target path is a directory or a glob pattern, False otherwise.
+        """
+        target_path = os.path.expanduser(target_path)
+        return os.path.isdir(target_path) or glob.has_magic(target_path)
+
+    @staticmethod
+    def expand(target_path: str, extension: Union[str, Tuple[str, ...]] = ('.pdf', '.csv', '.ofx')) -> List[str]:
+        """Expands a target path into a sorted list of file paths.
+
+        A directory is expanded into the files inside it with the given extension, a glob
+        pattern into the files it matches, and anything else is returned as is.
+
+        Args:
+            target_path: A string representing a file path, a directory or a glob pattern.
+            extension: The file extension, or tuple of extensions, used to filter the files of a
+                directory. Defaults to the statement formats: ".pdf", ".csv" and ".ofx".
+
+        Returns:
+            A sorted list of strings representing the expanded file paths.
+        """
+        target_path = os.path.expanduser(target_path)
+
+        if os.path.isdir(target_path):
+            return sorted(os.path.join(target_path, name) 
+                          for name in os.listdir(target_path) 
+                          if name.lower().endswith(extension) and os.path.isfile(os.path.join(target_path, name)))
+
+        if glob.has_magic(target_path):
+            return sorted(path for path in glob.glob(target_path) if os.path.isfile(path))
+
+        return [target_path]
@@ -0,0 +1,155 @@
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import wraps
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Type, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+@dataclass
+class SpanStats:
+    """Data class to represent the accumulated timings of a span.
+
+    Attributes:
+        name: The name of the span.
+        calls: The number of times the span was entered.
+        total: The total time spent inside the span, in seconds.
+    """
+    name: str
+    calls: int = 0
+    total: float = 0.0
+
+class _Span:
+    """Context manager timing one entry of a span into its SpanStats."""
+    __slots__ = ('stats', 'started')
+
+    def __init__(self, stats: SpanStats) -> None:
+        self.stats = stats
+        self.started = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter() - self.started
+        with _LOCK:
+            self.stats.total += elapsed
+            self.stats.calls += 1
+
+# Shared by every span while profiling is disabled, so a disabled span allocates nothing.
+_DISABLED_SPAN: ContextManager[None] = nullcontext()
+
+# Guards the recorded timings, since pipelined imports record spans from several threads.
+_LOCK = threading.Lock()
+
+class Profiler:
+    """Utility class for opt-in, process-wide stage timings.
+
+    Spans are named stages, such as "pdf.extract_text" or "repository.commit". While the
+    profiler is disabled, which is the default, entering a span costs a flag check and
+    returns a shared no-op context manager. Spans are meant for stages, not for per-row
+    work, so enabled spans cost a couple of clock reads and an uncontended lock per page
+    or batch. Spans may be recorded from any thread. Spans of the same name running at
+    once in several threads all add their own time, so a total can exceed the wall time.
+
+    Methods:
+        enable: Static method to start recording spans, discarding previous timings.
+        disable: Static method to stop recording spans.
+        span: Static method to time a block of code.
+        trace: Static method to decorate a function so every call is timed.
+        stats: Static method to list the recorded timings.
+    """
+
+    enabled: bool = False
+    started: float = 0.0
+    _spans: Dict[str, SpanStats] = {}
+
+    @staticmethod
+    def enable() -> None:
+        """Starts recording spans, discarding previous timings."""
+        with _LOCK:
+            Profiler._spans = {}
+        Profiler.started = time.perf_counter()
+        Profiler.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        """Stops recording spans. The recorded timings are kept."""
+        Profiler.enabled = False
+
+    @staticmethod
+    def span(name: str) -> ContextManager[None]:
+        """Times a block of code.
+
+        Args:
+            name: The name of the span. Entries of spans with the same name are summed.
+
+        Returns:
+            A context manager timing the block, or a no-op one while profiling is disabled.
+        """
+        if not Profiler.enabled:
+            return _DISABLED_SPAN
+
+        with _LOCK:
+            stats = Profiler._spans.get(name)
+            if stats is None:
+                stats = Profiler._spans[name] = SpanStats(name=name)
+        return _Span(stats)
+
+    @staticmethod
+    def trace(name: str) -> Callable[[F], F]:
+        """Decorates a function so every call is timed as a span.
+
+        Args:
+            name: The name of the span.
+
+        Returns:
+            A decorator wrapping the function.
+        """
+        def decorator(function: F) -> F:
+            @wraps(function)
+            def traced(*args: Any, **kwargs: Any) -> Any:
+                if not Profiler.enabled:
+                    return function(*args, **kwargs)
+                with Profiler.span(name):
+                    return function(*args, **kwargs)
+            setattr(traced, '__traced__', True)
+            return traced # type: ignore
+        return decorator
+
+    @staticmethod
+    def trace_method(cls: Type[Any], method: str) -> None:
+        """Wraps a method of a class defined in the class itself, so every call is timed.
+
+        The span is named "<class name>.<method>". Methods inherited from a base class or
+        already traced are left untouched.
+
+        Args:
+            cls: The class whose method is wrapped.
+            method: The name of the method.
+        """
+        function = cls.__dict__.get(method)
+        if function is None or getattr(function, '__traced__', False) or getattr(function, '__isabstractmethod__', False):
+            return
+        setattr(cls, method, Profiler.trace(f'{cls.__name__}.{method}')(function))
+
+    @staticmethod
+    def stats() -> List[SpanStats]:
+        """Lists the recorded timings.
+
+        Returns:
+            A list of SpanStats objects, the slowest spans first.
+        """
+        with _LOCK:
+            spans = [SpanStats(name=stats.name, calls=stats.calls, total=stats.total) for stats in Profiler._spans.values()]
+        return sorted(spans, key=lambda stats: stats.total, reverse=True)
+
+    @staticmethod
+    def elapsed() -> float:
+        """Measures the time since profiling was enabled.
+
+        Returns:
+            The elapsed time in seconds.
+        """
+        return time.perf_counter() - Profiler.started
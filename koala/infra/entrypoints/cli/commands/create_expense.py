@@ -1,19 +1,20 @@
 # built-in
 from datetime import datetime
-from typing import List, Tuple, Union
 
 # third-party
-from dateutil.relativedelta import relativedelta
-from PyInquirer import prompt
 import typer
 from rich import print
 
 # entities
 from koala.domain.entities.expense import ExpenseType
 
+# services
+from koala.domain.services.installment_scheduler import InstallmentScheduler
+
 # use-cases
 from koala.application.use_cases.create_expense import (CreateExpenseUseCaseRequestDTO, 
-                                                        CreateExpenseUseCaseResponseDTO)
+                                                        CreateExpensesUseCaseRequestDTO, 
+                                                        CreateExpensesUseCaseResponseDTO)
 
 # interfaces
 from koala.application.core.interfaces.use_case import DTO, IUseCase
@@ -26,19 +27,19 @@ class CreateExpenseCommand(ICommand):
     This class is responsible for handling the command-line interface for creating expenses.
 
     Attributes:
-        _create_expense_use_case: A use case for creating expenses.
+        _create_expenses_use_case: A use case for creating many expenses in a single transaction.
     """
 
 
     def __init__(self, 
-                 create_expense_use_case: IUseCase[CreateExpenseUseCaseRequestDTO, 
-                                                   CreateExpenseUseCaseResponseDTO]) -> None:
+                 create_expenses_use_case: IUseCase[CreateExpensesUseCaseRequestDTO, 
+                                                    CreateExpensesUseCaseResponseDTO]) -> None:
         """Initializes the CreateExpenseCommand class.
         
         Args:
-            create_expense_use_case: A use case for creating expenses.
+            create_expenses_use_case: A use case for creating many expenses in a single transaction.
         """
-        self._create_expense_use_case = create_expense_use_case
+        self._create_expenses_use_case = create_expenses_use_case
 
     def get_expense_type(self) -> ExpenseType:
         """Prompts the user to select the type of installment for the expense.
@@ -55,6 +56,8 @@ class CreateExpenseCommand(ICommand):
                         ExpenseType.VARIABLE.value]
         }]
         
+        from PyInquirer import prompt
+
         type_answer = prompt(type_question)
 
         convert_str_to_enum = {
@@ -65,40 +68,38 @@ class CreateExpenseCommand(ICommand):
 
         return convert_str_to_enum[type_answer['type']]
     
-    def create_expenses_data(self) -> List[CreateExpenseUseCaseRequestDTO]:
+    def create_expenses_data(self) -> CreateExpensesUseCaseRequestDTO:
         """Creates expense data based on user input.
+
+        For an installment expense, the purchase date is the date of the first installment,
+        and every installment from `installment_of` on is scheduled in the same batch.
         
         Returns:
-            List[CreateExpenseUseCaseRequestDTO]: A list of DTOs containing expense data.
+            CreateExpensesUseCaseRequestDTO: A DTO containing the expense data.
         """
 
         name = typer.prompt('Expense name')
-        purchased_at = typer.prompt('Purchased at')
+        purchased_at = datetime.strptime(typer.prompt('Purchased at'), '%Y-%m-%d')
 
         expense_type = self.get_expense_type()
 
-        expenses: List[Tuple[Union[int, None], str]] = []
         installment_of = None
         installment_to = None
 
         if expense_type == ExpenseType.INSTALLMENT:
-            installment_of = typer.prompt('Installment of')
-            installment_to = typer.prompt('Installment to')
-            
-            for i, month in enumerate(range(int(installment_of)-1, int(installment_to))):
-                date = datetime.strptime(purchased_at, '%Y-%m-%d') + relativedelta(months=month)
-                expenses.append((int(installment_of) + i, date.strftime('%Y-%m-%d')))
-        else:
-            expenses.append((None, purchased_at))
-
-        amount = typer.prompt('Expense amount')
-
-        return [CreateExpenseUseCaseRequestDTO(name=name,
-                                               purchased_at=expense[1],
-                                               type=expense_type,
-                                               amount=amount,
-                                               installment_of=expense[0],
-                                               installment_to=installment_to) for expense in expenses]
+            installment_of = int(typer.prompt('Installment of'))
+            installment_to = int(typer.prompt('Installment to'))
+            purchased_at = InstallmentScheduler.add_months(purchased_at, installment_of - 1)
+
+        amount = float(typer.prompt('Expense amount'))
+
+        return CreateExpensesUseCaseRequestDTO(expenses=[CreateExpenseUseCaseRequestDTO(name=name,
+                                                                                        purchased_at=purchased_at, # type: ignore
+                                                                                        type=expense_type,
+                                                                                        amount=amount,
+                                                                                        installment_of=installment_of,
+                                                                                        installment_to=installment_to)],
+                                               project_installments=True)
         
     def run(self) -> None:
         """Executes the command to create expenses.
@@ -110,8 +111,12 @@ class CreateExpenseCommand(ICommand):
         print(f'[bold yellow]Welcome to expense creator.[/bold yellow]')
         while True:
             try:
-                for expense in self.create_expenses_data():
-                    created = self._create_expense_use_case.execute(DTO(data=expense))
-                    print(f'[bold green]Created {expense.name} expense with id "{created.id}" successfully![/bold green]')
+                expenses_data = self.create_expenses_data()
+                created = self._create_expenses_use_case.execute(DTO(data=expenses_data))
+                name = expenses_data.expenses[0].name
+                for id in created.ids:
+                    print(f'[bold green]Created {name} expense with id "{id}" successfully![/bold green]')
+                if created.skipped:
+                    print(f'[bold yellow]Skipped {created.skipped} {name} expenses that already existed.[/bold yellow]')
             except KeyboardInterrupt:
                 break
\ No newline at end of file
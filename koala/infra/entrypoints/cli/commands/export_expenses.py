@@ -0,0 +1,107 @@
+# built-in
+from datetime import datetime
+from typing import Callable, Dict, Union
+
+# third-party
+import typer
+from rich import console
+
+# entities
+from koala.domain.entities.expense import ExpenseType
+
+# use-cases
+from koala.application.use_cases.export_expenses import (ExportExpensesUseCaseRequestDTO,
+                                                         ExportExpensesUseCaseResponseDTO)
+from koala.application.use_cases.report_expenses import ReportExpensesUseCase
+
+# interfaces
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.command import ICommand
+from koala.infra.core.interfaces.expense_exporter import IExpenseExporter
+
+
+class ExportExpenses(ICommand):
+    """Command class for exporting expenses.
+
+    This class is responsible for handling the command-line interface for streaming the
+    stored expenses to a CSV, JSON Lines or Parquet file.
+
+    Attributes:
+        _export_expenses_use_case: A use case for exporting expenses.
+        _exporters: A dictionary mapping format names to callables building their exporter.
+    """
+
+    def __init__(self,
+                 export_expenses_use_case: IUseCase[ExportExpensesUseCaseRequestDTO,
+                                                    ExportExpensesUseCaseResponseDTO]) -> None:
+        """Initializes the ExportExpenses class.
+
+        Args:
+            export_expenses_use_case: A use case for exporting expenses.
+        """
+        self._export_expenses_use_case = export_expenses_use_case
+        self._exporters: Dict[str, Callable[[], IExpenseExporter]] = {}
+
+    def add_exporter(self, name: str, exporter: Callable[[], IExpenseExporter]) -> None:
+        """Adds an exporter for a format.
+
+        Args:
+            name: The name of the format.
+            exporter: A callable building the exporter.
+        """
+        self._exporters[name] = exporter
+
+    def run(self,
+            format: str = typer.Option('csv', help='Output format: csv, jsonl or parquet.'),
+            output: str = typer.Option('-', '--output', '-o', help='Output file, "-" for the standard output.'),
+            start: Union[str, None] = typer.Option(None, help='First purchase date included (YYYY-MM-DD).'),
+            end: Union[str, None] = typer.Option(None, help='Last purchase date included (YYYY-MM-DD).'),
+            type: Union[str, None] = typer.Option(None, help='Expense type: fixed, variable or installment.'),
+            name: Union[str, None] = typer.Option(None, help='Only expenses whose name starts with this prefix.'),
+            installments: Union[int, None] = typer.Option(None, help='Only installment plans with this many installments.'),
+            since: Union[str, None] = typer.Option(None, help='Only expenses updated after this ISO 8601 timestamp.'),
+            batch_size: int = typer.Option(10000, min=1, help='Number of expenses fetched and written at a time.')) -> None:
+        """Executes the command to export expenses.
+
+        The expenses are read through a server-side cursor and written one batch at a time,
+        so memory stays flat whatever the size of the table. The printed watermark can be
+        passed to --since to export only what changed afterwards.
+        """
+        if format not in self._exporters:
+            raise typer.BadParameter(f'Invalid format "{format}", expected one of: {", ".join(self._exporters)}.')
+
+        try:
+            expense_type = ExpenseType(type.lower()) if type else None
+        except ValueError:
+            raise typer.BadParameter(f'Invalid expense type "{type}".')
+
+        try:
+            start_date = ReportExpensesUseCase.parse_date(start)
+        except ValueError:
+            raise typer.BadParameter(f'Invalid date "{start}", expected YYYY-MM-DD.', param_hint='--start')
+
+        try:
+            end_date = ReportExpensesUseCase.parse_date(end, end_of_day=True)
+        except ValueError:
+            raise typer.BadParameter(f'Invalid date "{end}", expected YYYY-MM-DD.', param_hint='--end')
+
+        try:
+            updated_since = datetime.fromisoformat(since) if since else None
+        except ValueError:
+            raise typer.BadParameter(f'Invalid timestamp "{since}".')
+
+        response = self._export_expenses_use_case.execute(DTO(data=ExportExpensesUseCaseRequestDTO(exporter=self._exporters[format](),
+                                                                                                    destination=output,
+                                                                                                    start=start_date,
+                                                                                                    end=end_date,
+                                                                                                    type=expense_type,
+                                                                                                    name_prefix=name,
+                                                                                                    installment_to=installments,
+                                                                                                    updated_since=updated_since,
+                                                                                                    batch_size=batch_size)))
+
+        # The summary goes to stderr so it never mixes with an export written to stdout.
+        output_console = console.Console(stderr=True)
+        output_console.print(f'[bold green]Exported {response.rows} expenses in {response.batches} batches.[/bold green]')
+        if response.watermark is not None:
+            output_console.print(f'Next watermark: {response.watermark.isoformat()}', highlight=False)
@@ -1,18 +1,34 @@
 # built-in
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import json
 import logging
-from typing import Dict, List, Literal
+from typing import Any, BinaryIO, Dict, List, Literal, Sequence, Union
 
 # third-party
-from PyInquirer import prompt
 import typer
-from rich import print, console, table
+from rich import console, table
 from koala.application.core.interfaces.extract_expenses_from_pdf import (ExtractExpensesFromPDFUseCaseRequestDTO, 
                                                                          IExtractExpensesFromPDF)
+from koala.application.core.interfaces.extract_expenses_from_pdfs import (ExtractedStatement,
+                                                                          ExtractExpensesFromPDFsUseCaseRequestDTO, 
+                                                                          ExtractExpensesFromPDFsUseCaseResponseDTO,
+                                                                          IExtractExpensesFromPDFs)
 from koala.application.core.interfaces.use_case import DTO, IUseCase
-from koala.application.use_cases.create_expense import CreateExpenseUseCaseRequestDTO
+from koala.application.parsers.pdf.detector import StatementDetector
+from koala.application.use_cases.build_expense_classifier import (BuildExpenseClassifierUseCaseRequestDTO,
+                                                                  BuildExpenseClassifierUseCaseResponseDTO)
+from koala.application.use_cases.create_expense import (CreateExpenseUseCaseRequestDTO, 
+                                                        CreateExpensesUseCaseRequestDTO, 
+                                                        CreateExpensesUseCaseResponseDTO,
+                                                        ImportedStatementDTO)
+from koala.application.use_cases.find_imported_statements import (FindImportedStatementsUseCaseRequestDTO,
+                                                                  FindImportedStatementsUseCaseResponseDTO)
+from koala.application.use_cases.import_statements import (ImportStatementsUseCaseRequestDTO,
+                                                           ImportStatementsUseCaseResponseDTO)
 from koala.domain.entities.expense import ExpenseType
+from koala.domain.services.expense_classifier import ClassificationRule, ExpenseClassifier, RuleKind
 
 # entities
 
@@ -21,11 +37,225 @@ from koala.domain.entities.expense import ExpenseType
 # interfaces
 from koala.infra.core.interfaces.command import ICommand
 from koala.infra.core.interfaces.pdf_parser import MonetaryValues
+from koala.infra.core.utils.mapped_file import MappedFile
+from koala.infra.core.utils.path import Path
+from koala.infra.core.utils.profiler import Profiler
 
 class AvailableExtractors(Enum):
-    """Enum for available PDF extractors."""
+    """Enum for available statement extractors."""
+    AUTO = 'auto'
     NUBANK = 'nubank'
     C6 = 'c6'
+    NUBANK_CSV = 'nubank-csv'
+    NUBANK_OFX = 'nubank-ofx'
+    C6_CSV = 'c6-csv'
+    C6_OFX = 'c6-ofx'
+
+@dataclass
+class ImportOptions:
+    """Data class to represent the options of a headless import.
+
+    Attributes:
+        provider: The name of the extractor to use, or "auto" to detect it for each statement.
+        paths: A list of file paths, directories or glob patterns to be imported.
+        yes: Whether the expenses should be written without confirmation. When False, a
+            headless import only reports what would be imported.
+        default_type: The type given to non-installment expenses no rule classifies.
+        rules: A list of ClassificationRule objects classifying the non-installment expenses.
+        learn_from_history: Whether the merchants already classified in the stored expenses
+            should classify the ones no rule matches.
+        project_installments: Whether the remaining installments of each installment
+            expense should be created too.
+        json: Whether the summary should be printed as JSON.
+        force: Whether the statements already in the ledger should be scanned again. Only the
+            command option sets it, so a config file cannot disable the ledger for good.
+    """
+    provider: str = AvailableExtractors.AUTO.value
+    paths: List[str] = field(default_factory=list)
+    yes: bool = False
+    default_type: Union[ExpenseType, None] = None
+    rules: List[ClassificationRule] = field(default_factory=list)
+    learn_from_history: bool = True
+    project_installments: bool = False
+    json: bool = False
+    force: bool = False
+
+    @staticmethod
+    def parse_type(value: str) -> ExpenseType:
+        """Parses the type of a non-installment expense.
+
+        Args:
+            value: A string representing the expense type.
+
+        Returns:
+            ExpenseType: The parsed expense type.
+
+        Raises:
+            Exception: If the value is not "fixed" or "variable".
+        """
+        try:
+            expense_type = ExpenseType(value.lower())
+        except ValueError:
+            expense_type = None
+
+        if expense_type not in (ExpenseType.FIXED, ExpenseType.VARIABLE):
+            raise Exception(f'Invalid expense type "{value}". Use fixed or variable.')
+
+        return expense_type
+
+    @classmethod
+    def load(cls, config_path: Union[str, None] = None) -> 'ImportOptions':
+        """Loads the options of a JSON config file.
+
+        The file may have the keys provider, paths, yes, default_type, types, rules,
+        learn_from_history, project_installments and json, all of them optional. `types`
+        maps expense names to their type and is a shorthand for exact rules, while `rules`
+        is a list of objects with the keys match (exact, prefix, contains or regex),
+        pattern and type.
+
+        Args:
+            config_path: The path of the config file, or None for the default options.
+
+        Returns:
+            ImportOptions: The loaded options.
+
+        Raises:
+            Exception: If the file could not be read or has invalid values.
+        """
+        if config_path is None:
+            return cls()
+
+        try:
+            with open(config_path, 'r', encoding='utf-8') as config_file:
+                config: Dict[str, Any] = json.load(config_file)
+        except (OSError, ValueError) as err:
+            raise Exception(f'Could not read the config file. {err}')
+
+        paths = config.get('paths', [])
+        default_type = config.get('default_type')
+
+        rules = [ClassificationRule(kind=RuleKind.EXACT, pattern=name, type=cls.parse_type(value)) 
+                 for name, value in config.get('types', {}).items()]
+        for rule in config.get('rules', []):
+            try:
+                kind = RuleKind(rule.get('match', RuleKind.EXACT.value))
+            except ValueError:
+                raise Exception(f'Invalid rule match "{rule.get("match")}". Use exact, prefix, contains or regex.')
+            rules.append(ClassificationRule(kind=kind, pattern=rule['pattern'], type=cls.parse_type(rule['type'])))
+
+        return cls(provider=config.get('provider', AvailableExtractors.AUTO.value),
+                   paths=[paths] if isinstance(paths, str) else list(paths),
+                   yes=bool(config.get('yes', False)),
+                   default_type=cls.parse_type(default_type) if default_type else None,
+                   rules=rules,
+                   learn_from_history=bool(config.get('learn_from_history', True)),
+                   project_installments=bool(config.get('project_installments', False)),
+                   json=bool(config.get('json', False)))
+
+@dataclass
+class ImportSummary:
+    """Data class to represent the totals of the expenses about to be imported.
+
+    Attributes:
+        count: The number of expenses.
+        total: The sum of the expense amounts.
+        installments: The number of installment expenses.
+        first_purchase: The earliest purchase date, if any.
+        last_purchase: The latest purchase date, if any.
+    """
+    count: int = 0
+    total: float = 0.0
+    installments: int = 0
+    first_purchase: Union[datetime, None] = None
+    last_purchase: Union[datetime, None] = None
+
+    @classmethod
+    def of(cls, expenses: Sequence[MonetaryValues]) -> 'ImportSummary':
+        """Computes the totals of some expenses in a single pass.
+
+        Amounts that are not numbers are left out of the total.
+
+        Args:
+            expenses: The expenses about to be imported.
+
+        Returns:
+            ImportSummary: The totals of the expenses.
+        """
+        summary = cls(count=len(expenses))
+        for expense in expenses:
+            try:
+                summary.total += float(expense.amount)
+            except (TypeError, ValueError):
+                logging.warning(f'Could not add the amount of {expense.name} to the total.')
+            if expense.installment_of is not None:
+                summary.installments += 1
+            if isinstance(expense.purchased_at, datetime):
+                if summary.first_purchase is None or expense.purchased_at < summary.first_purchase:
+                    summary.first_purchase = expense.purchased_at
+                if summary.last_purchase is None or expense.purchased_at > summary.last_purchase:
+                    summary.last_purchase = expense.purchased_at
+        return summary
+
+class ImportPreview:
+    """Paginated view of the expenses about to be imported.
+
+    Only the rows of the requested page are formatted, so rendering a page costs the same
+    whatever the number of expenses.
+
+    Attributes:
+        expenses: The expenses about to be imported.
+        page_size: The number of rows per page.
+    """
+    def __init__(self, expenses: Sequence[MonetaryValues], page_size: int = 20) -> None:
+        """Initializes ImportPreview.
+
+        Args:
+            expenses: The expenses about to be imported.
+            page_size: The number of rows per page. Defaults to 20.
+        """
+        self.expenses = expenses
+        self.page_size = max(1, page_size)
+
+    @property
+    def page_count(self) -> int:
+        """Property to get the number of pages, at least one.
+
+        Returns:
+            An integer representing the number of pages.
+        """
+        return max(1, -(-len(self.expenses) // self.page_size))
+
+    def render(self, page: int) -> table.Table:
+        """Renders a page of the expenses.
+
+        Args:
+            page: The zero-based page number, clamped to the existing pages.
+
+        Returns:
+            table.Table: A table with the rows of the page.
+        """
+        page = min(max(page, 0), self.page_count - 1)
+        start = page * self.page_size
+
+        output_table = table.Table("Index", 
+                                   "Purchased At", 
+                                   "Name", 
+                                   "Installment Of", 
+                                   "Installment To", 
+                                   "Amount",
+                                   caption=f"Page {page + 1} of {self.page_count}" if self.page_count > 1 else None)
+        for i, expense in enumerate(self.expenses[start:start + self.page_size], start=start + 1):
+            date = datetime.strftime(expense.purchased_at, '%d/%m/%Y') \
+                if isinstance(expense.purchased_at, datetime) \
+                else expense.purchased_at
+
+            output_table.add_row(str(i),
+                                 date, 
+                                 expense.name, 
+                                 expense.installment_of, 
+                                 expense.installment_to, 
+                                 expense.amount)
+        return output_table
 
 class ImportExpenses(ICommand):
     """Command class for importing expenses from PDF.
@@ -34,12 +264,35 @@ class ImportExpenses(ICommand):
 
     Attributes:
         __extractors: A dictionary mapping extractor names to their instances.
-        _create_expense_use_case: A use case for creating expenses.
+        _create_expenses_use_case: A use case for creating many expenses in a single transaction.
+        _extract_expenses_from_pdfs_use_case: An optional use case for extracting expenses from many PDFs in parallel.
+        _statement_detector: A detector used to pick the extractor of a statement automatically.
+        _build_expense_classifier_use_case: An optional use case for classifying the expenses by merchant.
+        _import_statements_use_case: An optional use case for extracting, classifying and writing many
+            statements as a pipeline.
+        _find_imported_statements_use_case: An optional use case for skipping the statements that were
+            already imported.
+        _console: The console messages are printed to.
     """
     def __init__(self,
-                 create_expense_use_case: IUseCase) -> None:
+                 create_expenses_use_case: IUseCase[CreateExpensesUseCaseRequestDTO, 
+                                                    CreateExpensesUseCaseResponseDTO],
+                 extract_expenses_from_pdfs_use_case: Union[IExtractExpensesFromPDFs, None] = None,
+                 statement_detector: Union[StatementDetector, None] = None,
+                 build_expense_classifier_use_case: Union[IUseCase[BuildExpenseClassifierUseCaseRequestDTO,
+                                                                   BuildExpenseClassifierUseCaseResponseDTO], None] = None,
+                 import_statements_use_case: Union[IUseCase[ImportStatementsUseCaseRequestDTO,
+                                                            ImportStatementsUseCaseResponseDTO], None] = None,
+                 find_imported_statements_use_case: Union[IUseCase[FindImportedStatementsUseCaseRequestDTO,
+                                                                   FindImportedStatementsUseCaseResponseDTO], None] = None) -> None:
         self.__extractors: Dict[str, IExtractExpensesFromPDF] = {}
-        self._create_expense_use_case = create_expense_use_case
+        self._create_expenses_use_case = create_expenses_use_case
+        self._extract_expenses_from_pdfs_use_case = extract_expenses_from_pdfs_use_case
+        self._statement_detector = statement_detector if statement_detector is not None else StatementDetector()
+        self._build_expense_classifier_use_case = build_expense_classifier_use_case
+        self._import_statements_use_case = import_statements_use_case
+        self._find_imported_statements_use_case = find_imported_statements_use_case
+        self._console = console.Console()
     
     def add_extractor(self, 
                       name: str, 
@@ -76,11 +329,64 @@ class ImportExpenses(ICommand):
         
         raise Exception('This extractor was not added.')
 
-    def get_extractor_from_client(self) -> IExtractExpensesFromPDF:
+    def detect_extractor(self, pdf: BinaryIO) -> IExtractExpensesFromPDF:
+        """Picks the added extractor that handles a statement.
+
+        Only the statement metadata and first page are read.
+
+        Args:
+            pdf: A buffered statement file.
+
+        Returns:
+            IExtractExpensesFromPDF: The matching extractor instance.
+
+        Raises:
+            Exception: If no added extractor handles the statement.
+        """
+        name = self._statement_detector.detect(pdf, self.__extractors)
+        if name is None:
+            raise Exception('Could not detect the bank of the statement.')
+
+        self._console.print(f"[bold yellow]Detected a {name.capitalize()} statement.[/bold yellow]")
+        return self.__extractors[name]
+
+    def get_extractor_name(self, extractor: IExtractExpensesFromPDF) -> Union[str, None]:
+        """Retrieves the name an extractor was added with.
+
+        Args:
+            extractor: The extractor instance.
+
+        Returns:
+            The name of the extractor, or None if it was not added.
+        """
+        return next((name for name, candidate in self.__extractors.items() if candidate is extractor), None)
+
+    def get_extractor_by_name(self, name: str) -> Union[IExtractExpensesFromPDF, None]:
+        """Retrieves an extractor by its option name.
+
+        Args:
+            name: The name of the extractor, or "auto".
+
+        Returns:
+            IExtractExpensesFromPDF: The extractor instance, or None to detect it for each statement.
+
+        Raises:
+            Exception: If the name is not an available extractor.
+        """
+        try:
+            extractor_name = AvailableExtractors(name.lower())
+        except ValueError:
+            raise Exception(f'Invalid extractor option "{name}".')
+
+        if extractor_name == AvailableExtractors.AUTO:
+            return None
+        return self.get_extractor(name=extractor_name)
+
+    def get_extractor_from_client(self) -> Union[IExtractExpensesFromPDF, None]:
         """Prompts the user to select an extractor.
 
         Returns:
-            IExtractExpensesFromPDF: The selected extractor instance.
+            IExtractExpensesFromPDF: The selected extractor instance, or None to detect it for each statement.
 
         Raises:
             Exception: If an invalid option was selected.
@@ -92,49 +398,57 @@ class ImportExpenses(ICommand):
             'choices': [extractor.name.capitalize() for extractor in AvailableExtractors]
         }]
         
+        from PyInquirer import prompt
+
         extractor_answer: Dict[Literal["extractor"], str] = prompt(extractor_question)
         try:
             extractor_name = AvailableExtractors[extractor_answer['extractor'].upper()]
+            if extractor_name == AvailableExtractors.AUTO:
+                return None
             return self.get_extractor(name=extractor_name)
         except KeyError:
             raise Exception('Invalid extractor option.')
     
-    def get_import_confirmation_from_client(self, expenses: List[MonetaryValues]) -> bool:
+    def get_import_confirmation_from_client(self, 
+                                            expenses: List[MonetaryValues],
+                                            page_size: int = 20) -> bool:
         """Prompts the user for confirmation to import expenses.
 
+        The totals are printed first, followed by the first page of the expenses. Further
+        pages are only rendered when the user asks for them, so the prompt shows up as fast
+        for a thousand expenses as for ten.
+
         Args:
             expenses: The list of expenses to be imported.
+            page_size: The number of expenses per page. Defaults to 20.
 
         Returns:
             bool: True if the user confirms, False otherwise.
         """
-        print(f"[bold yellow]You are going to import {len(expenses)} expenses.[/bold yellow]")
-        
-        output_table = table.Table("Index", 
-                                   "Purchased At", 
-                                   "Name", 
-                                   "Installment Of", 
-                                   "Installment To", 
-                                   "Amount")
-        for i, expense in enumerate(expenses):
-            date = datetime.strftime(expense.purchased_at, '%d/%m/%Y') \
-                if isinstance(expense.purchased_at, datetime) \
-                else expense.purchased_at
-            
-            output_table.add_row(str(i+1),
-                                 date, 
-                                 expense.name, 
-                                 expense.installment_of, 
-                                 expense.installment_to, 
-                                 expense.amount)
-        
-        console.Console().print(output_table)
+        summary = ImportSummary.of(expenses)
+        period = ''
+        if summary.first_purchase is not None and summary.last_purchase is not None:
+            period = (f", purchased from {summary.first_purchase.strftime('%d/%m/%Y')} "
+                      f"to {summary.last_purchase.strftime('%d/%m/%Y')}")
+        self._console.print(f"[bold yellow]You are going to import {summary.count} expenses totalling "
+                            f"{summary.total:.2f}, {summary.installments} of them installments{period}.[/bold yellow]")
 
-        confirmation: str = typer.prompt("Confirm [Y/N]")
-        if confirmation.lower() == 'y':
-            return True
-        
-        return False
+        preview = ImportPreview(expenses=expenses, page_size=page_size)
+        page = 0
+        while True:
+            self._console.print(preview.render(page))
+            if preview.page_count == 1:
+                confirmation: str = typer.prompt("Confirm [Y/N]")
+                return confirmation.lower() == 'y'
+
+            confirmation = typer.prompt(f"Confirm [Y/N], or a page number from 1 to {preview.page_count} "
+                                        f"(Enter for the next page)", default='', show_default=False).strip()
+            if confirmation == '':
+                page = (page + 1) % preview.page_count
+            elif confirmation.isdigit():
+                page = min(max(int(confirmation) - 1, 0), preview.page_count - 1)
+            else:
+                return confirmation.lower() == 'y'
 
     def get_file_path_from_client(self) -> str:
         """Prompts the user for the file path of the PDF to import.
@@ -142,14 +456,97 @@ class ImportExpenses(ICommand):
         Returns:
             str: The file path provided by the user.
         """
-        return typer.prompt("Bank bill ABSOLUTE file path")
+        return typer.prompt("Bank bill ABSOLUTE file path, directory or glob pattern")
+
+    def extract_statements(self, 
+                           provider: Union[IExtractExpensesFromPDF, None], 
+                           paths: List[str]) -> ExtractExpensesFromPDFsUseCaseResponseDTO:
+        """Extracts the expenses of many PDFs, reporting the ones that failed.
+
+        Args:
+            provider: The extractor to run against each PDF, or None to detect it for each PDF.
+            paths: The PDF file paths to be processed.
+
+        Returns:
+            ExtractExpensesFromPDFsUseCaseResponseDTO: The outcome of every PDF, in path order.
+
+        Raises:
+            Exception: If no use case for extracting many PDFs was provided.
+        """
+        if self._extract_expenses_from_pdfs_use_case is None:
+            raise Exception('Importing many bank bills at once is not available.')
+
+        self._console.print(f"[bold yellow]Processing {len(paths)} bank bills.[/bold yellow]")
+        response = self._extract_expenses_from_pdfs_use_case.execute(
+            data=DTO(data=ExtractExpensesFromPDFsUseCaseRequestDTO(paths=paths, 
+                                                                     extractor=provider, 
+                                                                     candidates=dict(self.__extractors))))
+
+        for failure in response.failures:
+            self._console.print(f"[bold red]Could not import {failure.path}. {failure.error}[/bold red]")
+
+        return response
+
+    def extract_expenses_from_many(self, 
+                                   provider: Union[IExtractExpensesFromPDF, None], 
+                                   paths: List[str]) -> List[MonetaryValues]:
+        """Extracts the expenses of many PDFs, reporting the ones that failed.
+
+        Args:
+            provider: The extractor to run against each PDF, or None to detect it for each PDF.
+            paths: The PDF file paths to be processed.
+
+        Returns:
+            List[MonetaryValues]: The expenses of every successfully processed PDF, in path order.
+
+        Raises:
+            Exception: If no use case for extracting many PDFs was provided.
+        """
+        return self.extract_statements(provider=provider, paths=paths).expenses
     
-    def get_expense_type(self) -> ExpenseType:
-        """Prompts the user to select the type of expense.
+    def get_classifier(self, options: ImportOptions) -> ExpenseClassifier:
+        """Compiles the classification rules of an import.
+
+        Args:
+            options: The import options.
 
         Returns:
-            ExpenseType: The type of expense selected by the user.
+            ExpenseClassifier: The classifier of the non-installment expenses.
         """
+        if self._build_expense_classifier_use_case is None:
+            return ExpenseClassifier(rules=options.rules)
+
+        return self._build_expense_classifier_use_case.execute(
+            data=DTO(data=BuildExpenseClassifierUseCaseRequestDTO(rules=options.rules,
+                                                                  learn_from_history=options.learn_from_history))).classifier
+
+    def get_expense_type(self, 
+                         expense: MonetaryValues,
+                         classifier: Union[ExpenseClassifier, None] = None,
+                         default_type: Union[ExpenseType, None] = None) -> ExpenseType:
+        """Tells the type of a non-installment expense.
+
+        The classifier is tried first, then the default type. Only when both are missing
+        the user is prompted, and the answer is learned so the same merchant is not asked
+        again.
+
+        Args:
+            expense: The expense to be classified.
+            classifier: An optional ExpenseClassifier.
+            default_type: An optional type for the expenses the classifier does not know.
+
+        Returns:
+            ExpenseType: The type of the expense.
+        """
+        if classifier is not None:
+            expense_type = classifier.classify(expense.name)
+            if expense_type is not None:
+                return expense_type
+
+        if default_type is not None:
+            return default_type
+
+        self._console.print(f"Expense Name: {expense.name} that cost [bold red]{expense.amount}[/bold red].")
         type_question = [{ 
             'type': 'list',
             'name': 'type',
@@ -158,6 +555,8 @@ class ImportExpenses(ICommand):
                         ExpenseType.VARIABLE.value]
         }]
         
+        from PyInquirer import prompt
+
         type_answer = prompt(type_question)
 
         convert_str_to_enum = {
@@ -166,43 +565,351 @@ class ImportExpenses(ICommand):
             'fixed': ExpenseType.FIXED
         }
 
-        return convert_str_to_enum[type_answer['type']]
+        expense_type = convert_str_to_enum[type_answer['type']]
+        if classifier is not None:
+            classifier.learn(expense.name, expense_type)
+        return expense_type
     
-    def create_expenses(self, expenses: List[MonetaryValues]) -> None:
+    def get_installments_projection_from_client(self, expenses: List[MonetaryValues]) -> bool:
+        """Asks the user whether the remaining installments should be created too.
+
+        Args:
+            expenses: The list of expenses to be imported.
+
+        Returns:
+            bool: True if the user wants the installments projected, False otherwise.
+        """
+        if not any(expense.installment_of is not None for expense in expenses):
+            return False
+
+        confirmation: str = typer.prompt("Also create the remaining installments of each installment expense? [Y/N]")
+        return confirmation.lower() == 'y'
+
+    def classify_expenses(self,
+                          expenses: List[MonetaryValues],
+                          classifier: ExpenseClassifier,
+                          options: ImportOptions) -> List[CreateExpenseUseCaseRequestDTO]:
+        """Tells the type of every expense, prompting for the ones no rule classifies.
+
+        Args:
+            expenses: The list of expenses to be created.
+            classifier: The classifier compiled from the classification rules.
+            options: The import options whose default type is used before prompting.
+
+        Returns:
+            List[CreateExpenseUseCaseRequestDTO]: The expenses to be created, in the given order.
+        """
+        expenses_data: List[CreateExpenseUseCaseRequestDTO] = []
+        with Profiler.span('import.classify'):
+            for expense in expenses:
+                expense_type = ExpenseType.INSTALLMENT
+                if expense.installment_of is None:
+                    expense_type = self.get_expense_type(expense=expense, 
+                                                         classifier=classifier, 
+                                                         default_type=options.default_type)
+        
+                expenses_data.append(CreateExpenseUseCaseRequestDTO(name=expense.name,
+                                                                    purchased_at=expense.purchased_at,
+                                                                    amount=float(expense.amount),
+                                                                    installment_of=expense.installment_of,
+                                                                    installment_to=expense.installment_to,
+                                                                    type=expense_type))
+        return expenses_data
+
+    def create_expenses(self, 
+                        expenses: List[MonetaryValues], 
+                        project_installments: bool = False,
+                        options: Union[ImportOptions, None] = None) -> CreateExpensesUseCaseResponseDTO:
         """Creates expenses based on the extracted data.
 
+        All the expenses are written in a single batch once every type is known. Expenses
+        that were already imported are skipped.
+
         Args:
             expenses: The list of expenses to be created.
+            project_installments: Whether the remaining installments of each installment
+                expense should be created too.
+            options: Optional import options whose classification rules and default type
+                are applied before prompting for the type of a non-installment expense.
+
+        Returns:
+            CreateExpensesUseCaseResponseDTO: The number of inserted and skipped expenses.
         """
-        for expense in expenses:
-            expense_type = ExpenseType.INSTALLMENT
-            if expense.installment_of is None:
-                print(f"Expense Name: {expense.name} that cost [bold red]{expense.amount}[/bold red].")
-                expense_type = self.get_expense_type()
-    
-            data = CreateExpenseUseCaseRequestDTO(name=expense.name,
-                                                  purchased_at=expense.purchased_at,
-                                                  amount=float(expense.amount),
-                                                  installment_of=expense.installment_of,
-                                                  installment_to=expense.installment_to,
-                                                  type=expense_type)
+        options = options if options is not None else ImportOptions()
+        expenses_data = self.classify_expenses(expenses=expenses, 
+                                               classifier=self.get_classifier(options=options), 
+                                               options=options)
             
-            self._create_expense_use_case.execute(data=DTO(data=data))
+        return self._create_expenses_use_case.execute(data=DTO(data=CreateExpensesUseCaseRequestDTO(expenses=expenses_data,
+                                                                                                      project_installments=project_installments)))
+
+    def create_statements(self,
+                          statements: List[ExtractedStatement],
+                          hashes: Dict[str, str],
+                          project_installments: bool = False,
+                          options: Union[ImportOptions, None] = None) -> CreateExpensesUseCaseResponseDTO:
+        """Creates the expenses of many statements, recording each statement in the ledger.
+
+        Each statement is written in its own batch, along with its ledger entry when its
+        content hash is known, so an expense repeated by another statement is skipped as
+        the same purchase. Statements without expenses are not recorded, since they may have
+        been read with the wrong layout, so the next import scans them again.
+
+        Args:
+            statements: The successfully extracted statements, in path order.
+            hashes: A dictionary mapping paths to their content hashes.
+            project_installments: Whether the remaining installments of each installment
+                expense should be created too.
+            options: Optional import options whose classification rules and default type
+                are applied before prompting for the type of a non-installment expense.
+
+        Returns:
+            CreateExpensesUseCaseResponseDTO: The number of inserted and skipped expenses of every statement.
+        """
+        options = options if options is not None else ImportOptions()
+        classifier = self.get_classifier(options=options)
+
+        response = CreateExpensesUseCaseResponseDTO(ids=[], created=True)
+        for statement in statements:
+            content_hash = hashes.get(statement.path)
+            if not statement.expenses:
+                continue
+
+            ledger_entry = ImportedStatementDTO(hash=content_hash,
+                                                bank=statement.detected or 'unknown',
+                                                page_count=statement.page_count) if content_hash is not None else None
+            expenses_data = self.classify_expenses(expenses=statement.expenses, classifier=classifier, options=options)
+            created = self._create_expenses_use_case.execute(
+                data=DTO(data=CreateExpensesUseCaseRequestDTO(expenses=expenses_data,
+                                                              project_installments=project_installments,
+                                                              statement=ledger_entry)))
+            response.ids.extend(created.ids)
+            response.inserted += created.inserted
+            response.skipped += created.skipped
+
+        return response
         
-    def run(self) -> None:
+    def import_statements(self,
+                          provider: Union[IExtractExpensesFromPDF, None],
+                          paths: List[str],
+                          options: ImportOptions,
+                          hashes: Union[Dict[str, str], None] = None) -> ImportStatementsUseCaseResponseDTO:
+        """Extracts, classifies and writes many statements as a pipeline, reporting the ones that failed.
+
+        Each statement is written as soon as it is classified, in its own transaction.
+
+        Args:
+            provider: The extractor to run against each statement, or None to detect it for each statement.
+            paths: The statement file paths to be imported.
+            options: The import options. Their default type must be set, so no expense is prompted for.
+            hashes: An optional dictionary mapping paths to their content hashes. These statements are
+                recorded in the ledger, so later imports skip them.
+
+        Returns:
+            ImportStatementsUseCaseResponseDTO: The outcome of every statement, in path order.
+
+        Raises:
+            Exception: If no use case for importing many statements was provided.
+        """
+        if self._import_statements_use_case is None:
+            raise Exception('Importing many bank bills as a pipeline is not available.')
+
+        classifier = self.get_classifier(options=options)
+
+        self._console.print(f"[bold yellow]Processing {len(paths)} bank bills.[/bold yellow]")
+        response = self._import_statements_use_case.execute(
+            data=DTO(data=ImportStatementsUseCaseRequestDTO(paths=paths,
+                                                            classify=lambda expense: self.get_expense_type(expense=expense,
+                                                                                                           classifier=classifier,
+                                                                                                           default_type=options.default_type),
+                                                            extractor=provider,
+                                                            candidates=dict(self.__extractors),
+                                                            project_installments=options.project_installments,
+                                                            hashes=hashes or {},
+                                                            bank=None if provider is None else options.provider.lower())))
+
+        for failure in response.failures:
+            self._console.print(f"[bold red]Could not import {failure.path}. {failure.error}[/bold red]")
+
+        return response
+
+    def find_imported_statements(self, 
+                                 paths: List[str], 
+                                 force: bool = False) -> FindImportedStatementsUseCaseResponseDTO:
+        """Skips the statements that were already imported, reporting how many.
+
+        Only the file contents are hashed, so the skipped statements are never opened as PDFs.
+
+        Args:
+            paths: The statement file paths to be imported.
+            force: Whether the statements already in the ledger should be scanned again.
+
+        Returns:
+            FindImportedStatementsUseCaseResponseDTO: The pending paths with their hashes and the
+                already imported ones. Every path is pending when the ledger is not available.
+        """
+        if self._find_imported_statements_use_case is None:
+            return FindImportedStatementsUseCaseResponseDTO(pending=list(paths))
+
+        found = self._find_imported_statements_use_case.execute(
+            data=DTO(data=FindImportedStatementsUseCaseRequestDTO(paths=paths, force=force)))
+        if found.imported:
+            self._console.print(f"[bold yellow]Skipping {len(found.imported)} bank bills that were already imported.[/bold yellow]")
+        return found
+
+    def run_headless(self, options: ImportOptions) -> None:
+        """Imports expenses without prompting, printing a summary of the import.
+
+        Every path is extracted through the batch use case, so a statement that fails is
+        reported without stopping the others. Statements recorded in the ledger are skipped
+        before being opened. Without `yes` nothing is written. With it, statements are written
+        and recorded as they are extracted when the pipeline use case is available, and Ctrl-C
+        keeps the statements already written.
+
+        Args:
+            options: The import options.
+
+        Raises:
+            typer.Exit: With code 1 if any statement could not be imported, or 130 if the
+                import was cancelled.
+        """
+        if options.default_type is None:
+            raise typer.BadParameter('A headless import needs --default-type fixed or variable.')
+
+        provider = self.get_extractor_by_name(options.provider)
+        all_paths = list(dict.fromkeys(path for target in options.paths for path in Path.expand(target)))
+        found = self.find_imported_statements(paths=all_paths, force=options.force)
+        paths = found.pending
+
+        summary: Dict[str, Any] = {
+            'files': len(all_paths),
+            'already_imported': len(found.imported),
+            'imported_files': 0,
+            'failures': [],
+            'extracted': 0,
+            'inserted': 0,
+            'skipped': 0,
+            'dry_run': not options.yes
+        }
+
+        cancelled = False
+        if options.yes and self._import_statements_use_case is not None:
+            imported = self.import_statements(provider=provider, paths=paths, options=options, hashes=found.hashes)
+            failures = imported.failures
+            cancelled = imported.cancelled
+            summary['imported_files'] = len(imported.statements) - len(failures)
+            summary['extracted'] = imported.extracted
+            summary['inserted'] = imported.inserted
+            summary['skipped'] = imported.skipped
+        else:
+            response = self.extract_statements(provider=provider, paths=paths)
+            expenses = response.expenses
+            failures = response.failures
+            summary['imported_files'] = len(paths) - len(failures)
+            summary['extracted'] = len(expenses)
+
+            if options.yes and expenses:
+                created = self.create_expenses(expenses=expenses,
+                                               project_installments=options.project_installments,
+                                               options=options)
+                summary['inserted'] = created.inserted
+                summary['skipped'] = created.skipped
+
+        summary['failures'] = [{'path': failure.path, 'error': failure.error} for failure in failures]
+        if cancelled:
+            summary['cancelled'] = True
+
+        if options.json:
+            typer.echo(json.dumps(summary))
+        else:
+            action = 'Would import' if summary['dry_run'] else 'Imported'
+            self._console.print(f"[bold green]{action} {summary['extracted']} expenses from "
+                                f"{summary['imported_files']} of {summary['files']} bank bills. "
+                                f"{summary['inserted']} inserted, {summary['skipped']} already existed, "
+                                f"{summary['already_imported']} bank bills were already imported.[/bold green]")
+
+        if cancelled:
+            self._console.print('[bold red]The import was cancelled.[/bold red]')
+            raise typer.Exit(code=130)
+
+        if failures:
+            raise typer.Exit(code=1)
+
+    def run(self,
+            paths: Union[List[str], None] = typer.Option(None, '--path', '-p', 
+                                                         help='Bank bill file, directory or glob pattern. Repeat it to import many. Enables the headless mode.'),
+            provider: Union[str, None] = typer.Option(None, help='Bank and format of the statements: auto, nubank, c6, nubank-csv, nubank-ofx, c6-csv or c6-ofx.'),
+            yes: Union[bool, None] = typer.Option(None, '--yes', '-y', help='Write the expenses without confirmation.'),
+            default_type: Union[str, None] = typer.Option(None, help='Type of non-installment expenses: fixed or variable.'),
+            project_installments: Union[bool, None] = typer.Option(None, '--project-installments/--no-project-installments', 
+                                                                   help='Also create the remaining installments.'),
+            config: Union[str, None] = typer.Option(None, help='JSON file with the import options and classification rules.'),
+            json_summary: Union[bool, None] = typer.Option(None, '--json', help='Print the summary as JSON.'),
+            force: bool = typer.Option(False, '--force', help='Scan again the bank bills that were already imported.')) -> None:
         """Executes the command to import and create expenses.
 
-        This method runs the command-line interface for importing and creating expenses.
+        Without paths this method runs the interactive interface. Otherwise the import runs
+        headless. The command options override the config file. Either way, statements in the
+        ledger are skipped unless --force is given, and the imported ones are recorded in it.
         """
-        provider = self.get_extractor_from_client()
-        expenses: List[MonetaryValues] = []
+        try:
+            options = ImportOptions.load(config_path=config)
+            if paths:
+                options.paths = list(paths)
+            if provider is not None:
+                options.provider = provider
+            if yes is not None:
+                options.yes = yes
+            if default_type is not None:
+                options.default_type = ImportOptions.parse_type(default_type)
+            if project_installments is not None:
+                options.project_installments = project_installments
+            if json_summary is not None:
+                options.json = json_summary
+            options.force = force
+        except Exception as err:
+            raise typer.BadParameter(str(err))
+
+        if options.json:
+            self._console = console.Console(stderr=True)
+
+        if options.paths:
+            return self.run_headless(options=options)
+
+        provider_extractor = self.get_extractor_from_client()
+        provider_name = self.get_extractor_name(provider_extractor) if provider_extractor is not None else None
+        statements: List[ExtractedStatement] = []
 
         while True:
             try:
-                with open(self.get_file_path_from_client(), 'rb') as pdf:
-                    extracted_expenses = provider.execute(data=DTO(data=ExtractExpensesFromPDFUseCaseRequestDTO(pdf_buffer=pdf)))
-                    expenses.extend(extracted_expenses.expenses)
-                    pdf.close()
+                file_path = self.get_file_path_from_client()
+                if Path.is_pattern(file_path):
+                    paths = Path.expand(file_path)
+                    if not paths:
+                        logging.error('The provided directory or pattern does not match any bank bill.')
+                        continue
+                    found = self.find_imported_statements(paths=paths, force=options.force)
+                    if found.pending:
+                        response = self.extract_statements(provider=provider_extractor, paths=found.pending)
+                        statements.extend(ExtractedStatement(path=statement.path,
+                                                             expenses=statement.expenses,
+                                                             detected=statement.detected or provider_name,
+                                                             page_count=statement.page_count)
+                                          for statement in response.statements if statement.error is None)
+                    break
+
+                found = self.find_imported_statements(paths=[file_path], force=options.force)
+                if found.imported:
+                    break
+
+                with MappedFile.open(file_path) as pdf:
+                    extractor = provider_extractor if provider_extractor is not None else self.detect_extractor(pdf)
+                    extracted_expenses = extractor.execute(data=DTO(data=ExtractExpensesFromPDFUseCaseRequestDTO(source=pdf,
+                                                                                                                 count_pages=True)))
+                statements.append(ExtractedStatement(path=file_path,
+                                                     expenses=extracted_expenses.expenses,
+                                                     detected=self.get_extractor_name(extractor),
+                                                     page_count=extracted_expenses.page_count))
                 break
             except FileNotFoundError:
                 logging.error('Was not possible to find the bank bill file by the provided file path.')
@@ -210,14 +917,18 @@ class ImportExpenses(ICommand):
                 logging.error('The provided file path heads to a directory.')
             except Exception as err:
                 logging.error(f'Could not open the provided file. {err}')
-# 
-        confirmed = self.get_import_confirmation_from_client(expenses=expenses)
 
-        if confirmed:
-            self.create_expenses(expenses=expenses)
-        
-        print('[bold green]Expenses Created Successfully![/bold green]')
-        
+        if not statements:
+            return
 
-    
-        
\ No newline at end of file
+        expenses = [expense for statement in statements for expense in statement.expenses]
+        confirmed = options.yes or self.get_import_confirmation_from_client(expenses=expenses)
+
+        if confirmed:
+            project = options.project_installments or self.get_installments_projection_from_client(expenses=expenses)
+            created = self.create_statements(statements=statements,
+                                             hashes=found.hashes,
+                                             project_installments=project,
+                                             options=options)
+            self._console.print(f'[bold green]Expenses Created Successfully! {created.inserted} imported, '
+                                f'{created.skipped} already existed.[/bold green]')
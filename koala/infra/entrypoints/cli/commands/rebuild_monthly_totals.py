@@ -0,0 +1,31 @@
+# third-party
+from rich import print
+
+# use-cases
+from koala.application.use_cases.rebuild_monthly_totals import RebuildMonthlyTotalsUseCaseResponseDTO
+
+# interfaces
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.command import ICommand
+
+
+class RebuildMonthlyTotals(ICommand):
+    """Command class for rebuilding the monthly totals.
+
+    Attributes:
+        _rebuild_monthly_totals_use_case: A use case for rebuilding the monthly totals.
+    """
+
+    def __init__(self, 
+                 rebuild_monthly_totals_use_case: IUseCase[None, RebuildMonthlyTotalsUseCaseResponseDTO]) -> None:
+        """Initializes the RebuildMonthlyTotals class.
+
+        Args:
+            rebuild_monthly_totals_use_case: A use case for rebuilding the monthly totals.
+        """
+        self._rebuild_monthly_totals_use_case = rebuild_monthly_totals_use_case
+
+    def run(self) -> None:
+        """Executes the command to recompute the monthly totals from the stored expenses."""
+        response = self._rebuild_monthly_totals_use_case.execute(DTO(data=None))
+        print(f'[bold green]Rebuilt {response.rows} monthly totals successfully![/bold green]')
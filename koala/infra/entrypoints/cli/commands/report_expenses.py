@@ -0,0 +1,89 @@
+# built-in
+from typing import Union
+
+# third-party
+import typer
+from rich import print, console, table
+
+# entities
+from koala.domain.entities.expense import ExpenseType
+
+# use-cases
+from koala.application.use_cases.report_expenses import (ReportExpensesUseCase,
+                                                         ReportExpensesUseCaseRequestDTO, 
+                                                         ReportExpensesUseCaseResponseDTO)
+
+# interfaces
+from koala.application.core.interfaces.use_case import DTO, IUseCase
+from koala.infra.core.interfaces.command import ICommand
+
+
+class ReportExpenses(ICommand):
+    """Command class for reporting expenses.
+
+    This class is responsible for handling the command-line interface for reporting the
+    stored expenses per month and type.
+
+    Attributes:
+        _report_expenses_use_case: A use case for reporting expenses.
+    """
+
+    def __init__(self, 
+                 report_expenses_use_case: IUseCase[ReportExpensesUseCaseRequestDTO, 
+                                                    ReportExpensesUseCaseResponseDTO]) -> None:
+        """Initializes the ReportExpenses class.
+
+        Args:
+            report_expenses_use_case: A use case for reporting expenses.
+        """
+        self._report_expenses_use_case = report_expenses_use_case
+
+    def run(self,
+            start: Union[str, None] = typer.Option(None, help='First purchase date included (YYYY-MM-DD).'),
+            end: Union[str, None] = typer.Option(None, help='Last purchase date included (YYYY-MM-DD).'),
+            type: Union[str, None] = typer.Option(None, help='Expense type: fixed, variable or installment.'),
+            name: Union[str, None] = typer.Option(None, help='Only expenses whose name starts with this prefix.'),
+            installments: Union[int, None] = typer.Option(None, help='Only installment plans with this many installments.'),
+            detailed: bool = typer.Option(False, help='Also list every matching expense.')) -> None:
+        """Executes the command to report expenses.
+
+        The monthly totals are aggregated by the database, and the detailed listing is printed
+        while it is streamed, so the output starts before the query finishes.
+        """
+        try:
+            expense_type = ExpenseType(type.lower()) if type else None
+        except ValueError:
+            raise typer.BadParameter(f'Invalid expense type "{type}".')
+
+        try:
+            start_date = ReportExpensesUseCase.parse_date(start)
+        except ValueError:
+            raise typer.BadParameter(f'Invalid date "{start}", expected YYYY-MM-DD.', param_hint='--start')
+
+        try:
+            end_date = ReportExpensesUseCase.parse_date(end, end_of_day=True)
+        except ValueError:
+            raise typer.BadParameter(f'Invalid date "{end}", expected YYYY-MM-DD.', param_hint='--end')
+
+        response = self._report_expenses_use_case.execute(DTO(data=ReportExpensesUseCaseRequestDTO(start=start_date,
+                                                                                                    end=end_date,
+                                                                                                    type=expense_type,
+                                                                                                    name_prefix=name,
+                                                                                                    installment_to=installments,
+                                                                                                    detailed=detailed)))
+
+        output = console.Console()
+        if response.expenses is not None:
+            for expense in response.expenses:
+                installment = f' ({expense.installment_of}/{expense.installment_to})' if expense.installment_of else ''
+                output.print(f'{expense.purchased_at:%d/%m/%Y}  {expense.type.value:<11}  '
+                             f'{expense.amount:>10.2f}  {expense.name}{installment}', highlight=False)
+
+        output_table = table.Table("Month", "Type", "Count", "Total")
+        grand_total = 0.0
+        for total in response.totals:
+            grand_total += total.total
+            output_table.add_row(total.month, total.type.value, str(total.count), f'{total.total:.2f}')
+
+        output.print(output_table)
+        print(f'[bold green]Total: {grand_total:.2f}[/bold green]')
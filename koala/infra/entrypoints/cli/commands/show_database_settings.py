@@ -0,0 +1,41 @@
+# built-in
+from typing import TYPE_CHECKING
+
+# third-party
+from rich import print, console, table
+
+# adapters
+if TYPE_CHECKING:
+    from koala.infra.adapters.database.sqlite import SQLite
+
+# interfaces
+from koala.infra.core.interfaces.command import ICommand
+
+
+class ShowDatabaseSettings(ICommand):
+    """Command class for showing the active database settings.
+
+    This class is responsible for printing the performance profile in use, the schema
+    version and the pragmas that are actually active on a database connection.
+
+    Attributes:
+        _database: The SQLite database to be inspected.
+    """
+    def __init__(self, database: 'SQLite') -> None:
+        """Initializes the ShowDatabaseSettings class.
+
+        Args:
+            database: The SQLite database to be inspected.
+        """
+        self._database = database
+
+    def run(self) -> None:
+        """Executes the command to print the active database settings."""
+        print(f'[bold yellow]SQLite performance profile: {self._database.profile}[/bold yellow]')
+        print(f'[bold yellow]Schema version: {self._database.get_schema_version()}[/bold yellow]')
+
+        output_table = table.Table("Pragma", "Value")
+        for pragma, value in self._database.get_pragmas().items():
+            output_table.add_row(pragma, str(value))
+
+        console.Console().print(output_table)
@@ -1,83 +1,309 @@
 # built-in
-from typing import Union
+import inspect
+import os
+from typing import TYPE_CHECKING, Any, Callable, Type, Union
 
 # third-party
 import typer
 
 # use-cases
-from koala.application.use_cases.create_expense import CreateExpenseUseCase
+from koala.application.use_cases.build_expense_classifier import BuildExpenseClassifierUseCase
+from koala.application.use_cases.create_expense import CreateExpensesUseCase
+from koala.application.use_cases.export_expenses import ExportExpensesUseCase
 from koala.application.use_cases.import_expenses_from_pdf import ExtractExpensesFromPDFUseCase
-
-# parsers
-from koala.application.parsers.pdf.c6 import C6Parser
-from koala.application.parsers.pdf.nubank import NubankParser
+from koala.application.use_cases.extract_expenses_from_pdfs import ExtractExpensesFromPDFsUseCase
+from koala.application.use_cases.find_imported_statements import FindImportedStatementsUseCase
+from koala.application.use_cases.import_statements import ImportStatementsUseCase
+from koala.application.use_cases.rebuild_monthly_totals import RebuildMonthlyTotalsUseCase
+from koala.application.use_cases.report_expenses import ReportExpensesUseCase
 
 # interfaces
 from koala.infra.core.interfaces.command import ICommand
-
-# adapters
-from koala.infra.adapters.database.sqlite import SQLite
-from koala.infra.adapters.database.sqlite.models.base import Base
-from koala.infra.adapters.repositories.expenses import ExpensesRepository
+from koala.infra.core.interfaces.expense_repository import IExpensesRepository
 from koala.infra.core.utils.path import Path
+from koala.infra.core.utils.profiler import Profiler
 
 # commands
 from koala.infra.entrypoints.cli.commands.create_expense import CreateExpenseCommand
+from koala.infra.entrypoints.cli.commands.export_expenses import ExportExpenses
 from koala.infra.entrypoints.cli.commands.import_expenses_by_pdf import ImportExpenses
+from koala.infra.entrypoints.cli.commands.rebuild_monthly_totals import RebuildMonthlyTotals
+from koala.infra.entrypoints.cli.commands.report_expenses import ReportExpenses
+from koala.infra.entrypoints.cli.commands.show_database_settings import ShowDatabaseSettings
+
+# adapters
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+    from koala.infra.adapters.database.sqlite import SQLite
+
+# The database opened by the first command that needs it. SQLAlchemy, the models and the
+# schema checks are only loaded then, so `--help` never pays for them.
+_database: Union['SQLite', None] = None
+
+def init_database() -> 'SQLite':
+    """Initialize the SQLite database and bring its schema to the latest version.
+
+    The performance profile is read from the KOALA_SQLITE_PROFILE environment variable. A
+    database that is already up to date only has its schema version read.
 
-def init_database() -> SQLite:
-    """Initialize the SQLite database and create all necessary tables.
-    
     Returns:
         SQLite: An instance of the SQLite database.
     """
+    from koala.infra.adapters.database.sqlite import SQLite
 
     connection_string = f"sqlite:///{Path.join(__file__, '../../adapters/database/sqlite/koala.sqlite')}"
-    database = SQLite(connection_str=connection_string)
-    Base.metadata.create_all(database._engine)
+    database = SQLite(connection_str=connection_string,
+                      profile=os.environ.get('KOALA_SQLITE_PROFILE', 'balanced'))
+    database.migrate()
+
     return database
 
-def register_command(name: str, command: ICommand, cli: typer.Typer, ) -> None:
-    """Register a command to the CLI.
-    
+def get_database() -> 'SQLite':
+    """Open the database on first use.
+
+    Returns:
+        SQLite: The connected SQLite database.
+
+    Raises:
+        Exception: If no valid database session could be opened.
+    """
+    global _database
+    if _database is None:
+        database = init_database()
+        database.connect()
+        if database._session is None:
+            raise Exception('Could not open a valid database session.')
+        _database = database
+
+    return _database
+
+def close_database() -> None:
+    """Close the database if any command opened it."""
+    global _database
+    if _database is not None:
+        _database.disconnect()
+        _database = None
+
+# The cProfile profiler and its output file while `--profile-output` is given.
+_profile: Union['Profile', None] = None
+_profile_output: Union[str, None] = None
+
+def start_profiling(output: Union[str, None] = None) -> None:
+    """Start recording the stage timings and, optionally, a cProfile of the command.
+
+    Args:
+        output: An optional file path the cProfile stats are dumped to.
+    """
+    global _profile, _profile_output
+    Profiler.enable()
+    if output is not None:
+        import cProfile
+
+        _profile, _profile_output = cProfile.Profile(), output
+        _profile.enable()
+
+def stop_profiling() -> None:
+    """Print the per-stage breakdown to stderr and dump the cProfile stats, if profiling."""
+    global _profile, _profile_output
+    if not Profiler.enabled:
+        return
+
+    Profiler.disable()
+    wall = Profiler.elapsed()
+
+    from rich import console, table
+
+    output_table = table.Table("Stage", "Calls", "Total (s)", "Mean (ms)", "Share")
+    for stats in Profiler.stats():
+        output_table.add_row(stats.name,
+                             str(stats.calls),
+                             f'{stats.total:.3f}',
+                             f'{stats.total / stats.calls * 1000:.2f}',
+                             f'{stats.total / wall:.1%}' if wall else '-')
+
+    output = console.Console(stderr=True)
+    output.print(output_table)
+    output.print(f'Wall time: {wall:.3f}s. Nested stages are included in the stages around them.', highlight=False)
+
+    if _profile is not None and _profile_output is not None:
+        _profile.disable()
+        _profile.dump_stats(_profile_output)
+        output.print(f'cProfile stats written to {_profile_output}. Inspect them with `python -m pstats {_profile_output}`.', 
+                     highlight=False)
+        _profile, _profile_output = None, None
+
+def get_expenses_repository() -> IExpensesRepository:
+    """Build the expenses repository over the database session.
+
+    Returns:
+        IExpensesRepository: The expenses repository.
+    """
+    from koala.infra.adapters.repositories.expenses import ExpensesRepository
+
+    return ExpensesRepository(session=get_database()._session)
+
+def register_lazy_command(name: str,
+                          command_class: Type[ICommand],
+                          factory: Callable[[], ICommand],
+                          cli: typer.Typer) -> None:
+    """Register a command that is only built when it is invoked.
+
+    The options of the command are read from the signature of `command_class.run`, so
+    parsing argv and printing the help never call the factory nor import what it needs.
+
     Args:
         name: The name of the command.
-        command: The command instance.
+        command_class: The command class, whose run method declares the options.
+        factory: A callable building the command instance.
         cli: The Typer CLI instance.
-        
+
     Returns:
         None: None if successful, raises an Exception otherwise.
     """
-    if isinstance(command, ICommand):
-        cli.command(name=name)(command.run)
-        return
-    
-    raise Exception(f'You can only register instances of {ICommand}.')
+    if not (inspect.isclass(command_class) and issubclass(command_class, ICommand)):
+        raise Exception(f'You can only register subclasses of {ICommand}.')
 
+    def run(*args: Any, **kwargs: Any) -> None:
+        return factory().run(*args, **kwargs)
+
+    signature = inspect.signature(command_class.run)
+    setattr(run, '__signature__', signature.replace(parameters=list(signature.parameters.values())[1:]))
+    run.__doc__ = command_class.run.__doc__
+    cli.command(name=name)(run)
+
+def create_expense_command() -> ICommand:
+    """Build the create-expense command.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    return CreateExpenseCommand(create_expenses_use_case=CreateExpensesUseCase(expenses_repository=get_expenses_repository()))
+
+def import_expenses_command() -> ICommand:
+    """Build the import-expenses command with every available extractor.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    from koala.application.parsers.csv.c6 import C6CsvParser
+    from koala.application.parsers.csv.nubank import NubankCsvParser
+    from koala.application.parsers.ofx.c6 import C6OfxParser
+    from koala.application.parsers.ofx.nubank import NubankOfxParser
+    from koala.application.parsers.pdf.c6 import C6Parser
+    from koala.application.parsers.pdf.nubank import NubankParser
+    from koala.infra.adapters.cache.page_text import DiskPageTextCache
+
+    expenses_repository = get_expenses_repository()
+    page_cache = DiskPageTextCache(directory=Path.join(__file__, '../../adapters/cache/pages'))
+
+    import_expenses = ImportExpenses(create_expenses_use_case=CreateExpensesUseCase(expenses_repository=expenses_repository),
+                                     extract_expenses_from_pdfs_use_case=ExtractExpensesFromPDFsUseCase(),
+                                     build_expense_classifier_use_case=BuildExpenseClassifierUseCase(expenses_repository=expenses_repository),
+                                     import_statements_use_case=ImportStatementsUseCase(create_expenses_use_case=CreateExpensesUseCase(expenses_repository=expenses_repository)),
+                                     find_imported_statements_use_case=FindImportedStatementsUseCase(expenses_repository=expenses_repository))
+    import_expenses.add_extractor(name='nubank',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=NubankParser(page_cache=page_cache)))
+    import_expenses.add_extractor(name='c6',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=C6Parser(page_cache=page_cache)))
+    import_expenses.add_extractor(name='nubank-csv',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=NubankCsvParser()))
+    import_expenses.add_extractor(name='nubank-ofx',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=NubankOfxParser()))
+    import_expenses.add_extractor(name='c6-csv',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=C6CsvParser()))
+    import_expenses.add_extractor(name='c6-ofx',
+                                  extractor=ExtractExpensesFromPDFUseCase(pdf_parser=C6OfxParser()))
+    return import_expenses
+
+def report_command() -> ICommand:
+    """Build the report command.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    return ReportExpenses(report_expenses_use_case=ReportExpensesUseCase(expenses_repository=get_expenses_repository()))
+
+def export_command() -> ICommand:
+    """Build the export command with every available format.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    from koala.infra.adapters.exporters.expenses import (CsvExpenseExporter,
+                                                         JsonLinesExpenseExporter,
+                                                         ParquetExpenseExporter)
+
+    export_expenses = ExportExpenses(export_expenses_use_case=ExportExpensesUseCase(expenses_repository=get_expenses_repository()))
+    export_expenses.add_exporter(name='csv', exporter=CsvExpenseExporter)
+    export_expenses.add_exporter(name='jsonl', exporter=JsonLinesExpenseExporter)
+    export_expenses.add_exporter(name='parquet', exporter=ParquetExpenseExporter)
+    return export_expenses
+
+def rebuild_totals_command() -> ICommand:
+    """Build the rebuild-totals command.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    return RebuildMonthlyTotals(rebuild_monthly_totals_use_case=RebuildMonthlyTotalsUseCase(expenses_repository=get_expenses_repository()))
+
+def database_settings_command() -> ICommand:
+    """Build the database-settings command.
+
+    Returns:
+        ICommand: The command instance.
+    """
+    return ShowDatabaseSettings(database=get_database())
 
 def create_cli() -> None:
-    """Main function to create the Command Line Interface (CLI)."""
+    """Main function to create the Command Line Interface (CLI).
+
+    Commands are registered lazily: the database is only opened, and the parsers and
+    SQLAlchemy only imported, once a command that needs them runs.
+    """
 
     cli = typer.Typer()
-    with init_database() as database:
-        if database._session is None:
-            raise Exception('Could not open a valid database session.')
-        
-        expenses_repository = ExpensesRepository(session=database._session)
-        create_expense_use_case = CreateExpenseUseCase(expenses_repository=expenses_repository)
-
-        register_command(name='create-expense', 
-                         command=CreateExpenseCommand(create_expense_use_case=create_expense_use_case), 
-                         cli=cli)
-
-        import_expenses = ImportExpenses(create_expense_use_case=create_expense_use_case)
-        import_expenses.add_extractor(name='nubank',
-                                      extractor=ExtractExpensesFromPDFUseCase(pdf_parser=NubankParser()))
-        import_expenses.add_extractor(name='c6',
-                                      extractor=ExtractExpensesFromPDFUseCase(pdf_parser=C6Parser()))
-
-        register_command(name='import-expenses', 
-                         command=import_expenses, 
-                         cli=cli)
-        
-        cli()
\ No newline at end of file
+
+    @cli.callback()
+    def main(profile: bool = typer.Option(False, '--profile', help='Print how long each stage of the command took.'),
+             profile_output: Union[str, None] = typer.Option(None, help='Also dump cProfile stats to this file. Implies --profile.')) -> None:
+        """Koala, a manager for your expenses."""
+        if profile or profile_output:
+            start_profiling(output=profile_output)
+
+    register_lazy_command(name='create-expense',
+                          command_class=CreateExpenseCommand,
+                          factory=create_expense_command,
+                          cli=cli)
+
+    register_lazy_command(name='import-expenses',
+                          command_class=ImportExpenses,
+                          factory=import_expenses_command,
+                          cli=cli)
+
+    register_lazy_command(name='report',
+                          command_class=ReportExpenses,
+                          factory=report_command,
+                          cli=cli)
+
+    register_lazy_command(name='export',
+                          command_class=ExportExpenses,
+                          factory=export_command,
+                          cli=cli)
+
+    register_lazy_command(name='rebuild-totals',
+                          command_class=RebuildMonthlyTotals,
+                          factory=rebuild_totals_command,
+                          cli=cli)
+
+    register_lazy_command(name='database-settings',
+                          command_class=ShowDatabaseSettings,
+                          factory=database_settings_command,
+                          cli=cli)
+
+    try:
+        cli()
+    finally:
+        stop_profiling()
+        close_database()